@@ -57,7 +57,21 @@ print("=" * 60)
 
 # Load our signals
 signals_path = "/Volumes/SSD/DEV_SSD/MY/neon_alpha/data/double_ensemble_signals.csv"
-signals = pd.read_csv(signals_path)
+
+# sidecar 인덱스(<csv>.idx, train_double_ensemble.py가 생성)가 있으면 최신 날짜 구간만 seek 해서 읽는다.
+# 인덱스는 여기서 만들지 않으며, 없거나 맞지 않으면 전체 읽기로 fallback
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "src"))
+from neon_alpha.signal_io import load_signal_index, read_indexed_csv  # noqa: E402
+
+signals = None
+try:
+    signal_index = load_signal_index(signals_path)
+    if signal_index is not None and signal_index.last_day is not None:
+        signals = read_indexed_csv(signals_path, start=signal_index.last_day, index=signal_index)
+except (OSError, ValueError):
+    signals = None
+if signals is None or signals.empty:
+    signals = pd.read_csv(signals_path)
 signals['date'] = pd.to_datetime(signals['date'])
 
 # Get latest signals
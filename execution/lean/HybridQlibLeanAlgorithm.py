@@ -4,12 +4,24 @@ from AlgorithmImports import *
 import csv
 from datetime import datetime
 from pathlib import Path
+import struct
+
+import numpy as np
+
+
+# neon_alpha.signal_io.BinarySignalFile와 같은 레이아웃(.nsig). LEAN 환경에는 패키지가 없으므로 여기서 직접 읽는다.
+BINARY_MAGIC = b"NSIG"
+BINARY_HEADER = struct.Struct("<4sHBBIIQQQQQ")
+BINARY_HEADER_SIZE = 64
 
 
 class HybridQlibLeanAlgorithm(QCAlgorithm):
     """
     Qlib-generated daily signals -> LEAN execution bridge.
     Signal CSV format: date,symbol,score
+    `.nsig` 바이너리 신호 파일은 memmap으로 열고, 리밸런싱 시점의 하루치만 읽는다.
+    target_schedule(neon_alpha schedule 출력: date,symbol,weight)을 주면 선택은 하지 않고
+    그날 목표 비중을 사전에서 바로 찾아 주문만 낸다. 빈 symbol 행은 전량 현금이다.
     """
 
     def initialize(self) -> None:
@@ -26,8 +38,19 @@ class HybridQlibLeanAlgorithm(QCAlgorithm):
         self.max_weight_per_symbol = float(self.get_parameter("max_weight_per_symbol") or 0.5)
         self.max_daily_turnover = float(self.get_parameter("max_daily_turnover") or 1.0)
         self.signal_csv = self.get_parameter("signal_csv") or "data/signals.csv"
-
-        self.signal_by_day = self._load_signals(self.signal_csv)
+        self.target_schedule_csv = self.get_parameter("target_schedule") or ""
+
+        self.target_schedule: dict[str, dict[str, float]] | None = None
+        if self.target_schedule_csv:
+            self.target_schedule = self._load_target_schedule(self.target_schedule_csv)
+
+        self.signal_by_day: dict[str, dict[str, float]] = {}
+        self.binary_signals = None
+        if self.target_schedule is None:
+            if Path(self.signal_csv).suffix.lower() == ".nsig":
+                self.binary_signals = self._open_binary_signals(self.signal_csv)
+            else:
+                self.signal_by_day = self._load_signals(self.signal_csv)
         self.current_holdings: set[str] = set()
 
         benchmark = self.add_equity("SPY", Resolution.DAILY).symbol
@@ -39,7 +62,15 @@ class HybridQlibLeanAlgorithm(QCAlgorithm):
 
     def rebalance(self) -> None:
         day_key = self.time.strftime("%Y-%m-%d")
-        day_scores = self.signal_by_day.get(day_key)
+        if self.target_schedule is not None:
+            targets = self.target_schedule.get(day_key)
+            if targets is None:
+                self.debug(f"[{day_key}] no scheduled targets")
+                return
+            self._submit_targets(targets)
+            return
+
+        day_scores = self._day_scores(day_key)
         if not day_scores:
             self.debug(f"[{day_key}] no signal rows")
             return
@@ -67,19 +98,37 @@ class HybridQlibLeanAlgorithm(QCAlgorithm):
 
         equal_weight = 1.0 / len(selected)
         target_weight = min(equal_weight, self.max_weight_per_symbol)
+        self._submit_targets({ticker: target_weight for ticker in selected})
 
+    def _submit_targets(self, targets: dict[str, float]) -> None:
         for ticker in list(self.current_holdings):
-            if ticker not in selected and ticker in self.symbol_map:
+            if ticker not in targets and ticker in self.symbol_map:
                 self.set_holdings(self.symbol_map[ticker], 0)
                 self.current_holdings.remove(ticker)
 
-        for ticker in selected:
+        for ticker, weight in targets.items():
             symbol = self.symbol_map.get(ticker)
             if symbol is None:
                 continue
-            self.set_holdings(symbol, target_weight)
+            self.set_holdings(symbol, weight)
             self.current_holdings.add(ticker)
 
+    def _load_target_schedule(self, csv_path: str) -> dict[str, dict[str, float]]:
+        path = Path(csv_path)
+        if not path.exists():
+            self.error(f"Target schedule not found: {csv_path}")
+            return {}
+
+        schedule: dict[str, dict[str, float]] = {}
+        with path.open("r", encoding="utf-8", newline="") as file:
+            for row in csv.DictReader(file):
+                targets = schedule.setdefault(row["date"], {})
+                if row["symbol"]:
+                    targets[row["symbol"].upper()] = float(row["weight"])
+
+        self.debug(f"Loaded target schedule: {len(schedule)} days")
+        return schedule
+
     def _load_signals(self, csv_path: str) -> dict[str, dict[str, float]]:
         path = Path(csv_path)
         if not path.exists():
@@ -100,3 +149,59 @@ class HybridQlibLeanAlgorithm(QCAlgorithm):
 
         self.debug(f"Loaded signals: {sum(len(item) for item in signal_by_day.values())} rows")
         return signal_by_day
+
+    def _day_scores(self, day_key: str) -> dict[str, float] | None:
+        if self.binary_signals is None:
+            return self.signal_by_day.get(day_key)
+
+        symbols, day_ordinals, day_starts, records = self.binary_signals
+        ordinal = datetime.strptime(day_key, "%Y-%m-%d").toordinal()
+        position = int(np.searchsorted(day_ordinals, ordinal))
+        if position >= len(day_ordinals) or int(day_ordinals[position]) != ordinal:
+            return None
+        block = records[int(day_starts[position]) : int(day_starts[position + 1])]
+        return {symbols[code]: float(score) for code, score in zip(block["symbol"].tolist(), block["score"].tolist())}
+
+    def _open_binary_signals(self, signal_path: str):
+        path = Path(signal_path)
+        if not path.exists():
+            self.error(f"Signal file not found: {signal_path}")
+            return None
+
+        with path.open("rb") as file:
+            header = file.read(BINARY_HEADER_SIZE)
+            if header[:4] != BINARY_MAGIC:
+                self.error(f"Not a NeonAlpha binary signal file: {signal_path}")
+                return None
+            (
+                _,
+                _,
+                score_bytes,
+                _,
+                n_symbols,
+                n_days,
+                n_records,
+                symbols_offset,
+                symbols_nbytes,
+                days_offset,
+                records_offset,
+            ) = BINARY_HEADER.unpack(header[: BINARY_HEADER.size])
+            file.seek(symbols_offset)
+            symbols = file.read(symbols_nbytes).decode("utf-8").split("\n") if n_symbols else []
+
+        if n_records == 0:
+            self.debug("Loaded signals: 0 rows")
+            return None
+
+        record_dtype = np.dtype([("day", "<i4"), ("symbol", "<i4"), ("score", f"<f{score_bytes}")])
+        day_ordinals = np.memmap(path, dtype="<i4", mode="r", offset=days_offset, shape=(n_days,))
+        day_starts = np.memmap(
+            path,
+            dtype="<i8",
+            mode="r",
+            offset=days_offset + ((4 * n_days + 7) & ~7),
+            shape=(n_days + 1,),
+        )
+        records = np.memmap(path, dtype=record_dtype, mode="r", offset=records_offset, shape=(n_records,))
+        self.debug(f"Opened binary signals: {n_records} rows, {n_days} days")
+        return [symbol.upper() for symbol in symbols], day_ordinals, day_starts, records
@@ -26,8 +26,15 @@ Usage:
 Commands:
   sample                Copy sample signal CSV -> data/generated_signals.csv
   qlib                  Generate signals with qlib
-  validate              Validate signal CSV schema and duplicates
+  validate              Validate signal schema, duplicates, scores and date order
+  publish               Append signals to a date-partitioned signal store
+  merge                 Read many signal files in parallel and merge by (date,symbol)
   paper                 Run local paper simulation
+  sweep                 Run paper simulation over a grid of risk limits
+  robust                Bootstrap / shuffled-signal distribution of paper results
+  schedule              Export per-day target weights for the LEAN algorithm
+  metrics               Compute statistics from saved paper artifacts
+  cache                 Inspect, evict or clear the parsed price cache
   pipeline              Run event-driven pipeline (generate -> validate -> paper)
   lean                  Run LEAN backtest wrapper
   live                  Run LEAN live deploy wrapper
@@ -36,7 +43,13 @@ Commands:
 Examples:
   bash run.sh sample
   bash run.sh validate --signal-csv data/generated_signals.csv
+  bash run.sh publish --signal-csv data/generated_signals.csv --store data/signals/momentum
+  bash run.sh merge --inputs "data/*_signals.csv" --output data/merged_signals.csv
   bash run.sh paper --signal-csv data/generated_signals.csv --price-csv data/sample_prices.csv
+  bash run.sh sweep --signal-csv data/generated_signals.csv --price-csv data/sample_prices.csv --max-positions 1 3 5
+  bash run.sh robust --signal-csv data/generated_signals.csv --price-csv data/sample_prices.csv --paths 2000
+  bash run.sh metrics --artifacts data/paper_run.npz --output data/paper_monthly.csv
+  bash run.sh cache info
   bash run.sh pipeline --mode sample --price-csv data/sample_prices.csv
   bash run.sh qlib --provider-uri ~/.qlib/qlib_data/us_data --start 2022-01-01 --end 2025-12-31
   bash run.sh lean --lean-project /path/to/lean-project --signal-csv data/generated_signals.csv --long-count 3
@@ -60,9 +73,30 @@ case "$cmd" in
   validate)
     python -m neon_alpha.cli validate "$@"
     ;;
+  publish)
+    python -m neon_alpha.cli publish "$@"
+    ;;
+  merge)
+    python -m neon_alpha.cli merge "$@"
+    ;;
   paper)
     python -m neon_alpha.cli paper "$@"
     ;;
+  sweep)
+    python -m neon_alpha.cli sweep "$@"
+    ;;
+  robust)
+    python -m neon_alpha.cli robust "$@"
+    ;;
+  schedule)
+    python -m neon_alpha.cli schedule "$@"
+    ;;
+  metrics)
+    python -m neon_alpha.cli metrics "$@"
+    ;;
+  cache)
+    python -m neon_alpha.cli cache "$@"
+    ;;
   pipeline)
     python -m neon_alpha.cli pipeline "$@"
     ;;
@@ -74,6 +108,7 @@ case "$cmd" in
     MIN_SCORE="${MIN_SCORE:--1e9}"
     MAX_WEIGHT_PER_SYMBOL="${MAX_WEIGHT_PER_SYMBOL:-0.5}"
     MAX_DAILY_TURNOVER="${MAX_DAILY_TURNOVER:-1.0}"
+    TARGET_SCHEDULE="${TARGET_SCHEDULE:-}"
     EXTRA_ARGS=()
 
     while [[ $# -gt 0 ]]; do
@@ -106,6 +141,10 @@ case "$cmd" in
           MAX_DAILY_TURNOVER="$2"
           shift 2
           ;;
+        --target-schedule)
+          TARGET_SCHEDULE="$2"
+          shift 2
+          ;;
         --)
           shift
           EXTRA_ARGS+=("$@")
@@ -122,7 +161,11 @@ case "$cmd" in
       echo "[run] --lean-project is required for lean command."
       exit 1
     fi
-    if [[ ! -f "$SIGNAL_CSV" ]]; then
+    if [[ -n "$TARGET_SCHEDULE" && ! -f "$TARGET_SCHEDULE" ]]; then
+      echo "[run] target schedule not found: $TARGET_SCHEDULE"
+      exit 1
+    fi
+    if [[ -z "$TARGET_SCHEDULE" && ! -f "$SIGNAL_CSV" ]]; then
       echo "[run] signal csv not found: $SIGNAL_CSV"
       exit 1
     fi
@@ -134,7 +177,12 @@ case "$cmd" in
     mkdir -p "$LEAN_PROJECT"
     mkdir -p "$LEAN_PROJECT/data"
     cp "$ROOT_DIR/execution/lean/HybridQlibLeanAlgorithm.py" "$LEAN_PROJECT/main.py"
-    cp "$SIGNAL_CSV" "$LEAN_PROJECT/data/signals.csv"
+    if [[ -n "$TARGET_SCHEDULE" ]]; then
+      cp "$TARGET_SCHEDULE" "$LEAN_PROJECT/data/target_schedule.csv"
+      EXTRA_ARGS=(--parameter "target_schedule=$LEAN_PROJECT/data/target_schedule.csv" "${EXTRA_ARGS[@]}")
+    else
+      cp "$SIGNAL_CSV" "$LEAN_PROJECT/data/signals.csv"
+    fi
 
     lean backtest "$LEAN_PROJECT" \
       --parameter "signal_csv=$LEAN_PROJECT/data/signals.csv" \
@@ -1,15 +1,64 @@
 from __future__ import annotations
 
 import argparse
-from collections import Counter
+from dataclasses import asdict, fields
+from itertools import product
 from pathlib import Path
 import threading
 
+import pandas as pd
+
 from .event_bus import create_event_bus, stop_event_bus
 from .generator import generate_signals_with_qlib
-from .paper import load_price_csv, run_paper_simulation, save_result_csv
-from .risk import RiskLimits
-from .signal_io import SignalRow, read_signals, write_signals
+from .incremental import run_paper_simulation_incremental
+from .metrics import TRADING_DAYS_PER_YEAR, period_metrics, rolling_metrics, summarize
+from .paper import (
+    PAPER_ENGINES,
+    PaperArtifacts,
+    PaperResult,
+    PaperSimulator,
+    PriceMatrix,
+    SignalInput,
+    build_constraint_data,
+    build_paper_artifacts,
+    build_target_schedule,
+    load_constraint_csv,
+    run_paper_simulation,
+    run_paper_simulation_grid,
+    save_result_csv,
+    save_target_schedule,
+)
+from .price_cache import DEFAULT_PRICE_CACHE_MAX_BYTES, PRICE_CACHE_ENV, PriceCache, load_price_matrix
+from .risk import (
+    DEFAULT_CAPITAL,
+    DEFAULT_COVARIANCE_HALFLIFE,
+    DEFAULT_SHRINKAGE,
+    WEIGHTING_SCHEMES,
+    ConstraintData,
+    RiskLimits,
+)
+from .robust import (
+    DEFAULT_BATCH_PATHS,
+    DEFAULT_BLOCK_SIZE,
+    DEFAULT_ROBUST_PATHS,
+    ROBUST_METHODS,
+    robust_quantiles,
+    run_robustness,
+)
+from .signal_io import (
+    DEFAULT_CHUNK_ROWS,
+    SIGNAL_FORMATS,
+    expand_signal_sources,
+    format_day_ordinals,
+    iter_signal_days,
+    parse_signal_date,
+    read_signal_frame,
+    read_signal_sets,
+    read_signal_sources,
+    write_signals,
+)
+from .signal_store import PARTITION_SUFFIXES, SignalStore
+from .validation import validate_signal_file
 
 
 DEFAULT_SYMBOLS: list[str] = ["AAPL", "MSFT", "NVDA", "AMZN", "GOOGL", "META", "SPY"]
@@ -28,26 +77,191 @@ def _default_sample_csv() -> str:
     return str(PROJECT_ROOT / "data" / "sample_signals.csv")
 
 
-def _validate_rows(rows: list[SignalRow]) -> tuple[int, int]:
-    duplicate_counter = Counter((row.signal_date, row.symbol) for row in rows)
-    duplicate_count = sum(1 for value in duplicate_counter.values() if value > 1)
-    return len(rows), duplicate_count
-
-
 def _build_risk_limits(args: argparse.Namespace) -> RiskLimits:
     return RiskLimits(
         max_positions=args.max_positions,
         min_score=args.min_score,
         max_weight_per_symbol=args.max_weight_per_symbol,
         max_daily_turnover=args.max_daily_turnover,
+        weighting=args.weighting,
+        covariance_halflife=args.covariance_halflife,
+        shrinkage=args.shrinkage,
+        **_constraint_limits(args),
     )
 
 
-def _add_risk_args(parser: argparse.ArgumentParser) -> None:
+def _constraint_limits(args: argparse.Namespace) -> dict[str, float]:
+    return {
+        "max_sector_weight": args.max_sector_weight,
+        "max_adv_fraction": args.max_adv_fraction,
+        "capital": args.capital,
+        "min_symbol_beta": args.min_symbol_beta,
+        "max_symbol_beta": args.max_symbol_beta,
+        "max_portfolio_beta": args.max_portfolio_beta,
+    }
+
+
+def _load_constraints(args: argparse.Namespace, prices: PriceMatrix, limits: RiskLimits) -> ConstraintData | None:
+    if not (limits.has_constraints or args.constraints_csv or args.sector_cap):
+        return None
+    frame = load_constraint_csv(args.constraints_csv) if args.constraints_csv else None
+    return build_constraint_data(prices, frame, sector_caps=dict(args.sector_cap or []))
+
+
+def _sector_cap(value: str) -> tuple[str, float]:
+    name, separator, cap = value.rpartition("=")
+    try:
+        if not separator or not name:
+            raise ValueError(value)
+        return name, float(cap)
+    except ValueError as error:
+        raise argparse.ArgumentTypeError(f"Expected SECTOR=WEIGHT, got: {value}") from error
+
+
+def _add_constraint_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--constraints-csv", default="", help="CSV columns: symbol plus sector and/or beta")
+    parser.add_argument("--max-sector-weight", type=float, default=1.0, help="Cap on the summed weight per sector")
+    parser.add_argument(
+        "--sector-cap",
+        type=_sector_cap,
+        action="append",
+        metavar="SECTOR=WEIGHT",
+        help="Per-sector cap overriding --max-sector-weight (repeatable, e.g. --sector-cap Utilities=0.1)",
+    )
+    parser.add_argument(
+        "--max-adv-fraction",
+        type=float,
+        default=float("inf"),
+        help="Cap each position at this fraction of its 20-day average dollar volume (needs a volume column)",
+    )
+    parser.add_argument("--capital", type=float, default=DEFAULT_CAPITAL, help="Portfolio value for liquidity caps")
+    parser.add_argument(
+        "--min-symbol-beta", type=float, default=float("-inf"), help="Exclude symbols with a lower beta"
+    )
+    parser.add_argument(
+        "--max-symbol-beta", type=float, default=float("inf"), help="Exclude symbols with a higher beta"
+    )
+    parser.add_argument(
+        "--max-portfolio-beta",
+        type=float,
+        default=float("inf"),
+        help="Scale the whole book down when the summed weight x beta exceeds this bound",
+    )
+
+
+def _add_weighting_args(parser: argparse.ArgumentParser, nargs: str | None = None) -> None:
+    parser.add_argument(
+        "--weighting",
+        choices=WEIGHTING_SCHEMES,
+        nargs=nargs,
+        default=["equal"] if nargs else "equal",
+        help="Position sizing: capped equal weights or EWMA-covariance based weights",
+    )
+    parser.add_argument(
+        "--covariance-halflife",
+        type=float,
+        default=DEFAULT_COVARIANCE_HALFLIFE,
+        help="EWMA covariance half-life in trading days",
+    )
+    parser.add_argument(
+        "--shrinkage",
+        type=float,
+        default=DEFAULT_SHRINKAGE,
+        help="Covariance shrinkage toward its diagonal for mean_variance weights (0..1)",
+    )
+
+
+def _add_limit_args(parser: argparse.ArgumentParser) -> None:
     parser.add_argument("--max-positions", type=int, default=3)
     parser.add_argument("--min-score", type=float, default=-1e9)
     parser.add_argument("--max-weight-per-symbol", type=float, default=0.5)
     parser.add_argument("--max-daily-turnover", type=float, default=1.0)
+    _add_weighting_args(parser)
+    _add_constraint_args(parser)
+
+
+def _add_risk_args(parser: argparse.ArgumentParser) -> None:
+    _add_limit_args(parser)
+    parser.add_argument(
+        "--engine",
+        choices=PAPER_ENGINES,
+        default="loop",
+        help="Paper engine: per-day loop or (days x symbols) matrix engine",
+    )
+
+
+def _add_format_arg(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--format",
+        dest="signal_format",
+        choices=SIGNAL_FORMATS,
+        default=None,
+        help="Signal file format (default: detect from file extension)",
+    )
+
+
+def _add_index_arg(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--index",
+        action="store_true",
+        help="Write a date-sorted CSV with a sidecar <csv>.idx date index for range seeks",
+    )
+
+
+def _add_stream_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Read a date-sorted signal file one day at a time instead of loading it whole",
+    )
+    parser.add_argument("--chunk-rows", type=int, default=DEFAULT_CHUNK_ROWS)
+
+
+def _add_price_cache_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--no-price-cache", action="store_true", help="Parse the price CSV without the price cache")
+    parser.add_argument("--price-cache-dir", default=None, help=f"Price cache directory (default: ${PRICE_CACHE_ENV})")
+
+
+def _add_state_dir_arg(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--state-dir",
+        default="",
+        help="Keep per-day input hashes and simulator snapshots here and re-simulate only from the first changed day",
+    )
+
+
+def _simulate(
+    args: argparse.Namespace,
+    rows: SignalInput,
+    prices: PriceMatrix,
+    limits: RiskLimits,
+    tag: str,
+) -> PaperResult:
+    constraints = _load_constraints(args, prices, limits)
+    artifacts_path = getattr(args, "artifacts", "")
+    if artifacts_path:
+        if args.state_dir:
+            raise RuntimeError("--artifacts cannot be combined with --state-dir.")
+        artifacts = build_paper_artifacts(rows, prices, limits, constraints)
+        artifacts.save(artifacts_path)
+        print(f"[{tag}] artifacts       : {artifacts_path}")
+        return artifacts.result()
+    if not args.state_dir:
+        return run_paper_simulation(rows, prices, limits, engine=args.engine, constraints=constraints)
+    incremental = run_paper_simulation_incremental(rows, prices, limits, args.state_dir, constraints)
+    print(
+        f"[{tag}] resimulated     : {incremental.simulated_days}/{incremental.total_days} days "
+        f"(from {incremental.resumed_from or 'start'})"
+    )
+    return incremental.result
+
+
+def _load_prices(args: argparse.Namespace) -> PriceMatrix:
+    return load_price_matrix(
+        args.price_csv,
+        cache=PriceCache(args.price_cache_dir),
+        use_cache=not args.no_price_cache,
+    )
 
 
 def command_sample(args: argparse.Namespace) -> None:
@@ -55,8 +269,8 @@ def command_sample(args: argparse.Namespace) -> None:
     if not source_path.exists():
         raise RuntimeError(f"Sample signal file not found: {source_path}")
 
-    rows = read_signals(source_path)
-    write_signals(args.output, rows)
+    rows = read_signal_frame(source_path)
+    write_signals(args.output, rows, fmt=args.signal_format, index=args.index)
     print(f"[sample] wrote {len(rows)} rows -> {args.output}")
 
 
@@ -67,35 +281,145 @@ def command_qlib(args: argparse.Namespace) -> None:
         start=args.start,
         end=args.end,
     )
-    write_signals(args.output, rows)
+    write_signals(args.output, rows, fmt=args.signal_format, index=args.index)
     print(f"[qlib] wrote {len(rows)} rows -> {args.output}")
 
 
 def command_validate(args: argparse.Namespace) -> None:
-    rows = read_signals(args.signal_csv)
-    row_count, duplicate_count = _validate_rows(rows)
-    date_count = len({row.signal_date for row in rows})
-    symbol_count = len({row.symbol for row in rows})
+    report = validate_signal_file(
+        args.signal_csv,
+        fmt=args.signal_format,
+        chunk_rows=args.chunk_rows,
+        workers=args.workers,
+    )
 
     print(f"[validate] file          : {args.signal_csv}")
-    print(f"[validate] rows          : {row_count}")
-    print(f"[validate] dates         : {date_count}")
-    print(f"[validate] symbols       : {symbol_count}")
-    print(f"[validate] duplicates    : {duplicate_count}")
+    print(f"[validate] rows          : {report.rows}")
+    print(f"[validate] dates         : {report.dates}")
+    print(f"[validate] symbols       : {report.symbols}")
+    print(f"[validate] duplicates    : {report.duplicates}")
+    print(f"[validate] non_finite    : {report.non_finite}")
+    print(f"[validate] out_of_order  : {report.out_of_order}")
+    print(
+        f"[validate] coverage      : min={report.min_coverage} "
+        f"max={report.max_coverage} mean={report.mean_coverage:.2f}"
+    )
+    print(
+        f"[validate] score         : mean={report.score_mean:.6f} std={report.score_std:.6f} "
+        f"min={report.score_min:.6f} max={report.score_max:.6f}"
+    )
 
-    if row_count == 0:
-        raise RuntimeError("Signal CSV is empty.")
-    if duplicate_count > 0:
-        raise RuntimeError("Duplicate (date,symbol) rows detected.")
+    errors = report.errors()
+    if errors:
+        raise RuntimeError(errors[0])
 
     print("[validate] OK")
 
 
+def command_publish(args: argparse.Namespace) -> None:
+    frame = read_signal_frame(args.signal_csv, fmt=args.signal_format)
+    store = SignalStore(args.store, partition_format=args.partition_format)
+    written = store.append(frame, overwrite=args.overwrite)
+    partitions = store.partitions()
+
+    print(f"[publish] source         : {args.signal_csv}")
+    print(f"[publish] store          : {args.store}")
+    print(f"[publish] rows           : {len(frame)}")
+    print(f"[publish] dates written  : {len(written)}")
+    print(f"[publish] partitions     : {len(partitions)}")
+    if partitions:
+        print(f"[publish] range          : {partitions[0].day_key} ~ {partitions[-1].day_key}")
+
+
+def command_merge(args: argparse.Namespace) -> None:
+    merged = read_signal_sources(
+        args.inputs,
+        fmt=args.signal_format,
+        max_workers=args.workers,
+        use_processes=args.processes,
+    )
+    output_path = Path(args.output)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    merged.to_dataframe().to_csv(output_path, index=False, float_format="%.10f")
+
+    print(f"[merge] sources        : {', '.join(merged.sources)}")
+    print(f"[merge] keys           : {len(merged)}")
+    for source in merged.sources:
+        print(
+            f"[merge] {source:<15}: duplicates={merged.duplicates[source]} conflicts={merged.conflicts[source]}"
+        )
+    print(f"[merge] output         : {output_path}")
+
+    if args.strict and any(merged.duplicates.values()):
+        raise RuntimeError("Duplicate (date,symbol) rows detected in merged sources.")
+
+
+def _paper_strategies(args: argparse.Namespace, prices: PriceMatrix, limits: RiskLimits) -> None:
+    if args.checkpoint or args.state_dir or args.artifacts or args.stream:
+        raise RuntimeError(
+            "Multiple signal files cannot be combined with --checkpoint, --state-dir, --artifacts or --stream."
+        )
+    start, end = prices.date_range()
+    signal_sets = read_signal_sets(args.signal_csv, fmt=args.signal_format, start=start, end=end)
+    results = run_paper_simulation(signal_sets, prices, limits, constraints=_load_constraints(args, prices, limits))
+    table = pd.DataFrame(
+        [{"strategy": name, **asdict(result)} for name, result in results.items()],
+        columns=["strategy"] + [field.name for field in fields(PaperResult)],
+    )
+
+    print(f"[paper] price_csv       : {args.price_csv}")
+    print(f"[paper] strategies      : {len(table)}")
+    for row in table.itertuples():
+        print(
+            f"[paper] {row.strategy:<16}: total_return={row.total_return:.6f} cagr={row.cagr:.6f} "
+            f"max_drawdown={row.max_drawdown:.6f} trades={row.trades}"
+        )
+
+    if args.output:
+        output_path = Path(args.output)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        table.to_csv(output_path, index=False)
+        print(f"[paper] metrics saved  : {args.output}")
+
+
 def command_paper(args: argparse.Namespace) -> None:
-    rows = read_signals(args.signal_csv)
-    price_df = load_price_csv(args.price_csv)
+    prices = _load_prices(args)
+    start, end = prices.date_range()
     limits = _build_risk_limits(args)
-    result = run_paper_simulation(rows, price_df, limits)
+    if len(args.signal_csv) > 1 or len(expand_signal_sources(args.signal_csv)) > 1:
+        _paper_strategies(args, prices, limits)
+        return
+    args.signal_csv = args.signal_csv[0]
+    simulator: PaperSimulator | None = None
+    if args.checkpoint:
+        if args.artifacts or args.state_dir:
+            raise RuntimeError("--checkpoint cannot be combined with --artifacts or --state-dir.")
+        checkpoint = Path(args.checkpoint)
+        constraints = _load_constraints(args, prices, limits)
+        if checkpoint.exists():
+            simulator = PaperSimulator.load_checkpoint(checkpoint, limits, constraints)
+        else:
+            simulator = PaperSimulator(limits, constraints)
+        if simulator.last_day is not None and start is not None:
+            # 체크포인트 이후 날짜의 신호만 읽는다.
+            start = max(start, parse_signal_date(simulator.last_day))
+
+    if args.stream:
+        rows = iter_signal_days(
+            args.signal_csv,
+            fmt=args.signal_format,
+            chunk_rows=args.chunk_rows,
+            start=start,
+            end=end,
+        )
+    else:
+        rows = read_signal_frame(args.signal_csv, fmt=args.signal_format, start=start, end=end)
+
+    if simulator is not None:
+        result = simulator.replay(rows, prices).result()
+        simulator.save_checkpoint(args.checkpoint)
+    else:
+        result = _simulate(args, rows, prices, limits, "paper")
 
     print(f"[paper] signal_csv      : {args.signal_csv}")
     print(f"[paper] price_csv       : {args.price_csv}")
@@ -110,6 +434,149 @@ def command_paper(args: argparse.Namespace) -> None:
         print(f"[paper] metrics saved  : {args.output}")
 
 
+def command_sweep(args: argparse.Namespace) -> None:
+    prices = _load_prices(args)
+    start, end = prices.date_range()
+    rows = read_signal_frame(args.signal_csv, fmt=args.signal_format, start=start, end=end)
+    limits_list = [
+        RiskLimits(
+            max_positions=max_positions,
+            min_score=min_score,
+            max_weight_per_symbol=max_weight,
+            max_daily_turnover=max_turnover,
+            weighting=weighting,
+            covariance_halflife=args.covariance_halflife,
+            shrinkage=args.shrinkage,
+            **_constraint_limits(args),
+        )
+        for max_positions, min_score, max_weight, max_turnover, weighting in product(
+            args.max_positions,
+            args.min_score,
+            args.max_weight_per_symbol,
+            args.max_daily_turnover,
+            args.weighting,
+        )
+    ]
+    constraints = _load_constraints(args, prices, limits_list[0])
+    table = run_paper_simulation_grid(rows, prices, limits_list, max_workers=args.workers, constraints=constraints)
+    best = table.loc[table["total_return"].idxmax()]
+
+    print(f"[sweep] signal_csv      : {args.signal_csv}")
+    print(f"[sweep] price_csv       : {args.price_csv}")
+    print(f"[sweep] combinations    : {len(table)}")
+    print(
+        f"[sweep] best            : max_positions={int(best['max_positions'])} min_score={best['min_score']} "
+        f"max_weight_per_symbol={best['max_weight_per_symbol']} max_daily_turnover={best['max_daily_turnover']} "
+        f"weighting={best['weighting']}"
+    )
+    print(f"[sweep] best_return     : {best['total_return']:.6f}")
+
+    if args.output:
+        output_path = Path(args.output)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        table.to_csv(output_path, index=False)
+        print(f"[sweep] table saved     : {args.output}")
+
+
+def command_robust(args: argparse.Namespace) -> None:
+    prices = _load_prices(args)
+    start, end = prices.date_range()
+    rows = read_signal_frame(args.signal_csv, fmt=args.signal_format, start=start, end=end)
+    limits = _build_risk_limits(args)
+    constraints = _load_constraints(args, prices, limits)
+    base = run_paper_simulation(rows, prices, limits, engine="vector", constraints=constraints)
+    table = run_robustness(
+        rows,
+        prices,
+        limits,
+        method=args.method,
+        n_paths=args.paths,
+        block_size=args.block_size,
+        seed=args.seed,
+        batch_size=args.batch_size,
+        max_workers=args.workers,
+        constraints=constraints,
+    )
+    summary = robust_quantiles(table)
+
+    print(f"[robust] signal_csv     : {args.signal_csv}")
+    print(f"[robust] price_csv      : {args.price_csv}")
+    print(f"[robust] method         : {args.method} (paths={args.paths}, seed={args.seed})")
+    for name, row in summary.iterrows():
+        point = getattr(base, name)
+        quantiles = " ".join(f"{column}={value:.6f}" for column, value in row.items())
+        print(f"[robust] {name:<14}: point={point:.6f} {quantiles}")
+
+    if args.output:
+        output_path = Path(args.output)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        table.to_csv(output_path, index=False)
+        print(f"[robust] paths saved    : {args.output}")
+
+
+def command_schedule(args: argparse.Namespace) -> None:
+    prices = _load_prices(args)
+    start, end = prices.date_range()
+    rows = read_signal_frame(args.signal_csv, fmt=args.signal_format, start=start, end=end)
+    limits = _build_risk_limits(args)
+    schedule = build_target_schedule(rows, prices, limits, _load_constraints(args, prices, limits))
+    save_target_schedule(args.output, schedule)
+
+    held = schedule[schedule["symbol"] != ""]
+    last_day = schedule["date"].iloc[-1]
+    last_targets = held[held["date"] == last_day]
+    print(f"[schedule] signal_csv   : {args.signal_csv}")
+    print(f"[schedule] price_csv    : {args.price_csv}")
+    print(f"[schedule] days         : {schedule['date'].nunique()} ({len(held)} target rows)")
+    print(
+        f"[schedule] last targets : {last_day} "
+        + (" ".join(f"{row.symbol}={row.weight:.4f}" for row in last_targets.itertuples()) or "cash")
+    )
+    print(f"[schedule] saved        : {args.output}")
+
+
+def command_metrics(args: argparse.Namespace) -> None:
+    artifacts = PaperArtifacts.load(args.artifacts)
+    summary = summarize(artifacts, periods_per_year=args.periods_per_year)
+
+    print(f"[metrics] artifacts     : {args.artifacts}")
+    for name, value in summary.items():
+        print(f"[metrics] {name:<14}: {value:.6f}")
+
+    if args.output:
+        table = period_metrics(artifacts, freq=args.period, periods_per_year=args.periods_per_year)
+        output_path = Path(args.output)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        table.to_csv(output_path, index=False)
+        print(f"[metrics] periods saved : {args.output}")
+
+    if args.rolling_output:
+        table = rolling_metrics(artifacts.daily_returns, window=args.rolling, periods_per_year=args.periods_per_year)
+        table.insert(0, "date", format_day_ordinals(artifacts.days[table["end"].to_numpy() - 1]))
+        output_path = Path(args.rolling_output)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        table.to_csv(output_path, index=False)
+        print(f"[metrics] rolling saved : {args.rolling_output}")
+
+
+def command_cache(args: argparse.Namespace) -> None:
+    cache = PriceCache(args.cache_dir, max_bytes=args.max_bytes)
+    if args.action == "clear":
+        removed = cache.clear()
+        print(f"[cache] cleared         : {removed} entries ({cache.root})")
+        return
+    if args.action == "evict":
+        removed = cache.evict()
+        print(f"[cache] evicted         : {len(removed)} entries")
+
+    entries = cache.entries()
+    print(f"[cache] root            : {cache.root}")
+    print(f"[cache] entries         : {len(entries)}")
+    print(f"[cache] size            : {sum(entry.nbytes for entry in entries)} / {cache.max_bytes} bytes")
+    for entry in entries:
+        print(f"[cache] {entry.key}: {entry.source} ({entry.nbytes} bytes)")
+
+
 def command_pipeline(args: argparse.Namespace) -> None:
     errors: list[Exception] = []
     done = threading.Event()
@@ -130,7 +597,7 @@ def command_pipeline(args: argparse.Namespace) -> None:
     @safe
     def on_requested(_event) -> None:
         if args.mode == "sample":
-            rows = read_signals(_default_sample_csv())
+            rows = read_signal_frame(_default_sample_csv())
         else:
             if not args.provider_uri:
                 raise RuntimeError("--provider-uri is required when mode=qlib")
@@ -140,26 +607,25 @@ def command_pipeline(args: argparse.Namespace) -> None:
                 start=args.start,
                 end=args.end,
             )
-        write_signals(args.signal_csv, rows)
+        write_signals(args.signal_csv, rows, fmt=args.signal_format, index=args.index)
         emit(EVENT_SIGNAL_GENERATED, {"signal_csv": args.signal_csv})
 
     @safe
     def on_generated(_event) -> None:
-        rows = read_signals(args.signal_csv)
-        row_count, duplicate_count = _validate_rows(rows)
-        if row_count == 0:
-            raise RuntimeError("Signal CSV is empty.")
-        if duplicate_count > 0:
-            raise RuntimeError("Duplicate (date,symbol) rows detected.")
-        emit(EVENT_SIGNAL_VALIDATED, {"row_count": row_count})
+        report = validate_signal_file(args.signal_csv, fmt=args.signal_format)
+        errors = report.errors()
+        if errors:
+            raise RuntimeError(errors[0])
+        emit(EVENT_SIGNAL_VALIDATED, {"row_count": report.rows})
 
     @safe
     def on_validated(_event) -> None:
         if args.price_csv:
-            rows = read_signals(args.signal_csv)
-            price_df = load_price_csv(args.price_csv)
+            prices = _load_prices(args)
+            start, end = prices.date_range()
+            rows = read_signal_frame(args.signal_csv, fmt=args.signal_format, start=start, end=end)
             limits = _build_risk_limits(args)
-            result = run_paper_simulation(rows, price_df, limits)
+            result = _simulate(args, rows, prices, limits, "pipeline")
             print(f"[pipeline] paper total_return : {result.total_return:.6f}")
             print(f"[pipeline] paper cagr         : {result.cagr:.6f}")
             print(f"[pipeline] paper max_dd       : {result.max_drawdown:.6f}")
@@ -196,6 +662,8 @@ def build_parser() -> argparse.ArgumentParser:
 
     sample = sub.add_parser("sample", help="Copy sample signals to output path")
     sample.add_argument("--output", default=_default_generated_csv())
+    _add_format_arg(sample)
+    _add_index_arg(sample)
     sample.set_defaults(func=command_sample)
 
     qlib = sub.add_parser("qlib", help="Generate signals with qlib")
@@ -204,19 +672,122 @@ def build_parser() -> argparse.ArgumentParser:
     qlib.add_argument("--end", default="2025-12-31")
     qlib.add_argument("--symbols", nargs="+", default=DEFAULT_SYMBOLS)
     qlib.add_argument("--output", default=_default_generated_csv())
+    _add_format_arg(qlib)
+    _add_index_arg(qlib)
     qlib.set_defaults(func=command_qlib)
 
     validate = sub.add_parser("validate", help="Validate signal csv")
     validate.add_argument("--signal-csv", default=_default_generated_csv())
+    validate.add_argument("--chunk-rows", type=int, default=DEFAULT_CHUNK_ROWS)
+    validate.add_argument("--workers", type=int, default=1, help="Validate CSV byte ranges in parallel processes")
+    _add_format_arg(validate)
     validate.set_defaults(func=command_validate)
 
+    publish = sub.add_parser("publish", help="Append signals to a date-partitioned signal store")
+    publish.add_argument("--signal-csv", default=_default_generated_csv())
+    publish.add_argument("--store", required=True, help="Store directory, e.g. data/signals/<model>")
+    publish.add_argument("--partition-format", choices=list(PARTITION_SUFFIXES), default="csv")
+    publish.add_argument("--overwrite", action="store_true", help="Replace partitions for dates that already exist")
+    _add_format_arg(publish)
+    publish.set_defaults(func=command_publish)
+
+    merge = sub.add_parser("merge", help="Read many signal files in parallel and merge them by (date,symbol)")
+    merge.add_argument("--inputs", nargs="+", required=True, help="Signal files, directories or glob patterns")
+    merge.add_argument("--output", default=str(PROJECT_ROOT / "data" / "merged_signals.csv"))
+    merge.add_argument("--workers", type=int, default=None)
+    merge.add_argument("--processes", action="store_true", help="Use a process pool instead of threads")
+    merge.add_argument("--strict", action="store_true", help="Fail when any source has duplicate keys")
+    _add_format_arg(merge)
+    merge.set_defaults(func=command_merge)
+
     paper = sub.add_parser("paper", help="Run local paper simulation (vnpy paper_account style)")
-    paper.add_argument("--signal-csv", default=_default_generated_csv())
+    paper.add_argument(
+        "--signal-csv",
+        nargs="+",
+        default=[_default_generated_csv()],
+        help="Signal file; several files, a directory or a glob evaluate each as a strategy in one pass",
+    )
     paper.add_argument("--price-csv", required=True, help="CSV columns: date,symbol,close")
     paper.add_argument("--output", default=str(PROJECT_ROOT / "data" / "paper_metrics.csv"))
     _add_risk_args(paper)
+    _add_format_arg(paper)
+    _add_stream_args(paper)
+    _add_price_cache_args(paper)
+    _add_state_dir_arg(paper)
+    paper.add_argument(
+        "--artifacts",
+        default="",
+        help="Save daily returns, equity, drawdown, weights and turnover to this .npz file",
+    )
+    paper.add_argument(
+        "--checkpoint",
+        default="",
+        help="Resume from and save simulator state to this JSON file (only days after it are simulated)",
+    )
     paper.set_defaults(func=command_paper)
 
+    sweep = sub.add_parser("sweep", help="Evaluate a grid of risk limits against one price/signal load")
+    sweep.add_argument("--signal-csv", default=_default_generated_csv())
+    sweep.add_argument("--price-csv", required=True, help="CSV columns: date,symbol,close")
+    sweep.add_argument("--output", default=str(PROJECT_ROOT / "data" / "paper_sweep.csv"))
+    sweep.add_argument("--max-positions", type=int, nargs="+", default=[3])
+    sweep.add_argument("--min-score", type=float, nargs="+", default=[-1e9])
+    sweep.add_argument("--max-weight-per-symbol", type=float, nargs="+", default=[0.5])
+    sweep.add_argument("--max-daily-turnover", type=float, nargs="+", default=[1.0])
+    _add_weighting_args(sweep, nargs="+")
+    _add_constraint_args(sweep)
+    sweep.add_argument("--workers", type=int, default=None, help="Process pool size (default: CPU count)")
+    _add_format_arg(sweep)
+    _add_price_cache_args(sweep)
+    sweep.set_defaults(func=command_sweep)
+
+    robust = sub.add_parser("robust", help="Estimate paper result distributions with bootstrap or shuffled signals")
+    robust.add_argument("--signal-csv", default=_default_generated_csv())
+    robust.add_argument("--price-csv", required=True, help="CSV columns: date,symbol,close")
+    robust.add_argument("--output", default=str(PROJECT_ROOT / "data" / "paper_robust.csv"))
+    robust.add_argument(
+        "--method",
+        choices=ROBUST_METHODS,
+        default="bootstrap",
+        help="bootstrap: resample daily returns in blocks, shuffle: re-simulate with per-day shuffled scores",
+    )
+    robust.add_argument("--paths", type=int, default=DEFAULT_ROBUST_PATHS)
+    robust.add_argument("--block-size", type=int, default=DEFAULT_BLOCK_SIZE, help="Bootstrap block length in days")
+    robust.add_argument("--seed", type=int, default=0)
+    robust.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_PATHS, help="Paths per vectorized batch")
+    robust.add_argument("--workers", type=int, default=None, help="Process pool size (default: CPU count)")
+    _add_risk_args(robust)
+    _add_format_arg(robust)
+    _add_price_cache_args(robust)
+    robust.set_defaults(func=command_robust)
+
+    schedule = sub.add_parser(
+        "schedule",
+        help="Export per-day target weights from the paper risk selection for the LEAN algorithm",
+    )
+    schedule.add_argument("--signal-csv", default=_default_generated_csv())
+    schedule.add_argument("--price-csv", required=True, help="CSV columns: date,symbol,close (trading calendar)")
+    schedule.add_argument("--output", default=str(PROJECT_ROOT / "data" / "target_schedule.csv"))
+    _add_limit_args(schedule)
+    _add_format_arg(schedule)
+    _add_price_cache_args(schedule)
+    schedule.set_defaults(func=command_schedule)
+
+    metrics = sub.add_parser("metrics", help="Compute statistics from saved paper artifacts without re-simulating")
+    metrics.add_argument("--artifacts", required=True, help="Paper artifacts .npz written by paper --artifacts")
+    metrics.add_argument("--period", choices=["M", "Y"], default="M", help="Period for the returns table")
+    metrics.add_argument("--periods-per-year", type=int, default=TRADING_DAYS_PER_YEAR)
+    metrics.add_argument("--output", default="", help="Write per-period metrics to this CSV")
+    metrics.add_argument("--rolling", type=int, default=TRADING_DAYS_PER_YEAR, help="Rolling window length in days")
+    metrics.add_argument("--rolling-output", default="", help="Write rolling-window metrics to this CSV")
+    metrics.set_defaults(func=command_metrics)
+
+    cache = sub.add_parser("cache", help="Inspect or clear the parsed price matrix cache")
+    cache.add_argument("action", choices=["info", "evict", "clear"], nargs="?", default="info")
+    cache.add_argument("--cache-dir", default=None, help=f"Price cache directory (default: ${PRICE_CACHE_ENV})")
+    cache.add_argument("--max-bytes", type=int, default=DEFAULT_PRICE_CACHE_MAX_BYTES)
+    cache.set_defaults(func=command_cache)
+
     pipeline = sub.add_parser("pipeline", help="Event-driven pipeline (vnpy event style)")
     pipeline.add_argument("--mode", choices=["sample", "qlib"], default="sample")
     pipeline.add_argument("--provider-uri", default="")
@@ -228,6 +799,10 @@ def build_parser() -> argparse.ArgumentParser:
     pipeline.add_argument("--paper-output", default=str(PROJECT_ROOT / "data" / "pipeline_paper_metrics.csv"))
     pipeline.add_argument("--timeout-sec", type=int, default=30)
     _add_risk_args(pipeline)
+    _add_format_arg(pipeline)
+    _add_index_arg(pipeline)
+    _add_price_cache_args(pipeline)
+    _add_state_dir_arg(pipeline)
     pipeline.set_defaults(func=command_pipeline)
 
     return parser
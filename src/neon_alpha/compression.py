@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import bz2
+import gzip
+import io
+import lzma
+from pathlib import Path
+from typing import IO
+
+
+COMPRESSION_SUFFIXES: dict[str, str] = {".gz": "gzip", ".bz2": "bz2", ".xz": "xz", ".zst": "zstd"}
+
+
+def compression_of(path: str | Path) -> str | None:
+    """
+    확장자로 압축 방식을 판별한다(gzip, bz2, xz, zstd). 압축 파일이 아니면 None.
+    """
+    return COMPRESSION_SUFFIXES.get(Path(path).suffix.lower())
+
+
+def strip_compression_suffix(path: str | Path) -> Path:
+    """
+    signals.csv.gz -> signals.csv. 포맷 판별과 소스 이름에 쓴다.
+    """
+    file_path = Path(path)
+    return file_path.with_suffix("") if compression_of(file_path) else file_path
+
+
+def _require_zstandard():
+    try:
+        import zstandard
+    except Exception as error:  # pragma: no cover
+        raise RuntimeError(
+            "zstandard import failed. Install with `pip install neon-alpha[zstd]` to use .zst files."
+        ) from error
+    return zstandard
+
+
+def open_binary(path: str | Path, mode: str = "rb") -> IO[bytes]:
+    """
+    압축 여부와 관계없이 바이트 스트림을 연다. 압축 파일은 임시 파일로 풀지 않고 읽고 쓰는 동안 스트리밍으로 풀고 묶는다.
+    """
+    if mode not in ("rb", "wb"):
+        raise ValueError(f"Unsupported mode: {mode}")
+    file_path = Path(path)
+    compression = compression_of(file_path)
+    if compression == "gzip":
+        return gzip.open(file_path, mode)
+    if compression == "bz2":
+        return bz2.open(file_path, mode)
+    if compression == "xz":
+        return lzma.open(file_path, mode)
+    if compression == "zstd":
+        zstandard = _require_zstandard()
+        return zstandard.open(file_path, mode)
+    return file_path.open(mode)
+
+
+def open_text(path: str | Path, mode: str = "r") -> IO[str]:
+    if mode not in ("r", "w"):
+        raise ValueError(f"Unsupported mode: {mode}")
+    return io.TextIOWrapper(open_binary(path, mode + "b"), encoding="utf-8", newline="")
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-from datetime import date
+import numpy as np
 import pandas as pd
 
-from .signal_io import SignalRow
+from .signal_io import SignalFrame, SignalRow
+from .trading_calendar import to_day_ordinals
 
 
 def load_close_prices(
@@ -54,25 +55,24 @@ def load_close_prices(
     return close_df
 
 
-def build_signal_rows(close_df: pd.DataFrame) -> list[SignalRow]:
+def build_signal_frame(close_df: pd.DataFrame) -> SignalFrame:
     df = close_df.copy()
     grouped = df.groupby("symbol", group_keys=False)
 
     momentum_20 = grouped["close"].pct_change(20)
     reversal_5 = grouped["close"].pct_change(5)
     df["score"] = momentum_20 - reversal_5
-    df = df.dropna(subset=["score"])
+    df = df.dropna(subset=["score"]).sort_values(["date", "symbol"], kind="stable")
+
+    return SignalFrame.from_ordinals(
+        days=to_day_ordinals(pd.to_datetime(df["date"])),
+        symbols=df["symbol"].to_numpy(dtype=object),
+        scores=df["score"].to_numpy(dtype=np.float64),
+    )
 
-    rows: list[SignalRow] = []
-    for item in df.itertuples(index=False):
-        rows.append(
-            SignalRow(
-                signal_date=item.date if isinstance(item.date, date) else pd.to_datetime(item.date).date(),
-                symbol=item.symbol,
-                score=float(item.score),
-            )
-        )
-    return rows
+
+def build_signal_rows(close_df: pd.DataFrame) -> list[SignalRow]:
+    return build_signal_frame(close_df).to_rows()
 
 
 def generate_signals_with_qlib(
@@ -80,11 +80,11 @@ def generate_signals_with_qlib(
     symbols: list[str],
     start: str,
     end: str,
-) -> list[SignalRow]:
+) -> SignalFrame:
     close_df = load_close_prices(
         provider_uri=provider_uri,
         symbols=[symbol.upper() for symbol in symbols],
         start=start,
         end=end,
     )
-    return build_signal_rows(close_df)
+    return build_signal_frame(close_df)
@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+import hashlib
+import json
+import math
+import os
+from pathlib import Path
+
+import numpy as np
+
+from .paper import (
+    DayScores,
+    PaperResult,
+    PaperSimulator,
+    PriceInput,
+    PriceMatrix,
+    PriceRow,
+    SignalInput,
+    _check_constraints,
+    as_price_matrix,
+)
+from .risk import ConstraintData, RiskLimits
+from .symbols import SYMBOLS
+
+
+PAPER_STATE_VERSION: int = 2
+PAPER_STATE_META_NAME: str = "meta.json"
+PAPER_STATE_SNAPSHOTS_NAME: str = "snapshots.jsonl"
+
+
+@dataclass
+class IncrementalPaperResult:
+    result: PaperResult
+    resumed_from: str | None
+    simulated_days: int
+    total_days: int
+
+
+def _atomic_write_text(path: Path, text: str) -> None:
+    temp_path = path.with_name(path.name + ".tmp")
+    temp_path.write_text(text, encoding="utf-8")
+    os.replace(temp_path, path)
+
+
+def day_input_hashes(
+    day_scores: DayScores,
+    prices: PriceMatrix,
+    adv: np.ndarray | None = None,
+) -> list[str]:
+    """
+    거래일별 입력(그날 신호 점수 + 그날 종가 행, 유동성 제약이면 평균 거래대금 행) 해시.
+    day t 이후의 상태는 t까지의 입력에만 의존한다.
+    """
+    hashes: list[str] = []
+    for index, day in enumerate(prices.days):
+        begin, finish = int(day_scores.offsets[index]), int(day_scores.offsets[index + 1])
+        digest = hashlib.blake2b(day.encode("utf-8"), digest_size=16)
+        digest.update("\0".join(SYMBOLS.names(day_scores.ids[begin:finish]).tolist()).encode("utf-8"))
+        digest.update(np.ascontiguousarray(day_scores.scores[begin:finish]).tobytes())
+        digest.update(np.ascontiguousarray(prices.close[index]).tobytes())
+        if adv is not None:
+            digest.update(np.ascontiguousarray(adv[index]).tobytes())
+        hashes.append(digest.hexdigest())
+    return hashes
+
+
+def _universe_hash(prices: PriceMatrix, limits: RiskLimits, constraints: ConstraintData | None = None) -> str:
+    payload = {"symbols": prices.symbols, "limits": asdict(limits)}
+    if constraints is not None and constraints.applies(limits):
+        payload["sectors"] = constraints.sectors
+        payload["sector"] = constraints.sector.tolist()
+        payload["beta"] = [None if np.isnan(beta) else beta for beta in constraints.beta.tolist()]
+        if constraints.sector_caps is not None:
+            payload["sector_caps"] = [None if np.isnan(cap) else cap for cap in constraints.sector_caps.tolist()]
+    encoded = json.dumps(payload, sort_keys=True)
+    return hashlib.blake2b(encoded.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _load_meta(state_dir: Path, universe: str) -> dict | None:
+    """
+    meta.json에는 거래일, 입력 해시, snapshots.jsonl의 줄 시작 바이트 위치(+ 끝)가 들어 있다.
+    스냅샷 본문은 여기서 읽지 않는다.
+    """
+    meta_path = state_dir / PAPER_STATE_META_NAME
+    snapshots_path = state_dir / PAPER_STATE_SNAPSHOTS_NAME
+    if not meta_path.exists() or not snapshots_path.exists():
+        return None
+    try:
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if meta.get("version") != PAPER_STATE_VERSION or meta.get("universe") != universe:
+        return None
+    if snapshots_path.stat().st_size < meta["offsets"][-1]:
+        return None
+    return meta
+
+
+def _write_meta(state_dir: Path, universe: str, days: list[str], hashes: list[str], offsets: list[int]) -> None:
+    meta = {"version": PAPER_STATE_VERSION, "universe": universe, "days": days, "hashes": hashes, "offsets": offsets}
+    _atomic_write_text(state_dir / PAPER_STATE_META_NAME, json.dumps(meta, separators=(",", ":")))
+
+
+def _read_snapshot(path: Path, begin: int, end: int) -> dict:
+    with path.open("rb") as file:
+        file.seek(begin)
+        return json.loads(file.read(end - begin))
+
+
+def run_paper_simulation_incremental(
+    signal_rows: SignalInput,
+    price_df: PriceInput,
+    limits: RiskLimits,
+    state_dir: str | Path,
+    constraints: ConstraintData | None = None,
+) -> IncrementalPaperResult:
+    """
+    state_dir에 거래일별 입력 해시와 시뮬레이터 상태 스냅샷을 남긴다. 다음 실행에서는 입력이 처음으로
+    달라진 날짜를 찾아 그 전날 스냅샷부터 다시 돌리므로, 비용이 바뀐 뒷부분 길이에 비례한다.
+    가격 종목 구성이나 리스크 한도(제약을 쓰면 섹터/베타 입력 포함)가 바뀌면 처음부터 다시 돌린다.
+    snapshots.jsonl은 바뀐 날짜의 줄 시작에서 잘라 새로 돌린 날짜만 이어 쓰고, 앞부분 스냅샷은 건드리지 않는다.
+    스냅샷마다 공분산 행렬을 넣을 수는 없어서 동일 비중(weighting="equal")만 지원한다.
+    """
+    if limits.weighting != "equal":
+        raise ValueError("Incremental paper state supports only equal weighting.")
+    _check_constraints(limits, constraints)
+    prices = as_price_matrix(price_df)
+    if len(prices.calendar) < 2:
+        raise RuntimeError("Need at least two price dates for paper simulation.")
+
+    state_path = Path(state_dir)
+    day_scores = DayScores.build(signal_rows, prices.calendar)
+    adv = constraints.adv if constraints is not None and limits.max_adv_fraction < math.inf else None
+    hashes = day_input_hashes(day_scores, prices, adv)
+    universe = _universe_hash(prices, limits, constraints)
+    meta = _load_meta(state_path, universe)
+    previous_days: list[str] = meta["days"] if meta else []
+    previous_hashes: list[str] = meta["hashes"] if meta else []
+
+    first_changed = 0
+    while (
+        first_changed < min(len(previous_days), len(hashes))
+        and previous_days[first_changed] == prices.days[first_changed]
+        and previous_hashes[first_changed] == hashes[first_changed]
+    ):
+        first_changed += 1
+
+    snapshots_path = state_path / PAPER_STATE_SNAPSHOTS_NAME
+    offsets: list[int] = meta["offsets"][: first_changed + 1] if meta else [0]
+    if first_changed == 0:
+        simulator = PaperSimulator(limits, constraints)
+    else:
+        snapshot = _read_snapshot(snapshots_path, offsets[first_changed - 1], offsets[first_changed])
+        simulator = PaperSimulator.from_state(snapshot["state"], limits, constraints)
+
+    days = previous_days[:first_changed]
+    day_hashes = previous_hashes[:first_changed]
+    state_path.mkdir(parents=True, exist_ok=True)
+    if first_changed < len(previous_days):
+        # 자르기 전에 남길 앞부분만 가리키도록 meta를 먼저 바꿔 두면 도중에 멈춰도 상태가 어긋나지 않는다.
+        _write_meta(state_path, universe, days, day_hashes, offsets)
+
+    with snapshots_path.open("ab") as file:
+        file.truncate(offsets[-1])
+        for index in range(first_changed, len(prices.days)):
+            simulator.step(
+                prices.days[index],
+                day_scores.scores_for(index),
+                PriceRow(prices.close[index], prices.column_of, None if adv is None else adv[index]),
+            )
+            snapshot = {"day": prices.days[index], "hash": hashes[index], "state": simulator.to_state()}
+            line = (json.dumps(snapshot, separators=(",", ":")) + "\n").encode("utf-8")
+            file.write(line)
+            offsets.append(offsets[-1] + len(line))
+            days.append(prices.days[index])
+            day_hashes.append(hashes[index])
+    _write_meta(state_path, universe, days, day_hashes, offsets)
+
+    return IncrementalPaperResult(
+        result=simulator.result(),
+        resumed_from=prices.days[first_changed - 1] if first_changed else None,
+        simulated_days=len(prices.days) - first_changed,
+        total_days=len(prices.days),
+    )
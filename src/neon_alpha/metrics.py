@@ -0,0 +1,262 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+import math
+
+import numpy as np
+import pandas as pd
+
+from .paper import PaperArtifacts, equity_and_drawdown
+from .signal_io import format_day_ordinals
+
+
+TRADING_DAYS_PER_YEAR: int = 252
+
+
+def total_return(daily_returns: np.ndarray) -> float:
+    return float(np.prod(1.0 + daily_returns)) - 1.0
+
+
+def cagr(daily_returns: np.ndarray, periods_per_year: int = TRADING_DAYS_PER_YEAR) -> float:
+    """
+    PaperResult.cagr와 같은 정의(equity ** (periods_per_year / 기간 수) - 1).
+    """
+    equity = total_return(daily_returns) + 1.0
+    periods = max(len(daily_returns), 1)
+    return equity ** (periods_per_year / periods) - 1.0 if equity > 0 else -1.0
+
+
+def max_drawdown(daily_returns: np.ndarray) -> float:
+    if not len(daily_returns):
+        return 0.0
+    _, drawdown = equity_and_drawdown(daily_returns)
+    return max(float(drawdown.max()), 0.0)
+
+
+def volatility(daily_returns: np.ndarray, periods_per_year: int = TRADING_DAYS_PER_YEAR) -> float:
+    if len(daily_returns) < 2:
+        return math.nan
+    return float(np.std(daily_returns, ddof=1)) * math.sqrt(periods_per_year)
+
+
+def sharpe_ratio(daily_returns: np.ndarray, periods_per_year: int = TRADING_DAYS_PER_YEAR) -> float:
+    """
+    무위험 수익률 0 기준 연율화 Sharpe. 변동성이 0이면 NaN.
+    """
+    if len(daily_returns) < 2:
+        return math.nan
+    std = float(np.std(daily_returns, ddof=1))
+    if std == 0.0:
+        return math.nan
+    return float(np.mean(daily_returns)) / std * math.sqrt(periods_per_year)
+
+
+def sortino_ratio(daily_returns: np.ndarray, periods_per_year: int = TRADING_DAYS_PER_YEAR) -> float:
+    if not len(daily_returns):
+        return math.nan
+    downside = np.minimum(daily_returns, 0.0)
+    downside_dev = math.sqrt(float(np.mean(downside**2)))
+    if downside_dev == 0.0:
+        return math.nan
+    return float(np.mean(daily_returns)) / downside_dev * math.sqrt(periods_per_year)
+
+
+def exposure(artifacts: PaperArtifacts) -> np.ndarray:
+    """
+    일별 총 투자 비중(가격이 있는 종목 비중 합).
+    """
+    return np.abs(artifacts.weights).sum(axis=1)
+
+
+def period_returns(artifacts: PaperArtifacts, freq: str = "M") -> pd.DataFrame:
+    """
+    실현일 기준으로 묶은 기간 수익률. freq는 "M"(월) 또는 "Y"(연).
+    """
+    if freq not in ("M", "Y"):
+        raise ValueError(f"Unsupported period frequency: {freq} (choose from M, Y)")
+    dates = format_day_ordinals(artifacts.days)
+    labels = pd.Series(dates, dtype=object).str.slice(0, 7 if freq == "M" else 4)
+    grouped = pd.Series(1.0 + artifacts.daily_returns).groupby(labels.to_numpy(), sort=True).prod() - 1.0
+    return pd.DataFrame({"period": grouped.index.astype(str), "return": grouped.to_numpy()})
+
+
+def summarize(artifacts: PaperArtifacts, periods_per_year: int = TRADING_DAYS_PER_YEAR) -> dict[str, float]:
+    returns = artifacts.daily_returns
+    gross = exposure(artifacts)
+    return {
+        "days": float(len(returns)),
+        "total_return": total_return(returns),
+        "cagr": cagr(returns, periods_per_year),
+        "max_drawdown": max_drawdown(returns),
+        "volatility": volatility(returns, periods_per_year),
+        "sharpe": sharpe_ratio(returns, periods_per_year),
+        "sortino": sortino_ratio(returns, periods_per_year),
+        "hit_rate": float(np.mean(returns > 0)) if len(returns) else math.nan,
+        "avg_exposure": float(gross.mean()) if len(gross) else math.nan,
+        "avg_turnover": float(artifacts.turnover.mean()) if len(artifacts.turnover) else math.nan,
+        "trades": float(artifacts.trades),
+    }
+
+
+@dataclass(frozen=True)
+class _DrawdownSummary:
+    """
+    equity 구간 요약(최고값, 최저값, 구간 내 최대 낙폭). 이어 붙이기가 결합법칙을 만족하는 monoid라
+    두 스택 큐에서 슬라이딩 윈도우의 최대 낙폭을 원소당 상수 시간에 유지할 수 있다.
+    """
+
+    high: float
+    low: float
+    drawdown: float
+
+    def then(self, later: _DrawdownSummary) -> _DrawdownSummary:
+        cross = 1.0 - later.low / self.high if self.high > 0 else 0.0
+        return _DrawdownSummary(
+            high=max(self.high, later.high),
+            low=min(self.low, later.low),
+            drawdown=max(self.drawdown, later.drawdown, cross),
+        )
+
+
+class _DrawdownQueue:
+    """
+    앞에서 빼고 뒤에 넣는 equity 점 큐. front 스택은 (점, 그 점부터 front 끝까지의 요약)을,
+    back은 점들과 전체 요약을 들고 있다. front가 비면 back을 한 번에 옮긴다(분할 상환 O(1)).
+    """
+
+    def __init__(self) -> None:
+        self._front: list[_DrawdownSummary] = []
+        self._back: list[float] = []
+        self._back_summary: _DrawdownSummary | None = None
+
+    def push(self, value: float) -> None:
+        point = _DrawdownSummary(high=value, low=value, drawdown=0.0)
+        self._back.append(value)
+        self._back_summary = point if self._back_summary is None else self._back_summary.then(point)
+
+    def pop(self) -> None:
+        if not self._front:
+            summary: _DrawdownSummary | None = None
+            for value in reversed(self._back):
+                point = _DrawdownSummary(high=value, low=value, drawdown=0.0)
+                summary = point if summary is None else point.then(summary)
+                self._front.append(summary)
+            self._back.clear()
+            self._back_summary = None
+        self._front.pop()
+
+    def max_drawdown(self) -> float:
+        if self._front and self._back_summary is not None:
+            return max(self._front[-1].then(self._back_summary).drawdown, 0.0)
+        if self._front:
+            return max(self._front[-1].drawdown, 0.0)
+        if self._back_summary is not None:
+            return max(self._back_summary.drawdown, 0.0)
+        return 0.0
+
+
+def _window_drawdowns(equity: np.ndarray, starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    """
+    윈도우 [start, end) 수익률 구간의 최대 낙폭. equity 점 equity[start..end]를 큐에 유지하며,
+    시작/끝이 모두 단조 증가하는 윈도우 목록(롤링, 연도별 등)이면 전체 비용이 O(N + 윈도우 수)이다.
+    끝이 뒤로 가는 윈도우를 만나면 그 윈도우부터 큐를 새로 채운다.
+    """
+    order = np.lexsort((ends, starts))
+    result = np.zeros(len(starts), dtype=np.float64)
+    queue = _DrawdownQueue()
+    head = tail = 0  # 큐에 들어 있는 점 [head, tail)
+    for position in order.tolist():
+        start, end = int(starts[position]), int(ends[position]) + 1
+        if start < head or end < tail or tail < start:
+            queue = _DrawdownQueue()
+            head = tail = start
+        while tail < end:
+            queue.push(float(equity[tail]))
+            tail += 1
+        while head < start:
+            queue.pop()
+            head += 1
+        result[position] = queue.max_drawdown()
+    return result
+
+
+def window_metrics(
+    daily_returns: np.ndarray,
+    windows: Sequence[tuple[int, int]],
+    periods_per_year: int = TRADING_DAYS_PER_YEAR,
+) -> pd.DataFrame:
+    """
+    한 수익률 시계열의 여러 구간 [start, end)에 대한 수익률/CAGR/변동성/Sharpe/최대 낙폭.
+    수익률과 분산은 누적곱/누적합으로, 낙폭은 monoid 큐로 구하므로 구간 수 x 길이가 아니라 선형 비용이다.
+    """
+    returns = np.asarray(daily_returns, dtype=np.float64)
+    bounds = np.asarray(windows, dtype=np.int64).reshape(-1, 2)
+    starts, ends = bounds[:, 0], bounds[:, 1]
+    if len(bounds) and (starts.min() < 0 or ends.max() > len(returns) or (ends <= starts).any()):
+        raise ValueError("Windows must satisfy 0 <= start < end <= len(daily_returns).")
+
+    equity = np.concatenate([[1.0], np.cumprod(1.0 + returns)])
+    # 분산은 전체 평균을 뺀 값으로 누적해 상쇄 오차를 줄인다.
+    center = float(returns.mean()) if len(returns) else 0.0
+    shifted = returns - center
+    sums = np.concatenate([[0.0], np.cumsum(shifted)])
+    squares = np.concatenate([[0.0], np.cumsum(shifted * shifted)])
+
+    lengths = (ends - starts).astype(np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        growth = equity[ends] / equity[starts]
+        window_sum = sums[ends] - sums[starts]
+        mean = window_sum / lengths + center
+        variance = (squares[ends] - squares[starts] - window_sum * window_sum / lengths) / (lengths - 1.0)
+        std = np.sqrt(np.maximum(variance, 0.0))
+        sharpe = np.where(std > 0, mean / std * math.sqrt(periods_per_year), np.nan)
+        compounded = np.where(growth > 0, growth ** (periods_per_year / lengths) - 1.0, -1.0)
+
+    return pd.DataFrame(
+        {
+            "start": starts,
+            "end": ends,
+            "days": ends - starts,
+            "total_return": growth - 1.0,
+            "cagr": compounded,
+            "volatility": np.where(lengths > 1, std * math.sqrt(periods_per_year), np.nan),
+            "sharpe": np.where(lengths > 1, sharpe, np.nan),
+            "max_drawdown": _window_drawdowns(equity, starts, ends),
+        }
+    )
+
+
+def rolling_metrics(
+    daily_returns: np.ndarray,
+    window: int = TRADING_DAYS_PER_YEAR,
+    periods_per_year: int = TRADING_DAYS_PER_YEAR,
+) -> pd.DataFrame:
+    count = len(daily_returns) - window + 1
+    if window <= 0 or count <= 0:
+        return window_metrics(daily_returns, [], periods_per_year)
+    starts = np.arange(count)
+    return window_metrics(daily_returns, np.column_stack([starts, starts + window]), periods_per_year)
+
+
+def period_metrics(
+    artifacts: PaperArtifacts,
+    freq: str = "Y",
+    periods_per_year: int = TRADING_DAYS_PER_YEAR,
+) -> pd.DataFrame:
+    """
+    실현일 기준 월("M")/연("Y") 구간별 지표. period 컬럼이 앞에 붙는다.
+    """
+    if freq not in ("M", "Y"):
+        raise ValueError(f"Unsupported period frequency: {freq} (choose from M, Y)")
+    labels = pd.Series(format_day_ordinals(artifacts.days), dtype=object).str.slice(0, 7 if freq == "M" else 4)
+    values = labels.to_numpy()
+    if not len(values):
+        table = window_metrics(artifacts.daily_returns, [], periods_per_year)
+        table.insert(0, "period", pd.Series(dtype=object))
+        return table
+    starts = np.flatnonzero(np.r_[True, values[1:] != values[:-1]])
+    ends = np.r_[starts[1:], len(values)]
+    table = window_metrics(artifacts.daily_returns, np.column_stack([starts, ends]), periods_per_year)
+    table.insert(0, "period", values[starts])
+    return table
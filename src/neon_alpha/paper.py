@@ -1,13 +1,42 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections.abc import Iterable, Iterator, Mapping
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from dataclasses import asdict, dataclass, fields, replace
+from functools import cached_property
+from itertools import chain, compress
+import json
+import math
+from multiprocessing import shared_memory
+import os
 from pathlib import Path
 import csv
 
+import numpy as np
 import pandas as pd
 
-from .risk import RiskLimits, select_targets
-from .signal_io import index_signals_by_day, SignalRow
+from .compression import open_binary
+from .risk import (
+    ConstraintData,
+    EwmaCovariance,
+    RiskLimits,
+    portfolio_weights,
+    risk_weights_batch,
+    select_holdings_batch,
+    select_targets,
+)
+from .signal_io import (
+    parse_signal_date,
+    SignalDay,
+    SignalFrame,
+    SignalRow,
+)
+from .symbols import SYMBOLS
+from .trading_calendar import TradingCalendar, format_day_ordinals, to_day_ordinals
+
+
+SignalInput = list[SignalRow] | SignalFrame | Iterable[SignalDay]
 
 
 @dataclass
@@ -21,79 +50,253 @@ class PaperResult:
 
 
 def load_price_csv(path: str | Path) -> pd.DataFrame:
-    df = pd.read_csv(path)
+    with open_binary(path) as file:
+        df = pd.read_csv(file)
     required = {"date", "symbol", "close"}
     if not required.issubset(set(df.columns)):
         raise ValueError("Price CSV must contain columns: date,symbol,close")
 
-    df["date"] = pd.to_datetime(df["date"]).dt.strftime("%Y-%m-%d")
+    # 날짜는 문자열로 다시 포맷하지 않고 datetime64로 둔다(PriceMatrix가 정수 ordinal로 바꾼다).
+    df["date"] = pd.to_datetime(df["date"]).dt.normalize()
     df["symbol"] = df["symbol"].str.upper()
     df["close"] = pd.to_numeric(df["close"], errors="coerce")
+    if "volume" in df.columns:
+        df["volume"] = pd.to_numeric(df["volume"], errors="coerce")
     df = df.dropna(subset=["close"])
     return df
 
 
-def run_paper_simulation(
-    signal_rows: list[SignalRow],
-    price_df: pd.DataFrame,
-    limits: RiskLimits,
-) -> PaperResult:
-    by_day = index_signals_by_day(signal_rows)
-    price_pivot = price_df.pivot(index="date", columns="symbol", values="close").sort_index()
-    trading_days = list(price_pivot.index)
+class _DayScoreLookup:
+    """
+    거래일 번호 순서대로 하루치 점수({symbol id: score})를 꺼내준다.
+    행 단위 입력은 DayScores로 한 번에 정렬해 두고, SignalDay 스트림은 ordinal 병합(merge-join)으로 따라간다.
+    """
 
-    if len(trading_days) < 2:
-        raise RuntimeError("Need at least two price dates for paper simulation.")
+    def __init__(self, signals: SignalInput, calendar: TradingCalendar) -> None:
+        self.calendar = calendar
+        self.day_scores: DayScores | None = None
+        self._stream: Iterator[SignalDay] | None = None
+        self._pending: SignalDay | None = None
+
+        if isinstance(signals, SignalFrame):
+            self.day_scores = DayScores.from_frame(signals, calendar)
+            return
+        if isinstance(signals, (list, tuple)) and (not signals or not isinstance(signals[0], SignalDay)):
+            self.day_scores = DayScores.from_frame(SignalFrame.from_rows(signals), calendar)
+            return
+        iterator = iter(signals)
+        first = next(iterator, None)
+        if first is None or isinstance(first, SignalDay):
+            self._stream = iterator
+            self._pending = first
+        else:
+            self.day_scores = DayScores.from_frame(SignalFrame.from_rows(chain([first], iterator)), calendar)
+
+    def scores_for(self, index: int) -> dict[int, float]:
+        if self.day_scores is not None:
+            return self.day_scores.scores_for(index)
+
+        ordinal = int(self.calendar.ordinals[index])
+        while self._pending is not None and self._pending.signal_date.toordinal() < ordinal:
+            self._pending = next(self._stream, None)
+        if self._pending is not None and self._pending.signal_date.toordinal() == ordinal:
+            return self._pending.to_id_dict()
+        return {}
+
+
+PAPER_ENGINES: tuple[str, ...] = ("loop", "vector")
+PAPER_CHECKPOINT_VERSION: int = 1
+PAPER_CHECKPOINT_ARRAYS_SUFFIX: str = ".npz"
+PAPER_ARTIFACTS_VERSION: int = 1
+ADV_WINDOW: int = 20
+
+
+@dataclass(frozen=True, eq=False)
+class PriceMatrix:
+    """
+    가격을 (trading day x symbol) 종가 행렬로 한 번만 펼쳐 둔다. 행은 calendar의 거래일 번호,
+    컬럼은 전역 SYMBOLS id로 찾는다. 가격 CSV에 volume 컬럼이 있으면 같은 모양의 거래량 행렬도 둔다.
+    """
+
+    calendar: TradingCalendar
+    ids: np.ndarray
+    close: np.ndarray
+    column_of: np.ndarray
+    volume: np.ndarray | None = None
+
+    @classmethod
+    def from_arrays(
+        cls,
+        days: Iterable,
+        symbols: list[str],
+        close: np.ndarray,
+        volume: np.ndarray | None = None,
+    ) -> PriceMatrix:
+        """
+        days는 오름차순 거래일(ordinal 정수 또는 날짜 문자열)이고 close(와 volume)의 행과 같은 순서여야 한다.
+        """
+        ids = SYMBOLS.intern_many(symbols)
+        column_of = np.full(len(SYMBOLS), -1, dtype=np.int64)
+        column_of[ids] = np.arange(len(ids))
+        calendar = TradingCalendar(ordinals=to_day_ordinals(days))
+        return cls(calendar=calendar, ids=ids, close=close, column_of=column_of, volume=volume)
+
+    @classmethod
+    def from_frame(cls, price_df: pd.DataFrame) -> PriceMatrix:
+        """
+        (date, symbol, close) 행을 정수 인덱스로 바로 흩뿌려 행렬을 만든다. 컬럼은 심볼 이름순.
+        """
+        # 날짜 변환과 정렬은 고유 날짜에만 하고, 행 번호는 factorize 코드로 얻는다.
+        date_codes, date_values = pd.factorize(price_df["date"])
+        day_ordinals, day_rows = np.unique(to_day_ordinals(date_values), return_inverse=True)
+        calendar = TradingCalendar(ordinals=day_ordinals.astype(np.int64))
+        rows = day_rows[date_codes]
+        columns, symbols = pd.factorize(price_df["symbol"].astype(str), sort=True)
+        cells = rows * len(symbols) + columns
+        if len(cells) and np.bincount(cells).max() > 1:
+            raise ValueError("Price data must not contain duplicate (date, symbol) rows.")
+        close = np.full((len(calendar), len(symbols)), np.nan, dtype=np.float64)
+        close[rows, columns] = price_df["close"].to_numpy(dtype=np.float64)
+        volume = None
+        if "volume" in price_df.columns:
+            volume = np.full_like(close, np.nan)
+            volume[rows, columns] = price_df["volume"].to_numpy(dtype=np.float64)
+        return cls.from_arrays(days=calendar.ordinals, symbols=list(symbols), close=close, volume=volume)
+
+    @cached_property
+    def days(self) -> list[str]:
+        """
+        거래일 "YYYY-MM-DD" 라벨(체크포인트/스냅샷/출력용). 정렬과 조회에는 calendar를 쓴다.
+        """
+        return self.calendar.labels()
+
+    @property
+    def symbols(self) -> list[str]:
+        return SYMBOLS.names(self.ids).tolist()
+
+    def date_range(self) -> tuple[date | None, date | None]:
+        return self.calendar.date_range()
+
+    def columns_for(self, symbol_ids: np.ndarray) -> np.ndarray:
+        """
+        SYMBOLS id 배열을 가격 컬럼 번호로 바꾼다. 가격이 없는 종목은 -1.
+        """
+        return _columns_of(symbol_ids, self.column_of)
+
+    def average_dollar_volume(self, window: int = ADV_WINDOW) -> np.ndarray | None:
+        """
+        (days x symbols) 최근 window 거래일(당일 포함) 평균 거래대금(종가 x 거래량). 값이 있는 날만 평균하고
+        하루도 없으면 NaN. 거래량이 없는 가격이면 None.
+        """
+        if self.volume is None:
+            return None
+        dollars = self.close * self.volume
+        valid = np.isfinite(dollars)
+        sums = np.cumsum(np.where(valid, dollars, 0.0), axis=0)
+        counts = np.cumsum(valid, axis=0)
+        sums[window:] -= sums[:-window].copy()
+        counts[window:] -= counts[:-window].copy()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(counts > 0, sums / counts, np.nan)
+
+    def returns(self) -> np.ndarray:
+        """
+        (days-1 x symbols) 일간 수익률. 어느 한쪽 가격이 없거나 p0 <= 0이면 0(현금 취급).
+        """
+        return _close_returns(self.close[:-1], self.close[1:])
+
+
+def _columns_of(symbol_ids: np.ndarray, column_of: np.ndarray) -> np.ndarray:
+    columns = np.full(len(symbol_ids), -1, dtype=np.int64)
+    known = symbol_ids < len(column_of)
+    columns[known] = column_of[symbol_ids[known]]
+    return columns
+
+
+def _close_returns(p0: np.ndarray, p1: np.ndarray) -> np.ndarray:
+    valid = np.isfinite(p0) & np.isfinite(p1) & (p0 > 0)
+    safe_p0 = np.where(valid, p0, 1.0)
+    return np.where(valid, p1 / safe_p0 - 1.0, 0.0)
+
+
+PriceInput = pd.DataFrame | PriceMatrix
+
+
+def as_price_matrix(prices: PriceInput) -> PriceMatrix:
+    return prices if isinstance(prices, PriceMatrix) else PriceMatrix.from_frame(prices)
+
+
+def load_constraint_csv(path: str | Path) -> pd.DataFrame:
+    with open_binary(path) as file:
+        df = pd.read_csv(file)
+    if "symbol" not in df.columns or not {"sector", "beta"} & set(df.columns):
+        raise ValueError("Constraint CSV must contain columns: symbol and sector and/or beta")
+    df["symbol"] = df["symbol"].astype(str).str.upper()
+    if df["symbol"].duplicated().any():
+        raise ValueError("Constraint CSV must not contain duplicate symbols.")
+    if "beta" in df.columns:
+        df["beta"] = pd.to_numeric(df["beta"], errors="coerce")
+    return df
+
+
+def build_constraint_data(
+    prices: PriceMatrix,
+    constraint_df: pd.DataFrame | None = None,
+    adv_window: int = ADV_WINDOW,
+    sector_caps: Mapping[str, float] | None = None,
+) -> ConstraintData:
+    """
+    종목 제약 테이블(symbol, sector, beta)을 prices의 컬럼 순서 배열로 펼치고, 섹터는 조밀한 그룹 코드로 바꾼다.
+    sector_caps(섹터 이름 -> 비중 합 상한)는 섹터 코드 순서 배열로 바꾸고, 없는 섹터는 max_sector_weight를 쓴다.
+    가격에 거래량이 있으면 adv_window일 평균 거래대금 행렬도 미리 계산한다.
+    """
+    sector = np.full(len(prices.ids), -1, dtype=np.int64)
+    beta = np.full(len(prices.ids), np.nan, dtype=np.float64)
+    sectors: list[str] = []
+    if constraint_df is not None and len(constraint_df):
+        columns = prices.columns_for(SYMBOLS.intern_many(constraint_df["symbol"]).astype(np.int64))
+        known = columns >= 0
+        if "sector" in constraint_df.columns:
+            codes, uniques = pd.factorize(constraint_df["sector"], sort=True)
+            sector[columns[known]] = codes[known]
+            sectors = [str(name) for name in uniques]
+        if "beta" in constraint_df.columns:
+            beta[columns[known]] = constraint_df["beta"].to_numpy(dtype=np.float64)[known]
+    caps = None
+    if sector_caps:
+        unknown = sorted(set(sector_caps) - set(sectors))
+        if unknown:
+            raise ValueError(f"Sector caps name sectors missing from the constraint data: {', '.join(unknown)}")
+        if not all(0.0 <= cap <= 1.0 for cap in sector_caps.values()):
+            raise ValueError("Sector caps must be between 0 and 1.")
+        caps = np.array([sector_caps.get(name, math.nan) for name in sectors], dtype=np.float64)
+    return ConstraintData(
+        sector=sector,
+        sectors=sectors,
+        beta=beta,
+        adv=prices.average_dollar_volume(adv_window),
+        sector_caps=caps,
+    )
+
+
+def _check_constraints(limits: RiskLimits, constraints: ConstraintData | None) -> None:
+    if limits.has_constraints and constraints is None:
+        raise ValueError("Sector/liquidity/beta limits need constraint data (see build_constraint_data).")
 
-    equity = 1.0
-    peak = equity
-    max_drawdown = 0.0
-    trades = 0
-
-    current_holdings: set[str] = set()
-    daily_returns: list[float] = []
-
-    for index in range(len(trading_days) - 1):
-        day = trading_days[index]
-        next_day = trading_days[index + 1]
-
-        day_scores = by_day.get(day, {})
-        targets = select_targets(day_scores, current_holdings, limits)
-        target_symbols = set(targets.keys())
-
-        if target_symbols != current_holdings:
-            trades += 1
-        current_holdings = target_symbols
-
-        if not targets:
-            daily_returns.append(0.0)
-            continue
-
-        day_prices = price_pivot.loc[day]
-        next_prices = price_pivot.loc[next_day]
-
-        day_return = 0.0
-        used_weight = 0.0
-        for symbol, weight in targets.items():
-            if symbol not in day_prices or symbol not in next_prices:
-                continue
-            p0 = day_prices[symbol]
-            p1 = next_prices[symbol]
-            if pd.isna(p0) or pd.isna(p1) or p0 <= 0:
-                continue
-            asset_return = (p1 / p0) - 1.0
-            day_return += weight * asset_return
-            used_weight += weight
-
-        # 남는 비중은 현금(수익률 0)으로 처리
-        if used_weight < 1.0:
-            day_return += 0.0
-
-        equity *= 1.0 + day_return
-        peak = max(peak, equity)
-        drawdown = (peak - equity) / peak if peak > 0 else 0.0
-        max_drawdown = max(max_drawdown, drawdown)
-        daily_returns.append(day_return)
+
+def equity_and_drawdown(daily_returns: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    시작 equity 1.0 기준 일별 equity 곡선과 (고점 대비) 낙폭 곡선.
+    """
+    equity_curve = np.cumprod(1.0 + daily_returns)
+    peak = np.maximum.accumulate(np.maximum(equity_curve, 1.0))
+    return equity_curve, (peak - equity_curve) / peak
+
+
+def _result_from_returns(daily_returns: np.ndarray, trades: int) -> PaperResult:
+    equity_curve, drawdown = equity_and_drawdown(daily_returns)
+    equity = float(equity_curve[-1]) if len(equity_curve) else 1.0
+    max_drawdown = max(float(drawdown.max()), 0.0) if len(drawdown) else 0.0
 
     periods = max(len(daily_returns), 1)
     annual_factor = 252 / periods
@@ -109,6 +312,779 @@ def run_paper_simulation(
     )
 
 
+class PriceRow:
+    """
+    가격 행렬의 한 행을 {symbol id: close} 조회로 감싼다(행 전체를 dict로 만들지 않는다).
+    adv는 같은 날의 평균 거래대금 행(유동성 제약용, 없으면 None)이다.
+    """
+
+    __slots__ = ("_row", "_column_of", "adv")
+
+    def __init__(self, row: np.ndarray, column_of: np.ndarray, adv: np.ndarray | None = None) -> None:
+        self._row = row
+        self._column_of = column_of
+        self.adv = adv
+
+    @property
+    def row(self) -> np.ndarray:
+        return self._row
+
+    @property
+    def column_of(self) -> np.ndarray:
+        return self._column_of
+
+    def get(self, symbol_id: int, default: float = math.nan) -> float:
+        if 0 <= symbol_id < len(self._column_of):
+            column = self._column_of[symbol_id]
+            if column >= 0:
+                return float(self._row[column])
+        return default
+
+
+class PaperSimulator:
+    """
+    하루씩 신호와 가격을 받아 진행하는 paper 시뮬레이터. 상태는 equity/peak/낙폭/거래수와
+    보유 종목(비중, 진입 종가)뿐이라 O(positions)이고, 체크포인트로 저장했다가 이어서 돌릴 수 있다.
+
+    day t에 고른 목표 비중의 수익률은 day t+1 가격이 들어올 때 실현되며, 거래 횟수도 그때 센다.
+    """
+
+    def __init__(self, limits: RiskLimits, constraints: ConstraintData | None = None) -> None:
+        _check_constraints(limits, constraints)
+        self.limits = limits
+        self.constraints = constraints
+        self._clips = constraints is not None and constraints.applies(limits)
+        self.equity: float = 1.0
+        self.peak: float = 1.0
+        self.max_drawdown: float = 0.0
+        self.trades: int = 0
+        self.periods: int = 0
+        self.last_day: str | None = None
+        self.holdings: dict[int, float] = {}
+        self.entry_prices: dict[int, float] = {}
+        self._changed: bool = False
+        # weighting != "equal"일 때만 쓰는 공분산 추정기와 그 컬럼 순서의 전날 종가.
+        self.covariance: EwmaCovariance | None = None
+        self.last_close: np.ndarray | None = None
+        self._column_of: np.ndarray | None = None
+        self._covariance_symbols: list[str] | None = None
+
+    def _realize(self, prices: PriceRow | Mapping[int, float]) -> float:
+        if self._changed:
+            self.trades += 1
+        self.periods += 1
+        if not self.holdings:
+            return 0.0
+
+        weights = np.fromiter(self.holdings.values(), dtype=np.float64, count=len(self.holdings))
+        p0 = np.fromiter(self.entry_prices.values(), dtype=np.float64, count=len(self.entry_prices))
+        p1 = np.fromiter(
+            (prices.get(symbol_id, math.nan) for symbol_id in self.holdings),
+            dtype=np.float64,
+            count=len(self.holdings),
+        )
+        valid = np.isfinite(p0) & np.isfinite(p1) & (p0 > 0)
+        # 가격이 없는 비중과 남는 비중은 현금(수익률 0)으로 처리
+        day_return = float(np.dot(weights[valid], p1[valid] / p0[valid] - 1.0))
+
+        self.equity *= 1.0 + day_return
+        self.peak = max(self.peak, self.equity)
+        drawdown = (self.peak - self.equity) / self.peak if self.peak > 0 else 0.0
+        self.max_drawdown = max(self.max_drawdown, drawdown)
+        return day_return
+
+    def step(
+        self,
+        day: str,
+        day_scores: dict[int, float],
+        prices: PriceRow | Mapping[int, float],
+    ) -> float | None:
+        """
+        day의 종가로 전날 목표 비중의 수익률을 실현하고, day 점수로 다음 목표를 고른다.
+        day_scores/prices의 키는 전역 SYMBOLS id. 실현된 일간 수익률(첫날은 None)을 돌려준다.
+        """
+        if self.last_day is not None and day <= self.last_day:
+            raise ValueError(f"Paper simulator days must be increasing: {day} after {self.last_day}")
+        day_return = self._realize(prices) if self.last_day is not None else None
+
+        if self.limits.weighting != "equal":
+            self._update_covariance(prices)
+        if self.limits.has_constraints:
+            day_scores = self._eligible_scores(day_scores, prices)
+        targets = select_targets(day_scores, set(self.holdings), self.limits)
+        if targets and self.limits.weighting != "equal":
+            targets = self._risk_weights(targets, day_scores)
+        if targets and self._clips:
+            targets = self._clip_weights(targets, prices)
+        self._changed = set(targets) != set(self.holdings)
+        self.holdings = targets
+        self.entry_prices = {symbol_id: prices.get(symbol_id, math.nan) for symbol_id in targets}
+        self.last_day = day
+        return day_return
+
+    def _update_covariance(self, prices: PriceRow | Mapping[int, float]) -> None:
+        """
+        오늘 종가로 전날 대비 수익률을 구해 공분산을 rank-1 갱신한다. 컬럼은 가격 행렬 컬럼이고,
+        체크포인트에서 복원한 추정기는 심볼 이름으로 지금 가격 행렬 컬럼에 맞춰 옮긴다.
+        """
+        if not isinstance(prices, PriceRow):
+            raise ValueError("Risk-aware weighting needs price matrix rows (PriceRow) for covariance updates.")
+        row, column_of = prices.row, prices.column_of
+        if self.covariance is None:
+            self.covariance = EwmaCovariance(len(row), self.limits.covariance_halflife)
+        elif self._covariance_symbols is not None or len(self.covariance) != len(row):
+            names = self._covariance_symbols or SYMBOLS.names(self._column_ids()).tolist()
+            ids = SYMBOLS.intern_many(names)
+            new_columns = np.full(len(ids), -1, dtype=np.int64)
+            known = ids < len(column_of)
+            new_columns[known] = column_of[ids[known]]
+            positions = np.full(len(row), -1, dtype=np.int64)
+            kept = np.flatnonzero(new_columns >= 0)
+            positions[new_columns[kept]] = kept
+            self.covariance = self.covariance.reindexed(positions)
+            if self.last_close is not None:
+                self.last_close = np.where(positions >= 0, self.last_close[np.maximum(positions, 0)], np.nan)
+            self._covariance_symbols = None
+        self._column_of = column_of
+        if self.last_close is not None:
+            self.covariance.update(_close_returns(self.last_close, row))
+        self.last_close = np.array(row, dtype=np.float64)
+
+    def _column_ids(self) -> np.ndarray:
+        ids = np.flatnonzero(self._column_of >= 0)
+        return ids[np.argsort(self._column_of[ids])]
+
+    def _risk_weights(self, targets: dict[int, float], day_scores: dict[int, float]) -> dict[int, float]:
+        """
+        고른 종목(SYMBOLS id 순)에 limits.weighting 비중을 매긴다. 분산을 못 구하면 select_targets의 동일 비중.
+        """
+        symbol_ids = sorted(targets)
+        columns = _columns_of(np.asarray(symbol_ids, dtype=np.int64), self._column_of)
+        if (columns < 0).any():
+            return targets
+        expected = np.asarray([day_scores.get(symbol_id, math.nan) for symbol_id in symbol_ids])
+        sized = portfolio_weights(self.covariance.covariance(columns), self.limits, expected)
+        if sized is None:
+            return targets
+        return dict(zip(symbol_ids, sized.tolist()))
+
+    def _eligible_scores(
+        self,
+        day_scores: dict[int, float],
+        prices: PriceRow | Mapping[int, float],
+    ) -> dict[int, float]:
+        """
+        베타 범위 밖 종목을 후보에서 뺀다. 판정은 그날 종목 전체에 대한 배열 마스크 한 번이다.
+        """
+        if not isinstance(prices, PriceRow):
+            raise ValueError("Sector/liquidity/beta limits need price matrix rows (PriceRow).")
+        symbol_ids = np.fromiter(day_scores, dtype=np.int64, count=len(day_scores))
+        keep = self.constraints.eligible(_columns_of(symbol_ids, prices.column_of), self.limits)
+        return day_scores if keep.all() else dict(compress(day_scores.items(), keep.tolist()))
+
+    def _clip_weights(self, targets: dict[int, float], prices: PriceRow) -> dict[int, float]:
+        symbol_ids = sorted(targets)
+        columns = _columns_of(np.asarray(symbol_ids, dtype=np.int64), prices.column_of)
+        weights = np.asarray([targets[symbol_id] for symbol_id in symbol_ids], dtype=np.float64)
+        adv = None if prices.adv is None else prices.adv[None, :]
+        clipped = self.constraints.clip(weights[None, :], columns, adv, self.limits)[0]
+        return dict(zip(symbol_ids, clipped.tolist()))
+
+    def replay(self, signal_rows: SignalInput, prices: PriceMatrix) -> PaperSimulator:
+        """
+        prices의 거래일 중 last_day 이후만 순서대로 step 한다(체크포인트에서 이어 돌릴 때도 같다).
+        """
+        lookup = _DayScoreLookup(signal_rows, prices.calendar)
+        first = 0
+        if self.last_day is not None:
+            last_ordinal = parse_signal_date(self.last_day).toordinal()
+            first = int(prices.calendar.next_index(np.asarray([last_ordinal]), inclusive=False)[0])
+        adv = None if self.constraints is None else self.constraints.adv
+        for index in range(first, len(prices.calendar)):
+            row = PriceRow(prices.close[index], prices.column_of, None if adv is None else adv[index])
+            self.step(prices.days[index], lookup.scores_for(index), row)
+        return self
+
+    def result(self) -> PaperResult:
+        periods = max(self.periods, 1)
+        annual_factor = 252 / periods
+        cagr = (self.equity ** annual_factor) - 1.0 if self.equity > 0 else -1.0
+        return PaperResult(
+            total_return=self.equity - 1.0,
+            cagr=cagr,
+            max_drawdown=self.max_drawdown,
+            trades=self.trades,
+            start_equity=1.0,
+            end_equity=self.equity,
+        )
+
+    def to_state(self) -> dict:
+        """
+        JSON으로 쓸 수 있는 상태. 종목은 프로세스마다 다른 id 대신 심볼 이름으로 쓴다.
+        공분산 추정기가 있으면 가격 컬럼 순서의 심볼 이름과 함께 넣되, 행렬(종목 수의 제곱 크기)과
+        전날 종가는 numpy 배열 그대로 두어 save_checkpoint가 바이너리 sidecar로 따로 쓴다.
+        """
+        state = {
+            "last_day": self.last_day,
+            "equity": self.equity,
+            "peak": self.peak,
+            "max_drawdown": self.max_drawdown,
+            "trades": self.trades,
+            "periods": self.periods,
+            "changed": self._changed,
+            "holdings": [
+                {"symbol": SYMBOLS[symbol_id], "weight": weight, "entry_price": self.entry_prices[symbol_id]}
+                for symbol_id, weight in self.holdings.items()
+            ],
+        }
+        if self.covariance is not None:
+            state["covariance"] = {
+                "symbols": self._covariance_symbols or SYMBOLS.names(self._column_ids()).tolist(),
+                "matrix": self.covariance.matrix.copy(),
+                "weight": self.covariance.weight,
+                "count": self.covariance.count,
+                "last_close": self.last_close.copy(),
+            }
+        return state
+
+    @classmethod
+    def from_state(cls, state: dict, limits: RiskLimits, constraints: ConstraintData | None = None) -> PaperSimulator:
+        simulator = cls(limits, constraints)
+        simulator.last_day = state["last_day"]
+        simulator.equity = float(state["equity"])
+        simulator.peak = float(state["peak"])
+        simulator.max_drawdown = float(state["max_drawdown"])
+        simulator.trades = int(state["trades"])
+        simulator.periods = int(state["periods"])
+        simulator._changed = bool(state["changed"])
+        for holding in state["holdings"]:
+            symbol_id = SYMBOLS.intern(holding["symbol"])
+            simulator.holdings[symbol_id] = float(holding["weight"])
+            simulator.entry_prices[symbol_id] = float(holding["entry_price"])
+        if "covariance" in state:
+            saved = state["covariance"]
+            simulator.covariance = EwmaCovariance(len(saved["symbols"]), limits.covariance_halflife)
+            simulator.covariance.matrix[...] = np.asarray(saved["matrix"], dtype=np.float64).reshape(
+                simulator.covariance.matrix.shape
+            )
+            simulator.covariance.weight = float(saved["weight"])
+            simulator.covariance.count = int(saved["count"])
+            simulator.last_close = np.array(saved["last_close"], dtype=np.float64)
+            simulator._covariance_symbols = list(saved["symbols"])
+        return simulator
+
+    def save_checkpoint(self, path: str | Path) -> None:
+        """
+        상태는 JSON으로, 공분산 행렬/전날 종가는 옆의 <checkpoint>.npz로 쓴다. 두 파일에 같은 토큰을 넣어
+        한쪽만 바뀐 조합을 읽지 않게 한다.
+        """
+        checkpoint_path = Path(path)
+        checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {"version": PAPER_CHECKPOINT_VERSION, "limits": asdict(self.limits), **self.to_state()}
+        covariance = payload.get("covariance")
+        if covariance is not None:
+            token = os.urandom(8).hex()
+            arrays_path = checkpoint_arrays_path(checkpoint_path)
+            temp_arrays = arrays_path.with_name(arrays_path.name + ".tmp")
+            with temp_arrays.open("wb") as file:
+                np.savez(
+                    file,
+                    matrix=covariance.pop("matrix"),
+                    last_close=covariance.pop("last_close"),
+                    token=np.asarray(token),
+                )
+            os.replace(temp_arrays, arrays_path)
+            covariance["arrays_token"] = token
+        temp_path = checkpoint_path.with_name(checkpoint_path.name + ".tmp")
+        temp_path.write_text(json.dumps(payload, indent=1), encoding="utf-8")
+        os.replace(temp_path, checkpoint_path)
+
+    @classmethod
+    def load_checkpoint(
+        cls,
+        path: str | Path,
+        limits: RiskLimits,
+        constraints: ConstraintData | None = None,
+    ) -> PaperSimulator:
+        payload = json.loads(Path(path).read_text(encoding="utf-8"))
+        if payload.get("version") != PAPER_CHECKPOINT_VERSION:
+            raise ValueError(f"Unsupported paper checkpoint version: {path}")
+        # 나중에 추가된 한도 필드는 기본값으로 보고 비교한다.
+        if {**asdict(RiskLimits()), **payload["limits"]} != asdict(limits):
+            raise ValueError(f"Paper checkpoint was created with different risk limits: {path}")
+        covariance = payload.get("covariance")
+        if covariance is not None and "matrix" not in covariance:
+            arrays_path = checkpoint_arrays_path(path)
+            if not arrays_path.exists():
+                raise ValueError(f"Paper checkpoint covariance file is missing: {arrays_path}")
+            with np.load(arrays_path) as arrays:
+                if str(arrays["token"]) != covariance.get("arrays_token"):
+                    raise ValueError(f"Paper checkpoint covariance file does not match the checkpoint: {arrays_path}")
+                covariance["matrix"] = arrays["matrix"]
+                covariance["last_close"] = arrays["last_close"]
+        return cls.from_state(payload, limits, constraints)
+
+
+def checkpoint_arrays_path(path: str | Path) -> Path:
+    checkpoint_path = Path(path)
+    return checkpoint_path.with_name(checkpoint_path.name + PAPER_CHECKPOINT_ARRAYS_SUFFIX)
+
+
+@dataclass(frozen=True, eq=False)
+class DayScores:
+    """
+    trading day별 점수를 CSR 형태(offsets, ids, scores)로 펼친 것. day i의 점수는 [offsets[i], offsets[i+1]).
+    순수 배열이라 프로세스 사이에 그대로 공유할 수 있다.
+    """
+
+    offsets: np.ndarray
+    ids: np.ndarray
+    scores: np.ndarray
+
+    @classmethod
+    def build(cls, signal_rows: SignalInput, calendar: TradingCalendar) -> DayScores:
+        lookup = _DayScoreLookup(signal_rows, calendar)
+        if lookup.day_scores is not None:
+            return lookup.day_scores
+        day_ids: list[np.ndarray] = []
+        day_scores: list[np.ndarray] = []
+        for index in range(len(calendar)):
+            scores = lookup.scores_for(index)
+            day_ids.append(np.fromiter(scores.keys(), dtype=np.int64, count=len(scores)))
+            day_scores.append(np.fromiter(scores.values(), dtype=np.float64, count=len(scores)))
+        counts = np.fromiter((len(ids) for ids in day_ids), dtype=np.int64, count=len(calendar))
+        return cls(
+            offsets=np.concatenate([[0], np.cumsum(counts)]).astype(np.int64),
+            ids=np.concatenate(day_ids) if day_ids else np.empty(0, dtype=np.int64),
+            scores=np.concatenate(day_scores) if day_scores else np.empty(0, dtype=np.float64),
+        )
+
+    @classmethod
+    def from_frame(cls, frame: SignalFrame, calendar: TradingCalendar) -> DayScores:
+        """
+        신호 날짜를 calendar의 거래일 번호로 바꿔 정수 정렬만으로 CSR을 만든다. 거래일이 아닌 날의 신호는 버린다.
+        같은 날 같은 종목이 여러 번 나오면 dict에 넣은 것과 같게 처음 나온 순서에 마지막 점수를 쓴다.
+        """
+        positions = calendar.index_of(frame.days)
+        keep = positions >= 0
+        order = np.argsort(positions[keep], kind="stable")
+        positions = positions[keep][order]
+        ids = frame.symbol_ids()[keep][order].astype(np.int64)
+        scores = frame.scores[keep][order].astype(np.float64)
+
+        if not len(ids):
+            return cls(
+                offsets=np.zeros(len(calendar) + 1, dtype=np.int64),
+                ids=np.empty(0, dtype=np.int64),
+                scores=np.empty(0, dtype=np.float64),
+            )
+        cells = positions * (int(ids.max()) + 1) + ids
+        by_cell = np.argsort(cells, kind="stable")
+        sorted_cells = cells[by_cell]
+        starts = np.flatnonzero(np.r_[True, sorted_cells[1:] != sorted_cells[:-1]])
+        first = by_cell[starts]
+        last = by_cell[np.r_[starts[1:], len(cells)] - 1]
+        by_appearance = np.argsort(first, kind="stable")
+        first, last = first[by_appearance], last[by_appearance]
+
+        counts = np.bincount(positions[first], minlength=len(calendar))
+        return cls(
+            offsets=np.concatenate([[0], np.cumsum(counts)]).astype(np.int64),
+            ids=ids[first],
+            scores=scores[last],
+        )
+
+    def scores_for(self, index: int) -> dict[int, float]:
+        begin, finish = int(self.offsets[index]), int(self.offsets[index + 1])
+        return dict(zip(self.ids[begin:finish].tolist(), self.scores[begin:finish].tolist()))
+
+
+def build_weight_matrix(
+    day_scores: DayScores,
+    column_of: np.ndarray,
+    n_columns: int,
+    limits: RiskLimits,
+    out: np.ndarray | None = None,
+    returns: np.ndarray | None = None,
+    constraints: ConstraintData | None = None,
+) -> tuple[np.ndarray, int]:
+    """
+    (days-1 x symbols) 목표 비중 행렬과 거래 횟수를 만든다. 상위 종목 선택은 risk.select_holdings_batch로
+    모든 날짜를 한 번에 하고, 전날 보유에 의존하는 회전율 규칙만 정수 코드 스캔으로 순서대로 적용한다.
+    out을 주면 0으로 채워진 그 배열(예: 전략 텐서의 한 면)에 바로 쓴다.
+    limits.weighting이 equal이 아니면 공분산 추정에 (days-1 x symbols) 수익률 행렬 returns가 필요하다.
+    섹터/유동성/베타 제약은 constraints 배열로 후보 점수 행렬을 마스크하고 비중 행렬을 한 번에 자른다.
+    """
+    periods = len(day_scores.offsets) - 2
+    _, columns, holdings, code_weights = _code_weights(day_scores, column_of, periods, limits, returns, constraints)
+
+    # 보유 집합이 전날과 달라진 날을 거래로 센다(가격이 없는 종목도 보유로 본다).
+    changed = np.concatenate([holdings[:1].any(axis=1), (holdings[1:] != holdings[:-1]).any(axis=1)])
+    trades = int(np.count_nonzero(changed))
+
+    weights = np.zeros((periods, n_columns), dtype=np.float64) if out is None else out
+    priced = columns >= 0
+    weights[:, columns[priced]] = code_weights[:, priced]
+    return weights, trades
+
+
+def _code_weights(
+    day_scores: DayScores,
+    column_of: np.ndarray,
+    periods: int,
+    limits: RiskLimits,
+    returns: np.ndarray | None = None,
+    constraints: ConstraintData | None = None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    앞쪽 periods개 거래일의 목표를 신호에 나온 종목의 조밀한 코드 공간에서 구한다.
+    (코드별 SYMBOLS id, 코드별 가격 컬럼, 보유 여부 행렬, 비중 행렬)을 돌려준다.
+    """
+    if limits.weighting != "equal" and returns is None:
+        raise ValueError(f"Weighting {limits.weighting} needs the returns matrix.")
+    _check_constraints(limits, constraints)
+    end = int(day_scores.offsets[periods])
+    ids = day_scores.ids[:end]
+    rows = np.repeat(np.arange(periods), np.diff(day_scores.offsets[: periods + 1]))
+
+    # 신호에 나온 종목만 조밀한 코드로 바꿔 (periods x 코드) 점수 행렬을 만든다(가격 없는 종목도 포함).
+    present = np.zeros(int(ids.max()) + 1 if len(ids) else 0, dtype=bool)
+    present[ids] = True
+    code_ids = np.flatnonzero(present)
+    code_of = np.cumsum(present) - 1
+    codes = code_of[ids]
+    scores = np.full((periods, len(code_ids)), np.nan, dtype=np.float64)
+    scores[rows, codes] = day_scores.scores[:end]
+    # 같은 점수끼리는 그날 신호에 먼저 나온 종목이 앞선다(select_targets와 같은 규칙).
+    priority = np.zeros((periods, len(code_ids)), dtype=np.int64)
+    priority[rows, codes] = np.arange(end) - day_scores.offsets[rows]
+
+    columns = _columns_of(code_ids, column_of)
+    if limits.has_constraints:
+        scores[:, ~constraints.eligible(columns, limits)] = np.nan
+
+    holdings = select_holdings_batch(scores, limits, priority)
+    code_weights = risk_weights_batch(holdings, columns, returns, scores, limits)
+    if constraints is not None and constraints.applies(limits):
+        adv = None if constraints.adv is None else constraints.adv[:periods]
+        code_weights = constraints.clip(code_weights, columns, adv, limits)
+    return code_ids, columns, holdings, code_weights
+
+
+def _simulate_matrix(
+    day_scores: DayScores,
+    column_of: np.ndarray,
+    returns: np.ndarray,
+    limits: RiskLimits,
+    constraints: ConstraintData | None = None,
+) -> PaperResult:
+    weights, trades = build_weight_matrix(
+        day_scores, column_of, returns.shape[1], limits, returns=returns, constraints=constraints
+    )
+    daily_returns = np.einsum("ij,ij->i", weights, returns)
+    return _result_from_returns(daily_returns, trades)
+
+
+def _simulate_vector(
+    signal_rows: SignalInput,
+    prices: PriceMatrix,
+    limits: RiskLimits,
+    constraints: ConstraintData | None = None,
+) -> PaperResult:
+    day_scores = DayScores.build(signal_rows, prices.calendar)
+    return _simulate_matrix(day_scores, prices.column_of, prices.returns(), limits, constraints)
+
+
+def _simulate_strategies(
+    signal_sets: Mapping[str, SignalInput],
+    prices: PriceMatrix,
+    limits: RiskLimits,
+    constraints: ConstraintData | None = None,
+) -> dict[str, PaperResult]:
+    """
+    전략별 비중을 (strategies x days-1 x symbols) 텐서 한 개에 채우고, 한 번 계산한 수익률 행렬과
+    einsum 한 번으로 전략별 일간 수익률을 구한다.
+    """
+    names = list(signal_sets)
+    returns = prices.returns()
+    weights = np.zeros((len(names), *returns.shape), dtype=np.float64)
+    trades: list[int] = []
+    for strategy, name in enumerate(names):
+        day_scores = DayScores.build(signal_sets[name], prices.calendar)
+        _, count = build_weight_matrix(
+            day_scores,
+            prices.column_of,
+            returns.shape[1],
+            limits,
+            out=weights[strategy],
+            returns=returns,
+            constraints=constraints,
+        )
+        trades.append(count)
+    daily_returns = np.einsum("sij,ij->si", weights, returns)
+    return {
+        name: _result_from_returns(strategy_returns, count)
+        for name, strategy_returns, count in zip(names, daily_returns, trades)
+    }
+
+
+def run_paper_simulation(
+    signal_rows: SignalInput | Mapping[str, SignalInput],
+    price_df: PriceInput,
+    limits: RiskLimits,
+    engine: str = "loop",
+    constraints: ConstraintData | None = None,
+) -> PaperResult | dict[str, PaperResult]:
+    """
+    signal_rows는 SignalRow 리스트, SignalFrame, 또는 날짜순 SignalDay 스트림(iter_signal_days)을 받는다.
+    price_df는 load_price_csv 결과 또는 이미 펼친 PriceMatrix(neon_alpha.price_cache)이다.
+    engine="vector"는 (days x symbols) 비중/수익률 행렬로 수익률, equity, drawdown을 한 번에 계산한다.
+
+    signal_rows가 {전략 이름: 신호} 매핑이면 가격/수익률을 한 번만 만들고 전략 텐서로 함께 평가해
+    {전략 이름: PaperResult}를 돌려준다(engine과 관계없이 행렬 엔진).
+    섹터/유동성/베타 한도를 쓰면 prices로 만든 constraints(build_constraint_data)가 필요하다.
+    """
+    if engine not in PAPER_ENGINES:
+        raise ValueError(f"Unsupported paper engine: {engine} (choose from {', '.join(PAPER_ENGINES)})")
+
+    prices = as_price_matrix(price_df)
+    if len(prices.calendar) < 2:
+        raise RuntimeError("Need at least two price dates for paper simulation.")
+
+    if isinstance(signal_rows, Mapping):
+        return _simulate_strategies(signal_rows, prices, limits, constraints)
+    if engine == "vector":
+        return _simulate_vector(signal_rows, prices, limits, constraints)
+    return PaperSimulator(limits, constraints).replay(signal_rows, prices).result()
+
+
+@dataclass(frozen=True, eq=False)
+class PaperArtifacts:
+    """
+    paper 실행의 일별 결과. i번째 값은 days[i-1] 종가로 잡은 비중이 days[i] 종가에서 실현된 결과이며,
+    days는 실현일(date.toordinal)이다. turnover는 전날 대비 비중 변화 절댓값 합(양방향)이다.
+    """
+
+    days: np.ndarray
+    symbols: list[str]
+    daily_returns: np.ndarray
+    equity: np.ndarray
+    drawdown: np.ndarray
+    weights: np.ndarray
+    turnover: np.ndarray
+    trades: int
+
+    def __len__(self) -> int:
+        return len(self.days)
+
+    def result(self) -> PaperResult:
+        return _result_from_returns(self.daily_returns, self.trades)
+
+    def save(self, path: str | Path) -> None:
+        artifacts_path = Path(path)
+        artifacts_path.parent.mkdir(parents=True, exist_ok=True)
+        with artifacts_path.open("wb") as file:
+            np.savez_compressed(
+                file,
+                version=np.int32(PAPER_ARTIFACTS_VERSION),
+                days=self.days.astype(np.int32),
+                symbols=np.asarray(self.symbols, dtype=str),
+                daily_returns=self.daily_returns,
+                equity=self.equity,
+                drawdown=self.drawdown,
+                weights=self.weights.astype(np.float32),
+                turnover=self.turnover,
+                trades=np.int64(self.trades),
+            )
+
+    @classmethod
+    def load(cls, path: str | Path) -> PaperArtifacts:
+        with np.load(path, allow_pickle=False) as payload:
+            if int(payload["version"]) != PAPER_ARTIFACTS_VERSION:
+                raise ValueError(f"Unsupported paper artifacts version: {path}")
+            return cls(
+                days=payload["days"],
+                symbols=payload["symbols"].tolist(),
+                daily_returns=payload["daily_returns"],
+                equity=payload["equity"],
+                drawdown=payload["drawdown"],
+                weights=payload["weights"],
+                turnover=payload["turnover"],
+                trades=int(payload["trades"]),
+            )
+
+
+def build_paper_artifacts(
+    signal_rows: SignalInput,
+    price_df: PriceInput,
+    limits: RiskLimits,
+    constraints: ConstraintData | None = None,
+) -> PaperArtifacts:
+    """
+    행렬 엔진으로 한 번 시뮬레이션하고 일별 수익률/equity/낙폭/비중/turnover를 남긴다.
+    artifacts.result()는 run_paper_simulation(engine="vector")와 같다.
+    """
+    prices = as_price_matrix(price_df)
+    if len(prices.calendar) < 2:
+        raise RuntimeError("Need at least two price dates for paper simulation.")
+
+    day_scores = DayScores.build(signal_rows, prices.calendar)
+    returns = prices.returns()
+    weights, trades = build_weight_matrix(
+        day_scores, prices.column_of, len(prices.ids), limits, returns=returns, constraints=constraints
+    )
+    daily_returns = np.einsum("ij,ij->i", weights, returns)
+    equity, drawdown = equity_and_drawdown(daily_returns)
+    turnover = np.abs(np.diff(weights, axis=0, prepend=0.0)).sum(axis=1)
+    return PaperArtifacts(
+        days=prices.calendar.ordinals[1:],
+        symbols=prices.symbols,
+        daily_returns=daily_returns,
+        equity=equity,
+        drawdown=drawdown,
+        weights=weights,
+        turnover=turnover,
+        trades=trades,
+    )
+
+
+def build_target_schedule(
+    signal_rows: SignalInput,
+    price_df: PriceInput,
+    limits: RiskLimits,
+    constraints: ConstraintData | None = None,
+) -> pd.DataFrame:
+    """
+    모든 거래일의 목표 비중을 (date, symbol, weight) 행으로 만든다. day의 행은 PaperSimulator가 그날 종가로
+    고르는 목표와 같다(가격 없는 종목 포함). 보유가 없는 날은 symbol이 빈 행 하나(weight 0)로 전량 현금을 표시한다.
+    LEAN 알고리즘은 이 표를 날짜별 dict로 읽어 리밸런싱 때 조회만 한다.
+    """
+    prices = as_price_matrix(price_df)
+    if not len(prices.calendar):
+        raise RuntimeError("Need at least one price date for a target schedule.")
+
+    day_scores = DayScores.build(signal_rows, prices.calendar)
+    returns = prices.returns() if limits.weighting != "equal" else None
+    code_ids, _, holdings, code_weights = _code_weights(
+        day_scores, prices.column_of, len(prices.calendar), limits, returns, constraints
+    )
+    rows, codes = np.nonzero(holdings)
+    cash_days = np.flatnonzero(~holdings.any(axis=1))
+    frame = pd.DataFrame(
+        {
+            "day": np.concatenate([rows, cash_days]),
+            "symbol": np.concatenate([SYMBOLS.names(code_ids[codes]), np.full(len(cash_days), "", dtype=object)]),
+            "weight": np.concatenate([code_weights[rows, codes], np.zeros(len(cash_days))]),
+        }
+    ).sort_values(["day", "symbol"], ignore_index=True)
+    dates = format_day_ordinals(prices.calendar.ordinals[frame["day"].to_numpy()]) if len(frame) else []
+    frame.insert(0, "date", dates)
+    return frame.drop(columns="day")
+
+
+def save_target_schedule(path: str | Path, schedule: pd.DataFrame) -> None:
+    output_path = Path(path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    schedule.to_csv(output_path, index=False)
+
+
+_GRID_STATE: dict[str, object] = {}
+
+
+def _share_array(array: np.ndarray) -> tuple[shared_memory.SharedMemory, tuple[str, tuple[int, ...], str]]:
+    block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[...] = array
+    return block, (block.name, array.shape, array.dtype.str)
+
+
+def _init_grid_worker(
+    specs: dict[str, tuple[str, tuple[int, ...], str]],
+    column_of: np.ndarray,
+    constraints: ConstraintData | None = None,
+) -> None:
+    """
+    프로세스 풀 워커 초기화: 공유 메모리의 수익률 행렬과 일별 점수 배열(과 평균 거래대금 행렬)을 복사 없이 붙인다.
+    """
+    blocks = {name: shared_memory.SharedMemory(name=spec[0]) for name, spec in specs.items()}
+    arrays = {
+        name: np.ndarray(specs[name][1], dtype=np.dtype(specs[name][2]), buffer=block.buf)
+        for name, block in blocks.items()
+    }
+    _GRID_STATE["blocks"] = blocks
+    _GRID_STATE["returns"] = arrays["returns"]
+    _GRID_STATE["day_scores"] = DayScores(offsets=arrays["offsets"], ids=arrays["ids"], scores=arrays["scores"])
+    _GRID_STATE["column_of"] = column_of
+    if constraints is not None and "adv" in arrays:
+        constraints = replace(constraints, adv=arrays["adv"])
+    _GRID_STATE["constraints"] = constraints
+
+
+def _run_grid_chunk(limits_chunk: list[RiskLimits]) -> list[PaperResult]:
+    day_scores = _GRID_STATE["day_scores"]
+    column_of = _GRID_STATE["column_of"]
+    returns = _GRID_STATE["returns"]
+    constraints = _GRID_STATE["constraints"]
+    return [_simulate_matrix(day_scores, column_of, returns, limits, constraints) for limits in limits_chunk]
+
+
+def run_paper_simulation_grid(
+    signal_rows: SignalInput,
+    price_df: PriceInput,
+    limits_list: Iterable[RiskLimits],
+    max_workers: int | None = None,
+    constraints: ConstraintData | None = None,
+) -> pd.DataFrame:
+    """
+    가격 pivot, 수익률 행렬, 일별 점수를 한 번만 만들고 여러 RiskLimits 조합을 행렬 엔진으로 평가한다.
+    max_workers가 1보다 크면 수익률 행렬과 점수 배열을 공유 메모리에 올려 프로세스 풀에서 나눠 돌린다.
+    결과는 조합별 RiskLimits 컬럼 + PaperResult 컬럼 테이블.
+    """
+    limits_list = list(limits_list)
+    prices = as_price_matrix(price_df)
+    if len(prices.calendar) < 2:
+        raise RuntimeError("Need at least two price dates for paper simulation.")
+
+    day_scores = DayScores.build(signal_rows, prices.calendar)
+    returns = prices.returns()
+    workers = min(max_workers or os.cpu_count() or 1, len(limits_list))
+
+    if workers <= 1:
+        results = [
+            _simulate_matrix(day_scores, prices.column_of, returns, limits, constraints) for limits in limits_list
+        ]
+    else:
+        shared = {
+            "returns": _share_array(returns),
+            "offsets": _share_array(day_scores.offsets),
+            "ids": _share_array(day_scores.ids),
+            "scores": _share_array(day_scores.scores),
+        }
+        worker_constraints = constraints
+        if constraints is not None and constraints.adv is not None:
+            shared["adv"] = _share_array(np.ascontiguousarray(constraints.adv))
+            worker_constraints = replace(constraints, adv=None)
+        try:
+            chunks = [limits_list[worker::workers] for worker in range(workers)]
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_grid_worker,
+                initargs=({name: spec for name, (_, spec) in shared.items()}, prices.column_of, worker_constraints),
+            ) as executor:
+                chunk_results = list(executor.map(_run_grid_chunk, chunks))
+        finally:
+            for block, _ in shared.values():
+                block.close()
+                block.unlink()
+        results = [None] * len(limits_list)
+        for worker, chunk_result in enumerate(chunk_results):
+            results[worker::workers] = chunk_result
+
+    return pd.DataFrame(
+        [{**asdict(limits), **asdict(result)} for limits, result in zip(limits_list, results)],
+        columns=[field.name for field in fields(RiskLimits)] + [field.name for field in fields(PaperResult)],
+    )
+
+
 def save_result_csv(path: str | Path, result: PaperResult) -> None:
     output_path = Path(path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+import hashlib
+import json
+import os
+from pathlib import Path
+import shutil
+import time
+import uuid
+
+import numpy as np
+
+from .paper import PriceMatrix, load_price_csv
+
+
+PRICE_CACHE_ENV: str = "NEON_ALPHA_PRICE_CACHE"
+PRICE_CACHE_VERSION: int = 2
+PRICE_CACHE_INDEX_NAME: str = "_index.json"
+DEFAULT_PRICE_CACHE_DIR: Path = Path.home() / ".cache" / "neon_alpha" / "prices"
+DEFAULT_PRICE_CACHE_MAX_BYTES: int = 2 * 1024**3
+HASH_BLOCK_SIZE: int = 1 << 20
+
+
+@dataclass(frozen=True)
+class PriceCacheEntry:
+    key: str
+    source: str
+    source_size: int
+    source_mtime_ns: int
+    nbytes: int
+    last_access: float
+
+
+def default_price_cache_dir() -> Path:
+    configured = os.environ.get(PRICE_CACHE_ENV)
+    return Path(configured).expanduser() if configured else DEFAULT_PRICE_CACHE_DIR
+
+
+def _content_hash(path: Path) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    with path.open("rb") as file:
+        while block := file.read(HASH_BLOCK_SIZE):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _atomic_write_json(path: Path, payload: dict) -> None:
+    temp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex[:8]}.tmp")
+    temp_path.write_text(json.dumps(payload, indent=1), encoding="utf-8")
+    os.replace(temp_path, path)
+
+
+class PriceCache:
+    """
+    load_price_csv + pivot 결과(종가/거래량 행렬, 거래일, 심볼 목록)를 .npy로 저장해 두고 mmap으로 다시 여는 캐시.
+
+    키는 원본 경로/크기/mtime이고, 이 셋이 바뀌면 내용 해시로 다시 확인한다(내용이 같으면 재사용).
+    전체 크기가 max_bytes를 넘으면 가장 오래 쓰지 않은 항목부터 지운다(LRU).
+    """
+
+    def __init__(self, root: str | Path | None = None, max_bytes: int = DEFAULT_PRICE_CACHE_MAX_BYTES) -> None:
+        self.root = Path(root) if root is not None else default_price_cache_dir()
+        self.max_bytes = max_bytes
+
+    def _load_index(self) -> dict[str, dict]:
+        index_path = self.root / PRICE_CACHE_INDEX_NAME
+        if not index_path.exists():
+            return {}
+        try:
+            payload = json.loads(index_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if payload.get("version") != PRICE_CACHE_VERSION:
+            return {}
+        return payload.get("entries", {})
+
+    def _save_index(self, entries: dict[str, dict]) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        _atomic_write_json(self.root / PRICE_CACHE_INDEX_NAME, {"version": PRICE_CACHE_VERSION, "entries": entries})
+
+    def entries(self) -> list[PriceCacheEntry]:
+        return sorted(
+            (PriceCacheEntry(key=key, **entry) for key, entry in self._load_index().items()),
+            key=lambda entry: entry.last_access,
+            reverse=True,
+        )
+
+    def total_bytes(self) -> int:
+        return sum(entry.nbytes for entry in self.entries())
+
+    def _find(self, entries: dict[str, dict], source: str, size: int, mtime_ns: int) -> str | None:
+        for key, entry in entries.items():
+            if entry["source"] == source and entry["source_size"] == size and entry["source_mtime_ns"] == mtime_ns:
+                return key
+        return None
+
+    def _read_entry(self, key: str) -> PriceMatrix | None:
+        entry_dir = self.root / key
+        try:
+            close = np.load(entry_dir / "close.npy", mmap_mode="r")
+            days = np.load(entry_dir / "days.npy")
+            symbols = json.loads((entry_dir / "symbols.json").read_text(encoding="utf-8"))
+            volume_path = entry_dir / "volume.npy"
+            volume = np.load(volume_path, mmap_mode="r") if volume_path.exists() else None
+        except (OSError, ValueError):
+            return None
+        return PriceMatrix.from_arrays(days=days, symbols=symbols, close=close, volume=volume)
+
+    def _write_entry(self, key: str, prices: PriceMatrix) -> int:
+        self.root.mkdir(parents=True, exist_ok=True)
+        temp_dir = self.root / f".{key}.{uuid.uuid4().hex[:8]}.tmp"
+        temp_dir.mkdir()
+        np.save(temp_dir / "close.npy", np.ascontiguousarray(prices.close, dtype=np.float64))
+        np.save(temp_dir / "days.npy", prices.calendar.ordinals)
+        if prices.volume is not None:
+            np.save(temp_dir / "volume.npy", np.ascontiguousarray(prices.volume, dtype=np.float64))
+        (temp_dir / "symbols.json").write_text(json.dumps(prices.symbols), encoding="utf-8")
+        nbytes = sum(path.stat().st_size for path in temp_dir.iterdir())
+
+        entry_dir = self.root / key
+        if entry_dir.exists():
+            shutil.rmtree(temp_dir)
+        else:
+            os.replace(temp_dir, entry_dir)
+        return nbytes
+
+    def load(self, path: str | Path) -> PriceMatrix:
+        """
+        가격 CSV를 PriceMatrix로 연다. 캐시에 있으면 CSV를 읽지 않고 mmap으로 연다.
+        """
+        price_path = Path(path)
+        source = str(price_path.resolve())
+        stat = price_path.stat()
+        entries = self._load_index()
+
+        key = self._find(entries, source, stat.st_size, stat.st_mtime_ns)
+        if key is None:
+            content_key = _content_hash(price_path)
+            key = content_key if content_key in entries else None
+            if key is not None:
+                entries[key].update(source=source, source_size=stat.st_size, source_mtime_ns=stat.st_mtime_ns)
+
+        prices = self._read_entry(key) if key is not None else None
+        if prices is None:
+            key = key or _content_hash(price_path)
+            prices = PriceMatrix.from_frame(load_price_csv(price_path))
+            nbytes = self._write_entry(key, prices)
+            # 같은 원본의 예전 버전은 더 이상 맞지 않으므로 바로 지운다.
+            for stale in [name for name, entry in entries.items() if entry["source"] == source and name != key]:
+                shutil.rmtree(self.root / stale, ignore_errors=True)
+                del entries[stale]
+            entries[key] = {
+                "source": source,
+                "source_size": stat.st_size,
+                "source_mtime_ns": stat.st_mtime_ns,
+                "nbytes": nbytes,
+            }
+
+        entries[key]["last_access"] = time.time()
+        self._evict(entries, keep=key)
+        self._save_index(entries)
+        return prices
+
+    def _evict(self, entries: dict[str, dict], keep: str | None = None) -> list[str]:
+        removed: list[str] = []
+        total = sum(int(entry["nbytes"]) for entry in entries.values())
+        for key in sorted(entries, key=lambda name: entries[name].get("last_access", 0.0)):
+            if total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            total -= int(entries[key]["nbytes"])
+            shutil.rmtree(self.root / key, ignore_errors=True)
+            del entries[key]
+            removed.append(key)
+        return removed
+
+    def evict(self) -> list[str]:
+        entries = self._load_index()
+        removed = self._evict(entries)
+        if removed:
+            self._save_index(entries)
+        return removed
+
+    def clear(self) -> int:
+        entries = self._load_index()
+        for key in entries:
+            shutil.rmtree(self.root / key, ignore_errors=True)
+        if self.root.exists():
+            self._save_index({})
+        return len(entries)
+
+
+def load_price_matrix(path: str | Path, cache: PriceCache | None = None, use_cache: bool = True) -> PriceMatrix:
+    """
+    가격 CSV를 PriceMatrix로 읽는다. use_cache=False이면 캐시를 건너뛰고 매번 파싱한다.
+    """
+    if not use_cache:
+        return PriceMatrix.from_frame(load_price_csv(path))
+    return (cache or PriceCache()).load(path)
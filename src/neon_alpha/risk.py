@@ -1,7 +1,23 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+import heapq
+from itertools import chain, islice
+import math
 from math import inf
+from operator import itemgetter
+
+import numpy as np
+
+
+# 종목이 이보다 많으면 select_targets가 heapq 대신 np.argpartition으로 상위 종목을 고른다.
+ARGPARTITION_MIN_SYMBOLS: int = 256
+WEIGHTING_SCHEMES: tuple[str, ...] = ("equal", "inverse_vol", "risk_parity", "mean_variance")
+DEFAULT_COVARIANCE_HALFLIFE: float = 60.0
+DEFAULT_SHRINKAGE: float = 0.1
+RISK_PARITY_MAX_ITERATIONS: int = 100
+RISK_PARITY_TOLERANCE: float = 1e-10
+DEFAULT_CAPITAL: float = 1_000_000.0
 
 
 @dataclass
@@ -14,6 +30,44 @@ class RiskLimits:
     min_score: float = -inf
     max_weight_per_symbol: float = 0.5
     max_daily_turnover: float = 1.0
+    weighting: str = "equal"
+    covariance_halflife: float = DEFAULT_COVARIANCE_HALFLIFE
+    shrinkage: float = DEFAULT_SHRINKAGE
+    # 섹터별 비중 합 기본 상한(섹터별 값은 ConstraintData.sector_caps), 종목 비중 x capital <= max_adv_fraction x
+    # 평균 거래대금, 편입 가능한 종목 베타 범위, 포트폴리오 베타(sum w x beta) 상한.
+    max_sector_weight: float = 1.0
+    max_adv_fraction: float = inf
+    capital: float = DEFAULT_CAPITAL
+    min_symbol_beta: float = -inf
+    max_symbol_beta: float = inf
+    max_portfolio_beta: float = inf
+
+    def __post_init__(self) -> None:
+        if self.weighting not in WEIGHTING_SCHEMES:
+            raise ValueError(
+                f"Unsupported weighting scheme: {self.weighting} (choose from {', '.join(WEIGHTING_SCHEMES)})"
+            )
+        if not self.covariance_halflife > 0:
+            raise ValueError("covariance_halflife must be positive.")
+        if not 0.0 <= self.shrinkage <= 1.0:
+            raise ValueError("shrinkage must be between 0 and 1.")
+        if not self.capital > 0:
+            raise ValueError("capital must be positive.")
+        if not self.max_portfolio_beta >= 0:
+            raise ValueError("max_portfolio_beta must not be negative.")
+
+    @property
+    def has_constraints(self) -> bool:
+        """
+        섹터/유동성/베타 제약 중 하나라도 켜져 있는지(켜져 있으면 ConstraintData가 필요하다).
+        """
+        return (
+            self.max_sector_weight < 1.0
+            or self.max_adv_fraction < inf
+            or self.min_symbol_beta > -inf
+            or self.max_symbol_beta < inf
+            or self.max_portfolio_beta < inf
+        )
 
 
 def _turnover_ratio(current: set[str], target: set[str]) -> float:
@@ -24,21 +78,57 @@ def _turnover_ratio(current: set[str], target: set[str]) -> float:
     return (entries + exits) / len(current)
 
 
+def _rank_top(day_scores: dict[str, float], limits: RiskLimits, keep: int) -> list[str] | None:
+    """
+    min_score 통과 종목 중 점수 상위 keep개(순위순). 통과 종목이 없으면 None.
+    종목이 많으면 np.argpartition, 적으면 heapq.nlargest를 쓰고, 같은 점수는 둘 다
+    sorted(reverse=True)처럼 먼저 들어온 종목이 앞선다.
+    """
+    if len(day_scores) < ARGPARTITION_MIN_SYMBOLS:
+        candidates = [item for item in day_scores.items() if item[1] >= limits.min_score]
+        if not candidates:
+            return None
+        return [symbol for symbol, _ in heapq.nlargest(keep, candidates, key=itemgetter(1))]
+
+    values = np.fromiter(day_scores.values(), dtype=np.float64, count=len(day_scores))
+    passing = np.flatnonzero(values >= limits.min_score)
+    if not len(passing):
+        return None
+    scores = values[passing]
+    if keep < len(scores):
+        kth = scores[np.argpartition(-scores, keep - 1)[:keep]].min() if keep else inf
+        above = np.flatnonzero(scores > kth)
+        chosen = np.concatenate([above, np.flatnonzero(scores == kth)[: keep - len(above)]])
+    else:
+        chosen = np.arange(len(scores))
+    ranked = chosen[np.lexsort((chosen, -scores[chosen]))]
+    symbols = list(day_scores)
+    return [symbols[position] for position in passing[ranked].tolist()]
+
+
 def select_targets(
     day_scores: dict[str, float],
     current_holdings: set[str],
     limits: RiskLimits,
+    pre_ranked: bool = False,
 ) -> dict[str, float]:
-    ranked = sorted(
-        ((symbol, score) for symbol, score in day_scores.items() if score >= limits.min_score),
-        key=lambda item: item[1],
-        reverse=True,
-    )
-
-    if not ranked:
-        return {}
-
-    selected_symbols = [symbol for symbol, _ in ranked[: limits.max_positions]]
+    """
+    min_score를 넘는 종목 중 점수 상위 max_positions개를 고른다. 전체 정렬 대신 부분 선택으로
+    O(N + k log k)에 뽑는다. pre_ranked=True이면 day_scores가 이미 점수 내림차순이라고 보고
+    순위 계산을 건너뛴다.
+    """
+    keep = max(limits.max_positions, 0)
+    if pre_ranked:
+        passing = (symbol for symbol, score in day_scores.items() if score >= limits.min_score)
+        first = next(passing, None)
+        if first is None:
+            return {}
+        selected_symbols = list(islice(chain([first], passing), keep))
+    else:
+        ranked = _rank_top(day_scores, limits, keep)
+        if ranked is None:
+            return {}
+        selected_symbols = ranked
     target_set = set(selected_symbols)
 
     if limits.max_daily_turnover < inf:
@@ -60,3 +150,307 @@ def select_targets(
     capped_weight = min(equal_weight, limits.max_weight_per_symbol)
 
     return {symbol: capped_weight for symbol in target_set}
+
+
+def _top_candidates(scores: np.ndarray, limits: RiskLimits, priority: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    날짜별 min_score 통과 종목 중 상위 max_positions개(bool 행렬)와 통과 종목이 있는 날 여부.
+    경계 점수가 같은 종목은 priority가 작은 쪽을 고른다(select_targets의 안정 정렬과 같은 규칙).
+    """
+    days, width = scores.shape
+    valid = ~np.isnan(scores) & (scores >= limits.min_score)
+    has_ranked = valid.any(axis=1)
+    keep = min(max(limits.max_positions, 0), width)
+    if keep == 0:
+        return np.zeros((days, width), dtype=bool), has_ranked
+
+    masked = np.where(valid, scores, -inf)
+    kth = np.partition(masked, width - keep, axis=1)[:, width - keep]
+    selected = valid & (masked > kth[:, None])
+    ties = valid & (masked == kth[:, None])
+    needed = keep - selected.sum(axis=1)
+    fits = ties.sum(axis=1) <= needed
+    selected |= ties & fits[:, None]
+
+    crowded = np.flatnonzero(~fits)
+    if len(crowded):
+        tie_priority = np.where(ties[crowded], priority[crowded], np.iinfo(np.int64).max)
+        order = np.argsort(tie_priority, axis=1, kind="stable")
+        rows, ranks = np.nonzero(np.arange(width) < needed[crowded][:, None])
+        selected[crowded[rows], order[rows, ranks]] = True
+    return selected, has_ranked
+
+
+def _turnover_scan(candidates: np.ndarray, has_ranked: np.ndarray, limits: RiskLimits) -> np.ndarray:
+    """
+    전날 보유 종목에 의존하는 회전율 규칙을 날짜 순서대로 적용한다. 보유는 정수 컬럼 코드 집합으로 다룬다.
+    """
+    holdings = np.zeros_like(candidates)
+    limit = limits.max_daily_turnover
+    if limit == inf:
+        holdings[:] = candidates & has_ranked[:, None]
+        return holdings
+
+    rows, columns = np.nonzero(candidates)
+    bounds = np.searchsorted(rows, np.arange(len(candidates) + 1)).tolist()
+    columns = columns.tolist()
+    ranked = has_ranked.tolist()
+    current: set[int] = set()
+    for day in range(len(candidates)):
+        target = set(columns[bounds[day] : bounds[day + 1]]) if ranked[day] else set()
+        if ranked[day] and current and len(target ^ current) / len(current) > limit:
+            # 한도 초과 시 기존 보유를 유지하고 겹치는 종목만 남긴다.
+            target = (target & current) or current
+        if target:
+            holdings[day, list(target)] = True
+        current = target
+    return holdings
+
+
+def select_holdings_batch(
+    scores: np.ndarray,
+    limits: RiskLimits,
+    priority: np.ndarray | None = None,
+) -> np.ndarray:
+    """
+    select_targets를 모든 날짜에 한 번에 적용한 보유 여부(bool) 행렬. scores는 (days x symbols)이고 NaN은 신호 없음,
+    priority는 같은 점수끼리의 순서(작을수록 먼저, 기본은 컬럼 순서)이다. 첫날 보유는 비어 있다고 본다.
+    """
+    scores = np.asarray(scores, dtype=np.float64)
+    if priority is None:
+        priority = np.broadcast_to(np.arange(scores.shape[1], dtype=np.int64), scores.shape)
+    candidates, has_ranked = _top_candidates(scores, limits, priority)
+    return _turnover_scan(candidates, has_ranked, limits)
+
+
+def target_weights(holdings: np.ndarray, limits: RiskLimits) -> np.ndarray:
+    counts = holdings.sum(axis=1)
+    with np.errstate(divide="ignore"):
+        per_symbol = np.minimum(1.0 / counts, limits.max_weight_per_symbol)
+    return np.where(holdings, per_symbol[:, None], 0.0)
+
+
+def select_targets_batch(
+    scores: np.ndarray,
+    limits: RiskLimits,
+    priority: np.ndarray | None = None,
+) -> np.ndarray:
+    """
+    (days x symbols) 점수 행렬에서 날짜별 목표 비중 행렬을 만든다. 각 행은 전날 행을 보유로 두고
+    select_targets를 부른 결과와 같다.
+    """
+    return target_weights(select_holdings_batch(scores, limits, priority), limits)
+
+
+class EwmaCovariance:
+    """
+    일간 수익률의 지수가중(EWMA) 공분산. 하루에 rank-1 갱신(cov <- d * cov + (1 - d) * r r^T) 한 번만 하므로
+    창 전체를 다시 계산하지 않고 종목 수 N에 대해 O(N^2)이다. 평균은 0으로 본다(RiskMetrics 방식).
+    가격이 없는 날의 수익률은 PriceMatrix.returns처럼 0으로 넣는다.
+    """
+
+    def __init__(self, n_assets: int, halflife: float = DEFAULT_COVARIANCE_HALFLIFE) -> None:
+        self.decay = 0.5 ** (1.0 / halflife)
+        self.matrix = np.zeros((n_assets, n_assets), dtype=np.float64)
+        # 지금까지 들어간 가중치 합(1 - d^t). 초기 편향 보정에 쓴다.
+        self.weight = 0.0
+        self.count = 0
+        self._outer = np.empty_like(self.matrix)
+
+    def __len__(self) -> int:
+        return int(self.matrix.shape[0])
+
+    def update(self, returns: np.ndarray) -> None:
+        returns = np.where(np.isfinite(returns), returns, 0.0)
+        np.multiply.outer((1.0 - self.decay) * returns, returns, out=self._outer)
+        self.matrix *= self.decay
+        self.matrix += self._outer
+        self.weight = self.decay * self.weight + (1.0 - self.decay)
+        self.count += 1
+
+    def covariance(self, columns: np.ndarray | None = None) -> np.ndarray:
+        """
+        편향 보정한 공분산(columns를 주면 그 부분 행렬). 갱신 전이면 0 행렬.
+        """
+        matrix = self.matrix if columns is None else self.matrix[np.ix_(columns, columns)]
+        return matrix / self.weight if self.weight > 0 else np.zeros_like(matrix)
+
+    def reindexed(self, positions: np.ndarray) -> EwmaCovariance:
+        """
+        새 컬럼 i가 기존 컬럼 positions[i]인 추정기(-1이면 이력 없는 새 종목). 가격 universe가 바뀔 때 쓴다.
+        """
+        moved = EwmaCovariance(len(positions))
+        moved.decay, moved.weight, moved.count = self.decay, self.weight, self.count
+        known = np.flatnonzero(positions >= 0)
+        moved.matrix[np.ix_(known, known)] = self.matrix[np.ix_(positions[known], positions[known])]
+        return moved
+
+
+def _risk_parity(covariance: np.ndarray) -> np.ndarray | None:
+    """
+    위험 기여도(w_i * (cov w)_i)가 모두 같은 비중. 볼록 문제 min 1/2 y^T cov y - sum(log y) / n을
+    양수 영역을 벗어나지 않도록 걸음을 줄이는 Newton 반복으로 푼다. 공분산이 특이해 해가 없으면 None.
+    """
+    budget = 1.0 / len(covariance)
+    weights = 1.0 / np.sqrt(np.diag(covariance))
+    weights /= math.sqrt(float(weights @ covariance @ weights))
+    for _ in range(RISK_PARITY_MAX_ITERATIONS):
+        gradient = covariance @ weights - budget / weights
+        hessian = covariance + np.diag(budget / (weights * weights))
+        try:
+            step = np.linalg.solve(hessian, gradient)
+        except np.linalg.LinAlgError:
+            return None
+        scale = 1.0
+        while (weights - scale * step <= 0).any():
+            scale *= 0.5
+        weights = weights - scale * step
+        if np.abs(step).max() * scale <= RISK_PARITY_TOLERANCE * weights.max():
+            return weights
+    return None
+
+
+def _mean_variance(covariance: np.ndarray, expected: np.ndarray) -> np.ndarray:
+    """
+    mean-variance 비중(cov^-1 mu)을 롱 온리로 자른 것. 양수 비중이 하나도 없으면 최소분산(mu = 1) 비중을 쓴다.
+    """
+    inverse = np.linalg.pinv(covariance, hermitian=True)
+    weights = np.maximum(inverse @ expected, 0.0)
+    if weights.sum() <= 0:
+        weights = np.maximum(inverse.sum(axis=1), 0.0)
+    return weights
+
+
+def portfolio_weights(
+    covariance: np.ndarray,
+    limits: RiskLimits,
+    expected: np.ndarray | None = None,
+) -> np.ndarray | None:
+    """
+    고른 종목들의 공분산(과 mean_variance면 기대수익률로 쓰는 점수)으로 limits.weighting 비중을 만든다.
+    risk_parity/mean_variance는 표본이 적어도 풀리도록 공분산을 대각 쪽으로 limits.shrinkage만큼 당겨 쓴다.
+    합을 1로 맞춘 뒤 종목별 상한(max_weight_per_symbol)으로 자르고 남는 비중은 현금이다.
+    분산을 추정할 수 없는 종목(이력 없음, 분산 0)이 있거나, 해가 없거나, equal이면 None이고, 호출측은 동일 비중을 쓴다.
+    """
+    variances = np.diag(covariance)
+    if limits.weighting == "equal" or not len(variances) or not (variances > 0).all():
+        return None
+    shrunk = (1.0 - limits.shrinkage) * covariance + limits.shrinkage * np.diag(variances)
+    if limits.weighting == "inverse_vol":
+        weights = 1.0 / np.sqrt(variances)
+    elif limits.weighting == "risk_parity":
+        weights = _risk_parity(shrunk)
+        if weights is None:
+            return None
+    else:
+        scores = np.ones(len(variances)) if expected is None else np.asarray(expected, dtype=np.float64)
+        # 그날 점수가 없는 보유 종목(회전율 한도로 남은 종목)은 기대수익률 0으로 본다.
+        scores = np.where(np.isfinite(scores), scores, 0.0)
+        weights = _mean_variance(shrunk, scores)
+    total = weights.sum()
+    if not total > 0:
+        return None
+    return np.minimum(weights / total, limits.max_weight_per_symbol)
+
+
+def risk_weights_batch(
+    holdings: np.ndarray,
+    columns: np.ndarray,
+    returns: np.ndarray | None,
+    scores: np.ndarray,
+    limits: RiskLimits,
+) -> np.ndarray:
+    """
+    보유 여부(days x 종목) 행렬에 limits.weighting 비중을 매긴다. columns는 종목별 returns 컬럼(가격 없으면 -1),
+    returns[t]는 day t -> t+1 수익률이다(equal이면 쓰지 않는다). day t 비중은 returns[:t]로 갱신한 EwmaCovariance로 정하므로
+    PaperSimulator가 하루씩 갱신하는 것과 같다. 추정기는 한 번이라도 보유한 종목 컬럼만 들고 간다.
+    """
+    weights = target_weights(holdings, limits)
+    if limits.weighting == "equal":
+        return weights
+    held_ever = holdings.any(axis=0) & (columns >= 0)
+    tracked = np.unique(columns[held_ever])
+    slot = np.full(len(columns), -1, dtype=np.int64)
+    slot[held_ever] = np.searchsorted(tracked, columns[held_ever])
+    tracked_returns = returns[:, tracked]
+
+    estimator = EwmaCovariance(len(tracked), limits.covariance_halflife)
+    for day in range(len(holdings)):
+        if day:
+            estimator.update(tracked_returns[day - 1])
+        held = np.flatnonzero(holdings[day])
+        if not len(held) or (slot[held] < 0).any():
+            continue
+        sized = portfolio_weights(estimator.covariance(slot[held]), limits, scores[day, held])
+        if sized is not None:
+            weights[day, held] = sized
+    return weights
+
+
+@dataclass(frozen=True, eq=False)
+class ConstraintData:
+    """
+    섹터/유동성/베타 제약 입력을 가격 컬럼 순서 배열로 미리 펼친 것. sector는 조밀한 섹터 코드(-1은 미분류),
+    beta는 종목 베타(NaN은 미상), adv는 (거래일 x 컬럼) 평균 거래대금(NaN은 미상, 거래량이 없으면 None),
+    sector_caps는 섹터 코드별 비중 합 상한(NaN이면 limits.max_sector_weight, 섹터별 상한이 없으면 None).
+    제약은 종목별 Python 검사 대신 이 배열에 대한 마스크/클립 연산으로 적용한다.
+    """
+
+    sector: np.ndarray
+    sectors: list[str]
+    beta: np.ndarray
+    adv: np.ndarray | None = None
+    sector_caps: np.ndarray | None = None
+
+    def applies(self, limits: RiskLimits) -> bool:
+        return limits.has_constraints or self.sector_caps is not None
+
+    def sector_limits(self, limits: RiskLimits) -> np.ndarray:
+        default = np.full(len(self.sectors), limits.max_sector_weight, dtype=np.float64)
+        return default if self.sector_caps is None else np.where(np.isnan(self.sector_caps), default, self.sector_caps)
+
+    @staticmethod
+    def _per_column(values: np.ndarray, columns: np.ndarray, missing: float | int) -> np.ndarray:
+        result = np.full((*values.shape[:-1], len(columns)), missing, dtype=values.dtype)
+        priced = np.flatnonzero(columns >= 0)
+        result[..., priced] = values[..., columns[priced]]
+        return result
+
+    def eligible(self, columns: np.ndarray, limits: RiskLimits) -> np.ndarray:
+        """
+        베타가 [min_symbol_beta, max_symbol_beta] 안인 종목(가격 컬럼 기준, 가격 없으면 -1).
+        종목 베타 범위나 포트폴리오 베타 상한을 두면 베타 미상 종목은 뺀다.
+        """
+        if limits.min_symbol_beta == -inf and limits.max_symbol_beta == inf and limits.max_portfolio_beta == inf:
+            return np.ones(len(columns), dtype=bool)
+        beta = self._per_column(self.beta, columns, math.nan)
+        return (beta >= limits.min_symbol_beta) & (beta <= limits.max_symbol_beta)
+
+    def clip(self, weights: np.ndarray, columns: np.ndarray, adv: np.ndarray | None, limits: RiskLimits) -> np.ndarray:
+        """
+        (rows x 종목) 비중을 유동성 상한으로 자르고, 섹터 합이 섹터 상한을 넘는 섹터를 비율대로 줄인 뒤,
+        포트폴리오 베타가 max_portfolio_beta를 넘는 행은 행 전체를 같은 비율로 줄인다.
+        adv는 행마다 그날의 (전체 가격 컬럼) 평균 거래대금 행이고 NaN이면 상한 없음. 줄어든 비중은 현금(베타 0)으로 남는다.
+        """
+        weights = np.array(weights, dtype=np.float64)
+        if limits.max_adv_fraction < inf:
+            if adv is None:
+                raise ValueError("max_adv_fraction needs price data with a volume column.")
+            caps = limits.max_adv_fraction * self._per_column(adv, columns, math.nan) / limits.capital
+            weights = np.fmin(weights, caps)
+        sector_limits = self.sector_limits(limits)
+        if (sector_limits < 1.0).any():
+            sector = self._per_column(self.sector, columns, -1)
+            grouped = np.flatnonzero(sector >= 0)
+            rows = np.arange(len(weights))[:, None]
+            cells = rows * len(self.sectors) + sector[grouped]
+            totals = np.bincount(cells.ravel(), weights[:, grouped].ravel(), minlength=len(weights) * len(self.sectors))
+            with np.errstate(divide="ignore"):
+                scale = np.minimum(1.0, np.tile(sector_limits, len(weights)) / totals)
+            weights[:, grouped] *= scale[cells]
+        if limits.max_portfolio_beta < inf:
+            beta = self._per_column(self.beta, columns, math.nan)
+            exposure = np.nansum(weights * beta, axis=1)
+            over = exposure > limits.max_portfolio_beta
+            weights[over] *= (limits.max_portfolio_beta / exposure[over])[:, None]
+        return weights
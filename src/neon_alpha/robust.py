@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+import math
+from multiprocessing import shared_memory
+import os
+
+import numpy as np
+import pandas as pd
+
+from .metrics import TRADING_DAYS_PER_YEAR
+from .paper import (
+    DayScores,
+    PriceInput,
+    SignalInput,
+    _share_array,
+    as_price_matrix,
+    build_weight_matrix,
+)
+from .risk import ConstraintData, RiskLimits
+
+
+ROBUST_METHODS: tuple[str, ...] = ("bootstrap", "shuffle")
+DEFAULT_ROBUST_PATHS: int = 1000
+DEFAULT_BLOCK_SIZE: int = 20
+DEFAULT_BATCH_PATHS: int = 128
+ROBUST_METRICS: tuple[str, ...] = ("total_return", "cagr", "max_drawdown")
+
+
+def path_metrics(path_returns: np.ndarray, periods_per_year: int = TRADING_DAYS_PER_YEAR) -> dict[str, np.ndarray]:
+    """
+    (경로 x 일) 수익률 행렬의 경로별 총수익률/CAGR/최대 낙폭. PaperResult와 같은 정의를 축 연산으로 계산한다.
+    """
+    paths, periods = path_returns.shape
+    if not periods:
+        zeros = np.zeros(paths, dtype=np.float64)
+        return {"total_return": zeros, "cagr": zeros.copy(), "max_drawdown": zeros.copy()}
+    equity_curve = np.cumprod(1.0 + path_returns, axis=1)
+    peak = np.maximum.accumulate(np.maximum(equity_curve, 1.0), axis=1)
+    drawdown = ((peak - equity_curve) / peak).max(axis=1)
+    equity = equity_curve[:, -1]
+    with np.errstate(invalid="ignore"):
+        cagr = np.where(equity > 0, np.abs(equity) ** (periods_per_year / periods) - 1.0, -1.0)
+    return {"total_return": equity - 1.0, "cagr": cagr, "max_drawdown": np.maximum(drawdown, 0.0)}
+
+
+def block_bootstrap_returns(
+    daily_returns: np.ndarray,
+    n_paths: int,
+    block_size: int,
+    rng: np.random.Generator,
+) -> np.ndarray:
+    """
+    원형(circular) 블록 부트스트랩. 길이 block_size 구간을 무작위 시작점에서 이어 붙여 원래 길이의 경로를 만든다.
+    """
+    periods = len(daily_returns)
+    if not periods:
+        return np.zeros((n_paths, 0), dtype=np.float64)
+    block_size = max(1, min(block_size, periods))
+    n_blocks = math.ceil(periods / block_size)
+    starts = rng.integers(0, periods, size=(n_paths, n_blocks))
+    positions = (starts[:, :, None] + np.arange(block_size)) % periods
+    return np.asarray(daily_returns)[positions.reshape(n_paths, -1)[:, :periods]]
+
+
+def shuffle_day_scores(day_scores: DayScores, rng: np.random.Generator) -> DayScores:
+    """
+    날짜별로 점수를 종목 사이에서 무작위로 섞는다. 날짜별 점수 분포와 종목 구성은 그대로 두고 신호의 정보만 없앤다.
+    """
+    counts = np.diff(day_scores.offsets)
+    segments = np.repeat(np.arange(len(counts)), counts)
+    order = np.lexsort((rng.random(len(day_scores.scores)), segments))
+    return DayScores(offsets=day_scores.offsets, ids=day_scores.ids, scores=day_scores.scores[order])
+
+
+_ROBUST_STATE: dict[str, object] = {}
+
+
+def _attach_robust_state(
+    specs: dict[str, tuple[str, tuple[int, ...], str]],
+    column_of: np.ndarray,
+    limits: RiskLimits,
+    method: str,
+    block_size: int,
+    constraints: ConstraintData | None = None,
+) -> None:
+    """
+    프로세스 풀 워커 초기화: 공유 메모리의 기준 수익률/수익률 행렬/일별 점수(/평균 거래대금)를 복사 없이 붙인다.
+    """
+    blocks = {name: shared_memory.SharedMemory(name=spec[0]) for name, spec in specs.items()}
+    arrays = {
+        name: np.ndarray(specs[name][1], dtype=np.dtype(specs[name][2]), buffer=block.buf)
+        for name, block in blocks.items()
+    }
+    if constraints is not None and "adv" in arrays:
+        constraints = replace(constraints, adv=arrays.pop("adv"))
+    _ROBUST_STATE.update(blocks=blocks, column_of=column_of, limits=limits, method=method, block_size=block_size)
+    _ROBUST_STATE.update(arrays, constraints=constraints)
+
+
+def _run_robust_batch(task: tuple[np.random.SeedSequence, int]) -> dict[str, np.ndarray]:
+    seed, count = task
+    rng = np.random.default_rng(seed)
+    if _ROBUST_STATE["method"] == "bootstrap":
+        paths = block_bootstrap_returns(_ROBUST_STATE["daily_returns"], count, _ROBUST_STATE["block_size"], rng)
+        return path_metrics(paths)
+
+    # 회전율 한도 때문에 선택이 경로마다 전날 보유 종목에 의존하므로 비중 행렬은 경로별로 만들고,
+    # 지표 계산은 배치 전체를 한 번에 한다.
+    returns = _ROBUST_STATE["returns"]
+    day_scores = DayScores(
+        offsets=_ROBUST_STATE["offsets"],
+        ids=_ROBUST_STATE["ids"],
+        scores=_ROBUST_STATE["scores"],
+    )
+    path_returns = np.empty((count, returns.shape[0]), dtype=np.float64)
+    trades = np.empty(count, dtype=np.int64)
+    for path in range(count):
+        weights, trades[path] = build_weight_matrix(
+            shuffle_day_scores(day_scores, rng),
+            _ROBUST_STATE["column_of"],
+            returns.shape[1],
+            _ROBUST_STATE["limits"],
+            returns=returns,
+            constraints=_ROBUST_STATE["constraints"],
+        )
+        path_returns[path] = np.einsum("ij,ij->i", weights, returns)
+    metrics = path_metrics(path_returns)
+    metrics["trades"] = trades
+    return metrics
+
+
+def run_robustness(
+    signal_rows: SignalInput,
+    price_df: PriceInput,
+    limits: RiskLimits,
+    method: str = "bootstrap",
+    n_paths: int = DEFAULT_ROBUST_PATHS,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+    seed: int = 0,
+    batch_size: int = DEFAULT_BATCH_PATHS,
+    max_workers: int | None = None,
+    constraints: ConstraintData | None = None,
+) -> pd.DataFrame:
+    """
+    paper 결과의 분포를 경로 n_paths개로 추정한다.
+      - bootstrap: 실제 일별 수익률을 블록 부트스트랩으로 다시 뽑는다.
+      - shuffle: 날짜별로 점수를 섞은 무작위 신호로 다시 시뮬레이션한다(신호가 없을 때의 기준 분포).
+    경로는 batch_size씩 묶어 배열 연산으로 처리하고, max_workers가 1보다 크면 프로세스 풀에 나눠 돌린다.
+    배치마다 SeedSequence(seed)에서 갈라낸 시드를 쓰므로 워커 수와 관계없이 결과가 같다.
+    결과는 path + 지표 컬럼 테이블(shuffle은 trades 포함).
+    """
+    if method not in ROBUST_METHODS:
+        raise ValueError(f"Unsupported robustness method: {method} (choose from {', '.join(ROBUST_METHODS)})")
+    if n_paths <= 0 or batch_size <= 0 or block_size <= 0:
+        raise ValueError("n_paths, batch_size and block_size must be positive.")
+
+    prices = as_price_matrix(price_df)
+    if len(prices.calendar) < 2:
+        raise RuntimeError("Need at least two price dates for paper simulation.")
+
+    day_scores = DayScores.build(signal_rows, prices.calendar)
+    returns = prices.returns()
+    if method == "bootstrap":
+        weights, _ = build_weight_matrix(
+            day_scores, prices.column_of, returns.shape[1], limits, returns=returns, constraints=constraints
+        )
+        arrays = {"daily_returns": np.einsum("ij,ij->i", weights, returns)}
+    else:
+        arrays = {"returns": returns, "offsets": day_scores.offsets, "ids": day_scores.ids, "scores": day_scores.scores}
+        if constraints is not None and constraints.adv is not None:
+            arrays["adv"] = np.ascontiguousarray(constraints.adv)
+
+    counts = [min(batch_size, n_paths - begin) for begin in range(0, n_paths, batch_size)]
+    tasks = list(zip(np.random.SeedSequence(seed).spawn(len(counts)), counts))
+    workers = min(max_workers or os.cpu_count() or 1, len(tasks))
+
+    if workers <= 1:
+        _ROBUST_STATE.update(arrays, column_of=prices.column_of, limits=limits, method=method, block_size=block_size)
+        _ROBUST_STATE["constraints"] = constraints
+        try:
+            batches = [_run_robust_batch(task) for task in tasks]
+        finally:
+            _ROBUST_STATE.clear()
+    else:
+        shared = {name: _share_array(array) for name, array in arrays.items()}
+        try:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_attach_robust_state,
+                initargs=(
+                    {name: spec for name, (_, spec) in shared.items()},
+                    prices.column_of,
+                    limits,
+                    method,
+                    block_size,
+                    None if constraints is None else replace(constraints, adv=None),
+                ),
+            ) as executor:
+                batches = list(executor.map(_run_robust_batch, tasks))
+        finally:
+            for block, _ in shared.values():
+                block.close()
+                block.unlink()
+
+    table = pd.DataFrame({name: np.concatenate([batch[name] for batch in batches]) for name in batches[0]})
+    table.insert(0, "path", np.arange(n_paths))
+    return table
+
+
+def robust_quantiles(table: pd.DataFrame, quantiles: tuple[float, ...] = (0.05, 0.5, 0.95)) -> pd.DataFrame:
+    """
+    경로별 지표 테이블의 분위수. 행은 지표, 열은 분위수와 평균.
+    """
+    metrics = table[[name for name in ROBUST_METRICS if name in table.columns]]
+    summary = metrics.quantile(list(quantiles)).T
+    summary.columns = [f"p{quantile * 100:g}" for quantile in quantiles]
+    summary["mean"] = metrics.mean()
+    return summary
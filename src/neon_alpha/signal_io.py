@@ -1,13 +1,48 @@
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Collection, Iterable, Iterator, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 import csv
 from dataclasses import dataclass
+from functools import cached_property
 from datetime import date, datetime
+import json
+import os
 from pathlib import Path
+import glob
+import struct
 
+import numpy as np
+import pandas as pd
 
-DATE_FORMAT: str = "%Y-%m-%d"
+from .compression import compression_of, open_binary, open_text, strip_compression_suffix
+from .symbols import SYMBOLS, SymbolTable
+from .trading_calendar import (
+    DATE_FORMAT,
+    EPOCH_ORDINAL,
+    TradingCalendar,
+    format_day_ordinals,
+    parse_day_ordinals,
+    to_day_ordinals,
+)
+
+
+SIGNAL_FORMATS: tuple[str, ...] = ("csv", "parquet", "binary", "store")
+PARQUET_SUFFIXES: tuple[str, ...] = (".parquet", ".pq")
+BINARY_SUFFIXES: tuple[str, ...] = (".nsig",)
+BINARY_MAGIC: bytes = b"NSIG"
+BINARY_VERSION: int = 1
+# magic, version, score bytes, reserved, n_symbols, n_days, n_records,
+# symbols offset, symbols nbytes, day table offset, records offset
+BINARY_HEADER = struct.Struct("<4sHBBIIQQQQQ")
+BINARY_HEADER_SIZE: int = 64
+BINARY_SCORE_DTYPES: dict[str, int] = {"float32": 4, "float64": 8}
+PARQUET_ROW_GROUP_SIZE: int = 250_000
+DEFAULT_CHUNK_ROWS: int = 100_000
+STORE_MANIFEST_NAME: str = "_manifest.json"
+SIGNAL_INDEX_SUFFIX: str = ".idx"
+SIGNAL_INDEX_VERSION: int = 1
+SIGNAL_COLUMNS: list[str] = ["date", "symbol", "score"]
 
 
 @dataclass(frozen=True)
@@ -21,40 +56,956 @@ def parse_signal_date(value: str) -> date:
     return datetime.strptime(value, DATE_FORMAT).date()
 
 
-def read_signals(path: str | Path) -> list[SignalRow]:
-    signal_path: Path = Path(path)
-    rows: list[SignalRow] = []
-
-    with signal_path.open("r", encoding="utf-8", newline="") as file:
-        reader = csv.DictReader(file)
-        required = {"date", "symbol", "score"}
-        if reader.fieldnames is None or not required.issubset(set(reader.fieldnames)):
-            raise ValueError("Signal CSV must contain columns: date,symbol,score")
-
-        for row in reader:
-            rows.append(
-                SignalRow(
-                    signal_date=parse_signal_date(row["date"]),
-                    symbol=row["symbol"].strip().upper(),
-                    score=float(row["score"]),
-                )
+def _encode_symbols(values: Iterable[str]) -> tuple[np.ndarray, SymbolTable]:
+    raw_codes, raw_uniques = pd.factorize(pd.Series(values, dtype=object), use_na_sentinel=False)
+    # 정규화(strip/upper)와 intern은 고유값에만 적용한다.
+    unique_ids = SYMBOLS.intern_many([str(symbol).strip().upper() for symbol in raw_uniques])
+    return (unique_ids[raw_codes] if len(raw_codes) else np.empty(0, dtype=np.int32)), SYMBOLS
+
+
+def _codes_for(symbols: Sequence[str], wanted: set[str]) -> np.ndarray:
+    if isinstance(symbols, SymbolTable):
+        ids = symbols.ids_of(wanted)
+        return ids[ids >= 0]
+    return np.asarray([code for code, symbol in enumerate(symbols) if symbol in wanted], dtype=np.int32)
+
+
+@dataclass(frozen=True, eq=False)
+class SignalFrame:
+    """
+    신호를 열 단위(numpy) 배열로 보관한다.
+    days는 date.toordinal() 값, codes는 symbols의 인덱스이다. symbols는 보통 프로세스 전역
+    SymbolTable(SYMBOLS)이고, 바이너리 파일처럼 자체 심볼 사전을 가진 경우에만 파일 로컬 튜플이다.
+    """
+
+    days: np.ndarray
+    codes: np.ndarray
+    scores: np.ndarray
+    symbols: Sequence[str]
+
+    @classmethod
+    def empty(cls) -> SignalFrame:
+        return cls(
+            days=np.empty(0, dtype=np.int32),
+            codes=np.empty(0, dtype=np.int32),
+            scores=np.empty(0, dtype=np.float64),
+            symbols=SYMBOLS,
+        )
+
+    @classmethod
+    def from_ordinals(
+        cls,
+        days: Iterable[int],
+        symbols: Iterable[str],
+        scores: Iterable[float],
+    ) -> SignalFrame:
+        codes, symbol_names = _encode_symbols(symbols)
+        return cls(
+            days=np.asarray(days, dtype=np.int32),
+            codes=codes,
+            scores=np.asarray(scores, dtype=np.float64),
+            symbols=symbol_names,
+        )
+
+    @classmethod
+    def from_columns(
+        cls,
+        dates: Iterable[str],
+        symbols: Iterable[str],
+        scores: Iterable[float],
+    ) -> SignalFrame:
+        return cls.from_ordinals(parse_day_ordinals(dates), symbols, scores)
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[SignalRow]) -> SignalFrame:
+        if isinstance(rows, SignalFrame):
+            return rows
+        items = list(rows)
+        if not items:
+            return cls.empty()
+        codes, symbol_names = _encode_symbols([row.symbol for row in items])
+        return cls(
+            days=np.fromiter((row.signal_date.toordinal() for row in items), dtype=np.int32, count=len(items)),
+            codes=codes,
+            scores=np.fromiter((row.score for row in items), dtype=np.float64, count=len(items)),
+            symbols=symbol_names,
+        )
+
+    def __len__(self) -> int:
+        return int(self.days.shape[0])
+
+    def __getitem__(self, index: slice | np.ndarray) -> SignalFrame:
+        # slice는 view(복사 없음), bool/정수 배열은 numpy 규칙대로 복사된다.
+        return SignalFrame(
+            days=self.days[index],
+            codes=self.codes[index],
+            scores=self.scores[index],
+            symbols=self.symbols,
+        )
+
+    def __iter__(self) -> Iterator[SignalRow]:
+        return iter(self.to_rows())
+
+    def symbol_values(self) -> np.ndarray:
+        if isinstance(self.symbols, SymbolTable):
+            return self.symbols.names(self.codes)
+        return np.asarray(self.symbols, dtype=object)[self.codes] if self.symbols else np.empty(0, dtype=object)
+
+    def symbol_ids(self, table: SymbolTable = SYMBOLS) -> np.ndarray:
+        """
+        table 기준 심볼 id. 이미 같은 테이블로 인코딩돼 있으면 codes를 그대로 돌려준다.
+        """
+        if self.symbols is table:
+            return self.codes
+        remap = table.intern_many(self.symbols)
+        return remap[self.codes] if len(self.codes) else np.empty(0, dtype=np.int32)
+
+    def date_strings(self) -> np.ndarray:
+        return format_day_ordinals(self.days)
+
+    def to_rows(self) -> list[SignalRow]:
+        ordinal_dates = {int(day): date.fromordinal(int(day)) for day in np.unique(self.days)}
+        return [
+            SignalRow(signal_date=ordinal_dates[day], symbol=self.symbols[code], score=score)
+            for day, code, score in zip(self.days.tolist(), self.codes.tolist(), self.scores.tolist())
+        ]
+
+    def filter(
+        self,
+        start: date | None = None,
+        end: date | None = None,
+        symbols: Collection[str] | None = None,
+    ) -> SignalFrame:
+        mask = np.ones(len(self), dtype=bool)
+        if start is not None:
+            mask &= self.days >= start.toordinal()
+        if end is not None:
+            mask &= self.days <= end.toordinal()
+        if symbols is not None:
+            mask &= np.isin(self.codes, _codes_for(self.symbols, _normalize_symbols(symbols) or set()))
+        if mask.all():
+            return self
+        return self[mask]
+
+    def sort_by_day(self) -> SignalFrame:
+        if len(self) < 2 or bool(np.all(self.days[1:] >= self.days[:-1])):
+            return self
+        return self[np.argsort(self.days, kind="stable")]
+
+    def day_blocks(self) -> Iterator[tuple[int, SignalFrame]]:
+        """
+        날짜 순으로 정렬한 뒤 (day ordinal, 해당 일자 view) 를 차례로 돌려준다.
+        """
+        ordered = self.sort_by_day()
+        if not len(ordered):
+            return
+        boundaries = np.flatnonzero(np.diff(ordered.days)) + 1
+        starts = np.concatenate(([0], boundaries))
+        ends = np.concatenate((boundaries, [len(ordered)]))
+        for begin, finish in zip(starts.tolist(), ends.tolist()):
+            yield int(ordered.days[begin]), ordered[begin:finish]
+
+
+def detect_signal_format(path: str | Path, fmt: str | None = None) -> str:
+    """
+    명시된 fmt가 있으면 그대로 쓰고, 없으면 확장자로 판별한다(기본 csv).
+    디렉터리는 날짜 파티션 저장소(neon_alpha.signal_store)로 본다.
+    .gz/.bz2/.xz/.zst 압축은 csv에만 허용한다(parquet/binary는 자체 압축·memmap을 쓴다).
+    """
+    if fmt:
+        if fmt not in SIGNAL_FORMATS:
+            raise ValueError(f"Unsupported signal format: {fmt} (choose from {', '.join(SIGNAL_FORMATS)})")
+        signal_format = fmt
+    elif Path(path).is_dir():
+        return "store"
+    else:
+        suffix = strip_compression_suffix(path).suffix.lower()
+        if suffix in PARQUET_SUFFIXES:
+            signal_format = "parquet"
+        elif suffix in BINARY_SUFFIXES:
+            signal_format = "binary"
+        else:
+            signal_format = "csv"
+    if signal_format != "csv" and compression_of(path):
+        raise ValueError(f"Compressed signal files must be csv: {path}")
+    return signal_format
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except Exception as error:  # pragma: no cover
+        raise RuntimeError(
+            "pyarrow import failed. Install with `pip install neon-alpha[parquet]` to use parquet signals."
+        ) from error
+    return pyarrow, pyarrow.parquet
+
+
+def _normalize_symbols(symbols: Collection[str] | None) -> set[str] | None:
+    if symbols is None:
+        return None
+    return {symbol.strip().upper() for symbol in symbols}
+
+
+def _check_csv_header(path: Path) -> None:
+    with open_text(path) as file:
+        header = next(csv.reader(file), None)
+    if header is None or not set(SIGNAL_COLUMNS).issubset(set(header)):
+        raise ValueError("Signal CSV must contain columns: date,symbol,score")
+
+
+def _csv_reader_options() -> dict:
+    return {
+        "usecols": SIGNAL_COLUMNS,
+        "dtype": {"date": object, "symbol": object, "score": np.float64},
+        "keep_default_na": False,
+        "na_values": {"score": ["", "nan", "NaN", "NA"]},
+        "encoding": "utf-8",
+    }
+
+
+@dataclass(frozen=True)
+class SignalIndex:
+    """
+    날짜순 CSV 옆에 두는 sidecar 인덱스(<csv>.idx). 날짜별 시작 바이트 위치와 행 수를 담는다.
+    """
+
+    days: list[str]
+    offsets: list[int]
+    rows: list[int]
+    header: list[str]
+    source_size: int
+    source_mtime_ns: int
+
+    @property
+    def last_day(self) -> date | None:
+        return parse_signal_date(self.days[-1]) if self.days else None
+
+    @cached_property
+    def calendar(self) -> TradingCalendar:
+        return TradingCalendar(ordinals=to_day_ordinals(self.days))
+
+    def locate(self, start: date | None = None, end: date | None = None) -> tuple[int, int]:
+        """
+        [start, end] 구간의 (시작 바이트, 행 수)를 이진 탐색으로 찾는다.
+        """
+        first = 0 if start is None else int(self.calendar.next_index(np.asarray([start.toordinal()]))[0])
+        last = len(self.days)
+        if end is not None:
+            last = int(self.calendar.previous_index(np.asarray([end.toordinal()]))[0]) + 1
+        if first >= last:
+            return 0, 0
+        return self.offsets[first], sum(self.rows[first:last])
+
+
+def signal_index_path(path: str | Path) -> Path:
+    signal_path = Path(path)
+    return signal_path.with_name(signal_path.name + SIGNAL_INDEX_SUFFIX)
+
+
+def build_signal_index(path: str | Path) -> SignalIndex:
+    """
+    날짜순으로 정렬된 CSV(첫 줄 헤더, date 컬럼 필수)를 한 번 훑어 sidecar 인덱스를 만들고 저장한다.
+    바이트 위치로 seek 하므로 압축 CSV나 줄바꿈이 든 따옴표 필드에는 만들 수 없다. 날짜는 DATE_FORMAT이어야 한다.
+    """
+    signal_path = Path(path)
+    if compression_of(signal_path):
+        raise ValueError(f"Cannot build a signal index for a compressed CSV: {signal_path}")
+    days: list[str] = []
+    offsets: list[int] = []
+    rows: list[int] = []
+
+    with signal_path.open("rb") as file:
+        header_line = file.readline()
+        header = next(csv.reader([header_line.decode("utf-8")]), [])
+        if "date" not in header:
+            raise ValueError("Signal CSV must contain a date column to build an index.")
+        date_column = header.index("date")
+        offset = len(header_line)
+
+        last_ordinal = 0
+        for line in file:
+            if line.strip():
+                if b'"' in line:
+                    if line.count(b'"') % 2:
+                        raise ValueError("Cannot build a signal index for quoted fields spanning lines.")
+                    day_key = next(csv.reader([line.decode("utf-8")]))[date_column].strip()
+                else:
+                    day_key = line.split(b",", date_column + 1)[date_column].strip().decode("utf-8")
+                if not days or day_key != days[-1]:
+                    try:
+                        ordinal = parse_signal_date(day_key).toordinal()
+                    except ValueError as error:
+                        raise ValueError(f"Signal dates must use {DATE_FORMAT}: {day_key!r}") from error
+                    if ordinal <= last_ordinal:
+                        raise ValueError("Signal CSV must be sorted by date to build an index.")
+                    last_ordinal = ordinal
+                    days.append(day_key)
+                    offsets.append(offset)
+                    rows.append(0)
+                rows[-1] += 1
+            offset += len(line)
+
+    stat = signal_path.stat()
+    index = SignalIndex(
+        days=days,
+        offsets=offsets,
+        rows=rows,
+        header=header,
+        source_size=stat.st_size,
+        source_mtime_ns=stat.st_mtime_ns,
+    )
+    index_path = signal_index_path(signal_path)
+    temp_path = index_path.with_name(index_path.name + ".tmp")
+    payload = {"version": SIGNAL_INDEX_VERSION, **index.__dict__}
+    temp_path.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+    os.replace(temp_path, index_path)
+    return index
+
+
+def load_signal_index(path: str | Path) -> SignalIndex | None:
+    """
+    sidecar 인덱스를 읽는다. 없거나 CSV가 인덱스 생성 이후 바뀌었으면 None.
+    """
+    signal_path = Path(path)
+    index_path = signal_index_path(signal_path)
+    if compression_of(signal_path) or not index_path.exists() or not signal_path.exists():
+        return None
+    try:
+        payload = json.loads(index_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if payload.pop("version", None) != SIGNAL_INDEX_VERSION:
+        return None
+
+    index = SignalIndex(**payload)
+    stat = signal_path.stat()
+    if stat.st_size != index.source_size or stat.st_mtime_ns != index.source_mtime_ns:
+        return None
+    return index
+
+
+def read_indexed_csv(
+    path: str | Path,
+    start: date | None = None,
+    end: date | None = None,
+    index: SignalIndex | None = None,
+    **read_csv_options,
+) -> pd.DataFrame:
+    """
+    sidecar 인덱스로 [start, end] 구간의 바이트 위치로 바로 이동해 해당 행만 pandas로 읽는다.
+    컬럼 스키마는 검사하지 않으므로 date 컬럼만 있으면 어떤 CSV에도 쓸 수 있다.
+    """
+    signal_path = Path(path)
+    index = index or load_signal_index(signal_path)
+    if index is None:
+        raise FileNotFoundError(f"No up-to-date signal index for: {signal_path}")
+
+    offset, row_count = index.locate(start, end)
+    if row_count == 0:
+        return pd.DataFrame({column: pd.Series(dtype=object) for column in index.header})
+
+    with signal_path.open("rb") as file:
+        file.seek(offset)
+        return pd.read_csv(file, header=None, names=index.header, nrows=row_count, **read_csv_options)
+
+
+def _read_signals_csv(
+    path: Path,
+    start: date | None,
+    end: date | None,
+    symbols: set[str] | None,
+) -> SignalFrame:
+    _check_csv_header(path)
+    index = load_signal_index(path) if start is not None or end is not None else None
+    if index is not None:
+        df = read_indexed_csv(path, start=start, end=end, index=index, **_csv_reader_options())
+    else:
+        with open_binary(path) as file:
+            df = pd.read_csv(file, **_csv_reader_options())
+    frame = SignalFrame.from_columns(df["date"], df["symbol"], df["score"])
+    return frame.filter(start=start, end=end, symbols=symbols)
+
+
+def _check_parquet_schema(pq, path: Path):
+    """
+    필수 컬럼을 확인하고 date 컬럼의 arrow 타입을 돌려준다.
+    """
+    schema = pq.read_schema(path)
+    if not set(SIGNAL_COLUMNS).issubset(set(schema.names)):
+        raise ValueError("Signal parquet must contain columns: date,symbol,score")
+    date_type = schema.field("date").type
+    if hasattr(date_type, "value_type"):
+        date_type = date_type.value_type
+    return date_type
+
+
+def _parquet_date_pushdown(pa, date_type) -> bool:
+    """
+    date 컬럼 값/통계를 날짜와 바로 비교할 수 있는지. 문자열(0 채움이 없을 수 있음)과 시간대가 있는
+    timestamp(통계는 UTC, 날짜는 현지 기준)는 읽은 뒤 파싱해서 거른다.
+    """
+    return pa.types.is_date(date_type) or (pa.types.is_timestamp(date_type) and date_type.tz is None)
+
+
+def _parquet_date_filters(pa, date_type, start: date | None, end: date | None) -> list[tuple]:
+    if not _parquet_date_pushdown(pa, date_type):
+        return []
+    if pa.types.is_date(date_type):
+        lower, upper, upper_op = start, end, "<="
+    else:
+        # timestamp는 종료일 하루 전체를 포함하도록 다음 날 0시 미만으로 비교한다.
+        lower = None if start is None else pa.scalar(datetime.combine(start, datetime.min.time()), type=date_type)
+        upper = None if end is None else pa.scalar(datetime.fromordinal(end.toordinal() + 1), type=date_type)
+        upper_op = "<"
+    filters = []
+    if lower is not None:
+        filters.append(("date", ">=", lower))
+    if upper is not None:
+        filters.append(("date", upper_op, upper))
+    return filters
+
+
+def _arrow_day_ordinals(pa, column) -> np.ndarray:
+    if pa.types.is_dictionary(column.type):
+        column = column.cast(column.type.value_type)
+    if pa.types.is_string(column.type) or pa.types.is_large_string(column.type):
+        return parse_day_ordinals(column.to_numpy(zero_copy_only=False))
+    epoch_days = column.cast(pa.date32()).cast(pa.int32()).to_numpy()
+    return (epoch_days.astype(np.int64) + EPOCH_ORDINAL).astype(np.int32)
+
+
+def _frame_from_arrow(pa, table) -> SignalFrame:
+    if table.num_rows == 0:
+        return SignalFrame.empty()
+    encoded = table.column("symbol").combine_chunks().dictionary_encode()
+    raw_codes = encoded.indices.to_numpy(zero_copy_only=False)
+    remap, symbol_names = _encode_symbols(encoded.dictionary.to_pylist())
+    return SignalFrame(
+        days=_arrow_day_ordinals(pa, table.column("date")),
+        codes=remap[raw_codes],
+        scores=table.column("score").to_numpy().astype(np.float64, copy=False),
+        symbols=symbol_names,
+    )
+
+
+def _read_signals_parquet(
+    path: Path,
+    start: date | None,
+    end: date | None,
+    symbols: set[str] | None,
+) -> SignalFrame:
+    pa, pq = _require_pyarrow()
+    date_type = _check_parquet_schema(pq, path)
+
+    # 행 그룹 통계(min/max)로 날짜/종목 조건을 파일 레벨에서 걸러낸다.
+    filters = _parquet_date_filters(pa, date_type, start, end)
+    if symbols is not None:
+        filters.append(("symbol", "in", sorted(symbols)))
+
+    table = pq.read_table(path, columns=SIGNAL_COLUMNS, filters=filters or None)
+    frame = _frame_from_arrow(pa, table)
+    if _parquet_date_pushdown(pa, date_type):
+        return frame
+    return frame.filter(start=start, end=end)
+
+
+def _binary_record_dtype(score_bytes: int) -> np.dtype:
+    return np.dtype([("day", "<i4"), ("symbol", "<i4"), ("score", f"<f{score_bytes}")])
+
+
+def _align8(value: int) -> int:
+    return (value + 7) & ~7
+
+
+def _memmap(path: Path, dtype: np.dtype, offset: int, count: int) -> np.ndarray:
+    if count == 0:
+        return np.empty(0, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode="r", offset=offset, shape=(count,))
+
+
+class BinarySignalFile:
+    """
+    고정 폭 바이너리 신호 파일(.nsig)을 np.memmap으로 연다.
+
+    레이아웃: 64바이트 헤더 | 심볼 사전(UTF-8, 줄바꿈 구분) | 일자 테이블
+    (int32 day ordinal[n_days] + int64 레코드 시작 위치[n_days + 1]) | 레코드(day, symbol id, score).
+    레코드는 날짜순이므로 하루치 조회는 일자 테이블 이진 탐색 + memmap slice(복사 없음)로 끝난다.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        with self.path.open("rb") as file:
+            header = file.read(BINARY_HEADER_SIZE)
+            if len(header) < BINARY_HEADER_SIZE or header[:4] != BINARY_MAGIC:
+                raise ValueError(f"Not a NeonAlpha binary signal file: {self.path}")
+            (
+                _,
+                version,
+                score_bytes,
+                _,
+                n_symbols,
+                n_days,
+                n_records,
+                symbols_offset,
+                symbols_nbytes,
+                days_offset,
+                records_offset,
+            ) = BINARY_HEADER.unpack(header[: BINARY_HEADER.size])
+            if version != BINARY_VERSION:
+                raise ValueError(f"Unsupported binary signal version {version}: {self.path}")
+            file.seek(symbols_offset)
+            names = file.read(symbols_nbytes).decode("utf-8")
+
+        self.symbols: tuple[str, ...] = tuple(names.split("\n")) if n_symbols else ()
+        self.score_dtype = np.dtype(f"<f{score_bytes}")
+        self.day_ordinals = _memmap(self.path, np.dtype("<i4"), days_offset, n_days)
+        self.day_starts = _memmap(self.path, np.dtype("<i8"), days_offset + _align8(4 * n_days), n_days + 1)
+        self.records = _memmap(self.path, _binary_record_dtype(score_bytes), records_offset, n_records)
+
+    def __len__(self) -> int:
+        return int(self.records.shape[0])
+
+    def frame_range(self, begin: int, finish: int) -> SignalFrame:
+        block = self.records[begin:finish]
+        scores = block["score"]
+        return SignalFrame(
+            days=block["day"],
+            codes=block["symbol"],
+            scores=scores if scores.dtype == np.float64 else scores.astype(np.float64),
+            symbols=self.symbols,
+        )
+
+    def day(self, signal_date: date) -> SignalFrame:
+        ordinal = signal_date.toordinal()
+        position = int(np.searchsorted(self.day_ordinals, ordinal))
+        if position >= len(self.day_ordinals) or int(self.day_ordinals[position]) != ordinal:
+            return SignalFrame(
+                days=np.empty(0, dtype=np.int32),
+                codes=np.empty(0, dtype=np.int32),
+                scores=np.empty(0, dtype=np.float64),
+                symbols=self.symbols,
             )
+        return self.frame_range(int(self.day_starts[position]), int(self.day_starts[position + 1]))
+
+    def slice(self, start: date | None = None, end: date | None = None) -> SignalFrame:
+        first = 0 if start is None else int(np.searchsorted(self.day_ordinals, start.toordinal(), side="left"))
+        last = (
+            len(self.day_ordinals)
+            if end is None
+            else int(np.searchsorted(self.day_ordinals, end.toordinal(), side="right"))
+        )
+        if first >= last:
+            return self.frame_range(0, 0)
+        return self.frame_range(int(self.day_starts[first]), int(self.day_starts[last]))
+
+    def iter_days(self, start: date | None = None, end: date | None = None) -> Iterator[tuple[int, SignalFrame]]:
+        first = 0 if start is None else int(np.searchsorted(self.day_ordinals, start.toordinal(), side="left"))
+        last = (
+            len(self.day_ordinals)
+            if end is None
+            else int(np.searchsorted(self.day_ordinals, end.toordinal(), side="right"))
+        )
+        for position in range(first, last):
+            yield (
+                int(self.day_ordinals[position]),
+                self.frame_range(int(self.day_starts[position]), int(self.day_starts[position + 1])),
+            )
+
+
+def _write_signals_binary(path: Path, rows: Iterable[SignalRow], score_dtype: str) -> None:
+    if score_dtype not in BINARY_SCORE_DTYPES:
+        raise ValueError(f"score_dtype must be one of: {', '.join(BINARY_SCORE_DTYPES)}")
+    score_bytes = BINARY_SCORE_DTYPES[score_dtype]
 
-    return rows
+    frame = SignalFrame.from_rows(rows).sort_by_day()
+    # 파일에는 실제로 쓰인 심볼만 담은 로컬 사전을 저장한다.
+    used_codes, local_codes = np.unique(frame.codes, return_inverse=True)
+    file_symbols = [frame.symbols[int(code)] for code in used_codes]
+    day_ordinals, day_first = (
+        np.unique(frame.days, return_index=True) if len(frame) else (np.empty(0, np.int32), np.empty(0, np.int64))
+    )
+    day_starts = np.append(day_first, len(frame)).astype("<i8")
 
+    names = "\n".join(file_symbols).encode("utf-8")
+    symbols_offset = BINARY_HEADER_SIZE
+    days_offset = _align8(symbols_offset + len(names))
+    records_offset = _align8(days_offset + _align8(4 * len(day_ordinals)) + 8 * len(day_starts))
 
-def write_signals(path: str | Path, rows: Iterable[SignalRow]) -> None:
+    records = np.empty(len(frame), dtype=_binary_record_dtype(score_bytes))
+    records["day"] = frame.days
+    records["symbol"] = local_codes
+    records["score"] = frame.scores
+
+    header = BINARY_HEADER.pack(
+        BINARY_MAGIC,
+        BINARY_VERSION,
+        score_bytes,
+        0,
+        len(file_symbols),
+        len(day_ordinals),
+        len(frame),
+        symbols_offset,
+        len(names),
+        days_offset,
+        records_offset,
+    )
+    with path.open("wb") as file:
+        file.write(header.ljust(BINARY_HEADER_SIZE, b"\0"))
+        file.write(names)
+        file.seek(days_offset)
+        file.write(day_ordinals.astype("<i4").tobytes())
+        file.seek(days_offset + _align8(4 * len(day_ordinals)))
+        file.write(day_starts.tobytes())
+        file.seek(records_offset)
+        file.write(records.tobytes())
+
+
+def read_signal_frame(
+    path: str | Path,
+    fmt: str | None = None,
+    start: date | None = None,
+    end: date | None = None,
+    symbols: Collection[str] | None = None,
+) -> SignalFrame:
+    """
+    신호 파일을 SignalFrame으로 읽는다. start/end(포함)와 symbols 조건은 가능한 한 저장 포맷 레벨에서 적용된다.
+    """
     signal_path: Path = Path(path)
-    signal_path.parent.mkdir(parents=True, exist_ok=True)
+    wanted = _normalize_symbols(symbols)
+
+    signal_format = detect_signal_format(signal_path, fmt)
+    if signal_format == "store":
+        from .signal_store import SignalStore
+
+        return SignalStore(signal_path).read(start, end, wanted)
+    if signal_format == "parquet":
+        return _read_signals_parquet(signal_path, start, end, wanted)
+    if signal_format == "binary":
+        return BinarySignalFile(signal_path).slice(start, end).filter(symbols=wanted)
+    return _read_signals_csv(signal_path, start, end, wanted)
+
+
+def read_signals(
+    path: str | Path,
+    fmt: str | None = None,
+    start: date | None = None,
+    end: date | None = None,
+    symbols: Collection[str] | None = None,
+) -> list[SignalRow]:
+    return read_signal_frame(path, fmt=fmt, start=start, end=end, symbols=symbols).to_rows()
+
+
+@dataclass(frozen=True, eq=False)
+class SignalDay:
+    """
+    하루치 신호 블록. ids는 전역 SYMBOLS 기준 심볼 id이며, 중복 검사를 위해 순서와 중복을 그대로 보존한다.
+    """
+
+    signal_date: date
+    ids: np.ndarray
+    scores: np.ndarray
+
+    @property
+    def day_key(self) -> str:
+        return self.signal_date.strftime(DATE_FORMAT)
+
+    @property
+    def symbols(self) -> tuple[str, ...]:
+        return tuple(SYMBOLS.names(self.ids).tolist())
+
+    def to_dict(self) -> dict[str, float]:
+        return dict(zip(self.symbols, self.scores.tolist()))
+
+    def to_id_dict(self) -> dict[int, float]:
+        return dict(zip(self.ids.tolist(), self.scores.tolist()))
+
+
+def _iter_csv_chunks(
+    path: Path,
+    chunk_rows: int,
+    start: date | None,
+    end: date | None,
+) -> Iterator[SignalFrame]:
+    _check_csv_header(path)
+    index = load_signal_index(path) if start is not None or end is not None else None
+    if index is None:
+        with open_binary(path) as file, pd.read_csv(file, chunksize=chunk_rows, **_csv_reader_options()) as reader:
+            for chunk in reader:
+                yield SignalFrame.from_columns(chunk["date"], chunk["symbol"], chunk["score"])
+        return
+
+    offset, row_count = index.locate(start, end)
+    if row_count == 0:
+        return
+    with path.open("rb") as file:
+        file.seek(offset)
+        options = {"header": None, "names": index.header, "nrows": row_count, "chunksize": chunk_rows}
+        with pd.read_csv(file, **options, **_csv_reader_options()) as reader:
+            for chunk in reader:
+                yield SignalFrame.from_columns(chunk["date"], chunk["symbol"], chunk["score"])
+
+
+def _iter_parquet_chunks(
+    path: Path,
+    chunk_rows: int,
+    start: date | None,
+    end: date | None,
+) -> Iterator[SignalFrame]:
+    pa, pq = _require_pyarrow()
+    date_type = _check_parquet_schema(pq, path)
+    parquet_file = pq.ParquetFile(path)
+    date_index = parquet_file.schema_arrow.get_field_index("date")
+    pushdown = _parquet_date_pushdown(pa, date_type)
+
+    # 날짜 통계가 범위 밖인 행 그룹은 아예 읽지 않는다.
+    row_groups: list[int] = []
+    for group in range(parquet_file.metadata.num_row_groups):
+        stats = parquet_file.metadata.row_group(group).column(date_index).statistics
+        if pushdown and stats is not None and stats.has_min_max:
+            first, last = _stat_day(stats.min), _stat_day(stats.max)
+            if (start is not None and last < start) or (end is not None and first > end):
+                continue
+        row_groups.append(group)
+    if not row_groups:
+        return
+
+    for batch in parquet_file.iter_batches(batch_size=chunk_rows, row_groups=row_groups, columns=SIGNAL_COLUMNS):
+        yield _frame_from_arrow(pa, pa.Table.from_batches([batch]))
+
+
+def _stat_day(value) -> date:
+    return value.date() if isinstance(value, datetime) else value
+
+
+def _concat_frames(left: SignalFrame, right: SignalFrame) -> SignalFrame:
+    if not len(left):
+        return right
+    return SignalFrame(
+        days=np.concatenate((left.days, right.days)),
+        codes=np.concatenate((left.symbol_ids(), right.symbol_ids())),
+        scores=np.concatenate((left.scores, right.scores)),
+        symbols=SYMBOLS,
+    )
+
+
+def _signal_day(day: int, block: SignalFrame) -> SignalDay:
+    return SignalDay(signal_date=date.fromordinal(day), ids=block.symbol_ids(), scores=block.scores)
+
+
+def iter_signal_chunks(
+    path: str | Path,
+    fmt: str | None = None,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+) -> Iterator[SignalFrame]:
+    """
+    파일 순서 그대로 최대 chunk_rows 행씩 SignalFrame을 돌려준다(정렬 가정 없음).
+    """
+    signal_path: Path = Path(path)
+    if chunk_rows <= 0:
+        raise ValueError("chunk_rows must be positive")
+
+    signal_format = detect_signal_format(signal_path, fmt)
+    if signal_format == "store":
+        from .signal_store import SignalStore
+
+        store = SignalStore(signal_path)
+        for partition in store.partitions():
+            yield read_signal_frame(partition.path, fmt=store.partition_format)
+    elif signal_format == "binary":
+        binary = BinarySignalFile(signal_path)
+        for begin in range(0, len(binary), chunk_rows):
+            yield binary.frame_range(begin, min(begin + chunk_rows, len(binary)))
+    elif signal_format == "parquet":
+        yield from _iter_parquet_chunks(signal_path, chunk_rows, None, None)
+    else:
+        yield from _iter_csv_chunks(signal_path, chunk_rows, None, None)
+
+
+def iter_signal_days(
+    path: str | Path,
+    fmt: str | None = None,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+    start: date | None = None,
+    end: date | None = None,
+    symbols: Collection[str] | None = None,
+) -> Iterator[SignalDay]:
+    """
+    날짜순으로 정렬된 신호 파일을 chunk_rows 단위로 읽으며 하루치 블록(SignalDay)을 차례로 돌려준다.
+    메모리는 chunk 하나 + 걸쳐 있는 하루치로 제한된다. 날짜가 역행하면 ValueError.
+    """
+    signal_path: Path = Path(path)
+    wanted = _normalize_symbols(symbols)
+    if chunk_rows <= 0:
+        raise ValueError("chunk_rows must be positive")
+
+    signal_format = detect_signal_format(signal_path, fmt)
+    if signal_format == "store":
+        from .signal_store import SignalStore
+
+        yield from SignalStore(signal_path).iter_days(start, end, wanted)
+        return
+    if signal_format == "binary":
+        # 일자 테이블이 있으므로 chunk 없이 하루치 memmap slice를 바로 넘긴다.
+        for day, block in BinarySignalFile(signal_path).iter_days(start, end):
+            yield _signal_day(day, block.filter(symbols=wanted))
+        return
+    if signal_format == "parquet":
+        chunks = _iter_parquet_chunks(signal_path, chunk_rows, start, end)
+    else:
+        chunks = _iter_csv_chunks(signal_path, chunk_rows, start, end)
+
+    carry = SignalFrame.empty()
+    last_day: int | None = None
+    for chunk in chunks:
+        if len(chunk) > 1 and bool(np.any(chunk.days[1:] < chunk.days[:-1])):
+            raise ValueError("Signal file must be sorted by date for streaming reads.")
+        if len(chunk) and last_day is not None and int(chunk.days[0]) < last_day:
+            raise ValueError("Signal file must be sorted by date for streaming reads.")
+        if len(chunk):
+            last_day = int(chunk.days[-1])
+
+        pending = _concat_frames(carry, chunk)
+        if not len(pending):
+            continue
+        # 마지막 날짜는 다음 chunk로 이어질 수 있으므로 보류한다.
+        tail_start = int(np.searchsorted(pending.days, pending.days[-1], side="left"))
+        complete, carry = pending[:tail_start], pending[tail_start:]
+
+        for day, block in complete.filter(start=start, end=end, symbols=wanted).day_blocks():
+            yield _signal_day(day, block)
+        if end is not None and last_day is not None and last_day > end.toordinal():
+            return
+
+    for day, block in carry.filter(start=start, end=end, symbols=wanted).day_blocks():
+        yield _signal_day(day, block)
+
 
-    with signal_path.open("w", encoding="utf-8", newline="") as file:
+def _write_signals_csv(path: Path, rows: Iterable[SignalRow]) -> None:
+    if isinstance(rows, SignalFrame):
+        with open_text(path, "w") as file:
+            pd.DataFrame(
+                {"date": rows.date_strings(), "symbol": rows.symbol_values(), "score": rows.scores}
+            ).to_csv(file, index=False, float_format="%.10f", lineterminator="\r\n")
+        return
+
+    with open_text(path, "w") as file:
         writer = csv.writer(file)
         writer.writerow(["date", "symbol", "score"])
         for row in rows:
             writer.writerow([row.signal_date.strftime(DATE_FORMAT), row.symbol, f"{row.score:.10f}"])
 
 
-def index_signals_by_day(rows: Iterable[SignalRow]) -> dict[str, dict[str, float]]:
+def _write_signals_parquet(path: Path, rows: Iterable[SignalRow]) -> None:
+    pa, pq = _require_pyarrow()
+
+    # 날짜 순으로 정렬해 두어야 행 그룹 통계가 날짜 범위 pushdown에 쓸모가 있다.
+    frame = SignalFrame.from_rows(rows)
+    symbol_values = frame.symbol_values()
+    order = np.lexsort((symbol_values.astype(str), frame.days)) if len(frame) else np.empty(0, dtype=np.int64)
+    table = pa.table(
+        {
+            "date": pa.array(frame.days[order].astype(np.int32) - EPOCH_ORDINAL, type=pa.int32()).cast(pa.date32()),
+            "symbol": pa.array(symbol_values[order].tolist(), type=pa.string()),
+            "score": pa.array(frame.scores[order], type=pa.float64()),
+        }
+    )
+    pq.write_table(table, path, row_group_size=PARQUET_ROW_GROUP_SIZE)
+
+
+def write_signals(
+    path: str | Path,
+    rows: Iterable[SignalRow],
+    fmt: str | None = None,
+    score_dtype: str = "float64",
+    index: bool = False,
+) -> None:
+    """
+    score_dtype은 binary 포맷에서만 쓰인다(float32로 레코드 크기를 16 -> 12바이트로 줄일 수 있다).
+    index=True이면 CSV를 날짜순으로 정렬해 쓰고 sidecar 인덱스(<csv>.idx)를 함께 만든다.
+    store 포맷은 파일 전체를 다시 쓰지 않고 rows에 있는 날짜 파티션만 추가/교체한다.
+    """
+    signal_path: Path = Path(path)
+    signal_path.parent.mkdir(parents=True, exist_ok=True)
+
+    signal_format = detect_signal_format(signal_path, fmt)
+    if index and compression_of(signal_path):
+        raise ValueError(f"Cannot build a signal index for a compressed CSV: {signal_path}")
+    if signal_format == "store":
+        from .signal_store import SignalStore
+
+        SignalStore(signal_path).append(rows, overwrite=True)
+    elif signal_format == "parquet":
+        _write_signals_parquet(signal_path, rows)
+    elif signal_format == "binary":
+        _write_signals_binary(signal_path, rows, score_dtype)
+    elif index:
+        _write_signals_csv(signal_path, SignalFrame.from_rows(rows).sort_by_day())
+        build_signal_index(signal_path)
+    else:
+        _write_signals_csv(signal_path, rows)
+
+
+def latest_signal_date(path: str | Path, fmt: str | None = None) -> date | None:
+    """
+    가장 최근 신호 날짜. 인덱스/메타데이터가 있으면 본문을 읽지 않는다.
+    """
+    signal_path = Path(path)
+    signal_format = detect_signal_format(signal_path, fmt)
+    if signal_format == "store":
+        from .signal_store import SignalStore
+
+        return SignalStore(signal_path).latest_date()
+    if signal_format == "binary":
+        ordinals = BinarySignalFile(signal_path).day_ordinals
+        return date.fromordinal(int(ordinals[-1])) if len(ordinals) else None
+    if signal_format == "parquet":
+        return _latest_parquet_date(signal_path)
+    index = load_signal_index(signal_path)
+    if index is not None:
+        return index.last_day
+
+    frame = read_signal_frame(signal_path, fmt=signal_format)
+    return date.fromordinal(int(frame.days.max())) if len(frame) else None
+
+
+def _latest_parquet_date(path: Path) -> date | None:
+    """
+    행 그룹 통계의 최댓값으로 최근 날짜를 구한다. 통계가 없거나 믿을 수 없는 타입이면 date 컬럼만 읽는다.
+    """
+    pa, pq = _require_pyarrow()
+    date_type = _check_parquet_schema(pq, path)
+    parquet_file = pq.ParquetFile(path)
+    metadata = parquet_file.metadata
+    if not metadata.num_rows:
+        return None
+    date_index = parquet_file.schema_arrow.get_field_index("date")
+    if _parquet_date_pushdown(pa, date_type):
+        maxima = []
+        for group in range(metadata.num_row_groups):
+            row_group = metadata.row_group(group)
+            stats = row_group.column(date_index).statistics
+            if not row_group.num_rows:
+                continue
+            if stats is None or not stats.has_min_max:
+                break
+            maxima.append(_stat_day(stats.max))
+        else:
+            return max(maxima) if maxima else None
+    days = _arrow_day_ordinals(pa, pq.read_table(path, columns=["date"]).column("date"))
+    return date.fromordinal(int(days.max())) if len(days) else None
+
+
+def index_signals_by_day(rows: Iterable[SignalRow] | SignalFrame) -> dict[str, dict[str, float]]:
+    if isinstance(rows, SignalFrame):
+        return {
+            date.fromordinal(day).strftime(DATE_FORMAT): dict(
+                zip(block.symbol_values().tolist(), block.scores.tolist())
+            )
+            for day, block in rows.day_blocks()
+        }
+
     by_day: dict[str, dict[str, float]] = {}
     for row in rows:
         day_key: str = row.signal_date.strftime(DATE_FORMAT)
@@ -62,3 +1013,179 @@ def index_signals_by_day(rows: Iterable[SignalRow]) -> dict[str, dict[str, float
             by_day[day_key] = {}
         by_day[day_key][row.symbol] = row.score
     return by_day
+
+
+@dataclass(frozen=True, eq=False)
+class MergedSignals:
+    """
+    여러 모델 신호를 (date, symbol) 키 하나에 모은 다중 점수 테이블.
+    scores[i, j]는 i번째 키에 대한 sources[j]의 점수(없으면 NaN).
+    duplicates/conflicts는 소스별로 같은 키가 여러 번 나온 수와 그중 점수가 서로 다른 수이다.
+    """
+
+    days: np.ndarray
+    ids: np.ndarray
+    scores: np.ndarray
+    sources: tuple[str, ...]
+    duplicates: dict[str, int]
+    conflicts: dict[str, int]
+
+    def __len__(self) -> int:
+        return int(self.days.shape[0])
+
+    def combined(self) -> SignalFrame:
+        """
+        소스별 점수의 평균(있는 값만)으로 하나의 SignalFrame을 만든다.
+        """
+        available = np.isfinite(self.scores)
+        counts = available.sum(axis=1)
+        totals = np.where(available, self.scores, 0.0).sum(axis=1)
+        keep = counts > 0
+        return SignalFrame(
+            days=self.days[keep],
+            codes=self.ids[keep],
+            scores=totals[keep] / counts[keep],
+            symbols=SYMBOLS,
+        )
+
+    def to_dataframe(self) -> pd.DataFrame:
+        combined = self.combined()
+        df = pd.DataFrame({"date": format_day_ordinals(self.days), "symbol": SYMBOLS.names(self.ids)})
+        df["score"] = np.nan
+        df.loc[np.isfinite(self.scores).any(axis=1), "score"] = combined.scores
+        for column, source in enumerate(self.sources):
+            df[source] = self.scores[:, column]
+        return df
+
+
+def expand_signal_sources(sources: str | Path | Iterable[str | Path]) -> list[Path]:
+    """
+    디렉터리(안의 신호 파일), glob 패턴, 경로 목록을 정렬된 파일 목록으로 펼친다.
+    """
+    items = [sources] if isinstance(sources, (str, Path)) else list(sources)
+    suffixes = {".csv", *PARQUET_SUFFIXES, *BINARY_SUFFIXES}
+    paths: list[Path] = []
+    for item in items:
+        item_path = Path(item)
+        if item_path.is_dir() and not (item_path / STORE_MANIFEST_NAME).exists():
+            members = (path for path in item_path.iterdir() if strip_compression_suffix(path).suffix.lower() in suffixes)
+            paths.extend(sorted(members))
+        elif glob.has_magic(str(item)):
+            paths.extend(Path(match) for match in sorted(glob.glob(str(item))))
+        else:
+            paths.append(item_path)
+
+    unique: dict[Path, None] = dict.fromkeys(paths)
+    return list(unique)
+
+
+def _source_name(path: Path, taken: set[str]) -> str:
+    stem = path.name if path.is_dir() else strip_compression_suffix(path).stem
+    name = stem[: -len("_signals")] if stem.endswith("_signals") and len(stem) > len("_signals") else stem
+    candidate, counter = name, 2
+    while candidate in taken:
+        candidate = f"{name}_{counter}"
+        counter += 1
+    taken.add(candidate)
+    return candidate
+
+
+def _load_source(path: Path, fmt: str | None) -> tuple[np.ndarray, np.ndarray, np.ndarray, list[str], int, int]:
+    """
+    소스 하나를 읽고 같은 패스에서 중복/충돌을 센다. 프로세스 풀에서도 돌 수 있도록
+    전역 id 대신 (파일 로컬 코드, 심볼 이름)을 돌려준다. 중복 키는 마지막 값을 쓴다.
+    """
+    frame = read_signal_frame(path, fmt=fmt)
+    used_codes, local_codes = np.unique(frame.codes, return_inverse=True)
+    names = [frame.symbols[int(code)] for code in used_codes]
+    if not len(frame):
+        empty = np.empty(0, dtype=np.int32)
+        return empty, empty, np.empty(0, dtype=np.float64), names, 0, 0
+
+    keys = (frame.days.astype(np.int64) << 32) | local_codes.astype(np.int64)
+    order = np.argsort(keys, kind="stable")
+    sorted_keys = keys[order]
+    sorted_scores = frame.scores[order]
+    starts = np.flatnonzero(np.r_[True, sorted_keys[1:] != sorted_keys[:-1]])
+    ends = np.r_[starts[1:], len(sorted_keys)]
+    group_sizes = ends - starts
+
+    repeated = group_sizes > 1
+    duplicate_count = int(np.count_nonzero(repeated))
+    conflict_count = 0
+    if duplicate_count:
+        group_max = np.maximum.reduceat(sorted_scores, starts)
+        group_min = np.minimum.reduceat(sorted_scores, starts)
+        conflict_count = int(np.count_nonzero(repeated & (group_max != group_min)))
+
+    last = order[ends - 1]
+    return (
+        frame.days[last],
+        local_codes[last].astype(np.int32),
+        frame.scores[last],
+        names,
+        duplicate_count,
+        conflict_count,
+    )
+
+
+def read_signal_sources(
+    sources: str | Path | Iterable[str | Path],
+    fmt: str | None = None,
+    max_workers: int | None = None,
+    use_processes: bool = False,
+) -> MergedSignals:
+    """
+    여러 신호 파일을 스레드(또는 프로세스) 풀로 동시에 읽어 (date, symbol) 기준 다중 점수 테이블로 합친다.
+    """
+    paths = expand_signal_sources(sources)
+    if not paths:
+        raise ValueError("No signal files matched the given sources.")
+
+    taken: set[str] = set()
+    names = [_source_name(path, taken) for path in paths]
+    executor_class: type[Executor] = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+    with executor_class(max_workers=max_workers) as executor:
+        loaded = list(executor.map(_load_source, paths, [fmt] * len(paths)))
+
+    source_keys: list[np.ndarray] = []
+    for days, local_codes, _, symbol_names, _, _ in loaded:
+        ids = SYMBOLS.intern_many(symbol_names)
+        global_codes = ids[local_codes] if len(local_codes) else local_codes
+        source_keys.append((days.astype(np.int64) << 32) | global_codes.astype(np.int64))
+
+    all_keys = np.unique(np.concatenate(source_keys)) if source_keys else np.empty(0, dtype=np.int64)
+    scores = np.full((len(all_keys), len(paths)), np.nan, dtype=np.float64)
+    for column, (keys, item) in enumerate(zip(source_keys, loaded)):
+        scores[np.searchsorted(all_keys, keys), column] = item[2]
+
+    return MergedSignals(
+        days=(all_keys >> 32).astype(np.int32),
+        ids=(all_keys & 0xFFFFFFFF).astype(np.int32),
+        scores=scores,
+        sources=tuple(names),
+        duplicates={name: item[4] for name, item in zip(names, loaded)},
+        conflicts={name: item[5] for name, item in zip(names, loaded)},
+    )
+
+
+def read_signal_sets(
+    sources: str | Path | Iterable[str | Path],
+    fmt: str | None = None,
+    start: date | None = None,
+    end: date | None = None,
+    max_workers: int | None = None,
+) -> dict[str, SignalFrame]:
+    """
+    여러 신호 파일을 스레드 풀로 읽어 {소스 이름: SignalFrame}으로 돌려준다(전략별 동시 paper 평가용).
+    이름은 read_signal_sources와 같다(파일 이름에서 _signals 접미사를 뗀 것).
+    """
+    paths = expand_signal_sources(sources)
+    if not paths:
+        raise ValueError("No signal files matched the given sources.")
+
+    taken: set[str] = set()
+    names = [_source_name(path, taken) for path in paths]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        frames = list(executor.map(lambda path: read_signal_frame(path, fmt=fmt, start=start, end=end), paths))
+    return dict(zip(names, frames))
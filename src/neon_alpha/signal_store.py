@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+from collections.abc import Collection, Iterable, Iterator
+from dataclasses import dataclass
+from datetime import date
+import json
+import os
+from pathlib import Path
+import uuid
+
+import numpy as np
+
+from .signal_io import (
+    DATE_FORMAT,
+    STORE_MANIFEST_NAME,
+    SignalDay,
+    SignalFrame,
+    SignalRow,
+    read_signal_frame,
+    write_signals,
+)
+from .symbols import SYMBOLS
+
+
+MANIFEST_NAME: str = STORE_MANIFEST_NAME
+MANIFEST_VERSION: int = 1
+PARTITION_PREFIX: str = "date="
+PARTITION_SUFFIXES: dict[str, str] = {"csv": ".csv", "parquet": ".parquet", "binary": ".nsig"}
+
+
+@dataclass(frozen=True)
+class SignalPartition:
+    day_key: str
+    path: Path
+    rows: int
+
+    @property
+    def signal_date(self) -> date:
+        return date.fromisoformat(self.day_key)
+
+
+def is_signal_store(path: str | Path) -> bool:
+    return (Path(path) / MANIFEST_NAME).exists()
+
+
+def _atomic_write_text(path: Path, text: str) -> None:
+    temp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex[:8]}.tmp")
+    with temp_path.open("w", encoding="utf-8") as file:
+        file.write(text)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temp_path, path)
+
+
+class SignalStore:
+    """
+    날짜별 파티션(<root>/date=YYYY-MM-DD/part-*.csv)으로 신호를 쌓는 append-only 저장소.
+
+    새 파티션 파일은 임시 이름으로 쓴 뒤 os.replace로 확정하고, 마지막에 _manifest.json을
+    같은 방식으로 교체해 커밋한다. 리더는 manifest에 올라간 파티션만 보므로 쓰다 만 파일은 보이지 않는다.
+    writer는 저장소당 하나라고 가정한다.
+    """
+
+    def __init__(self, root: str | Path, partition_format: str = "csv") -> None:
+        self.root = Path(root)
+        manifest = self._load_manifest()
+        self.partition_format: str = manifest.get("format", partition_format)
+        if self.partition_format not in PARTITION_SUFFIXES:
+            raise ValueError(f"Unsupported partition format: {self.partition_format}")
+        self._partitions: dict[str, dict[str, object]] = manifest.get("partitions", {})
+
+    def _load_manifest(self) -> dict:
+        manifest_path = self.root / MANIFEST_NAME
+        if not manifest_path.exists():
+            return {}
+        payload = json.loads(manifest_path.read_text(encoding="utf-8"))
+        if payload.get("version") != MANIFEST_VERSION:
+            raise ValueError(f"Unsupported signal store manifest version: {manifest_path}")
+        return payload
+
+    def _commit_manifest(self) -> None:
+        payload = {
+            "version": MANIFEST_VERSION,
+            "format": self.partition_format,
+            "partitions": dict(sorted(self._partitions.items())),
+        }
+        _atomic_write_text(self.root / MANIFEST_NAME, json.dumps(payload, indent=1))
+
+    def partitions(self, start: date | None = None, end: date | None = None) -> list[SignalPartition]:
+        low = start.strftime(DATE_FORMAT) if start is not None else None
+        high = end.strftime(DATE_FORMAT) if end is not None else None
+        return [
+            SignalPartition(day_key=day_key, path=self.root / str(entry["file"]), rows=int(entry["rows"]))
+            for day_key, entry in sorted(self._partitions.items())
+            if (low is None or day_key >= low) and (high is None or day_key <= high)
+        ]
+
+    def latest_date(self) -> date | None:
+        return date.fromisoformat(max(self._partitions)) if self._partitions else None
+
+    def append(self, rows: Iterable[SignalRow] | SignalFrame, overwrite: bool = False) -> list[str]:
+        """
+        rows를 날짜별 파티션으로 추가한다. 이미 있는 날짜는 overwrite=True일 때만 교체한다.
+        비용은 추가되는 날짜의 행 수에만 비례한다.
+        """
+        frame = SignalFrame.from_rows(rows)
+        blocks = [(date.fromordinal(day).strftime(DATE_FORMAT), block) for day, block in frame.day_blocks()]
+        existing = [day_key for day_key, _ in blocks if day_key in self._partitions]
+        if existing and not overwrite:
+            raise ValueError(f"Partitions already exist (use overwrite): {', '.join(existing)}")
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        suffix = PARTITION_SUFFIXES[self.partition_format]
+        replaced: list[Path] = []
+        for day_key, block in blocks:
+            partition_dir = self.root / f"{PARTITION_PREFIX}{day_key}"
+            partition_dir.mkdir(exist_ok=True)
+            file_name = f"part-{uuid.uuid4().hex[:12]}{suffix}"
+            temp_path = partition_dir / f".{file_name}.tmp"
+            write_signals(temp_path, block, fmt=self.partition_format)
+            os.replace(temp_path, partition_dir / file_name)
+
+            previous = self._partitions.get(day_key)
+            if previous is not None:
+                replaced.append(self.root / str(previous["file"]))
+            self._partitions[day_key] = {"file": f"{PARTITION_PREFIX}{day_key}/{file_name}", "rows": len(block)}
+
+        if blocks:
+            self._commit_manifest()
+        # manifest 커밋 이후에만 이전 파일을 지운다.
+        for old_path in replaced:
+            old_path.unlink(missing_ok=True)
+        return [day_key for day_key, _ in blocks]
+
+    def read(
+        self,
+        start: date | None = None,
+        end: date | None = None,
+        symbols: Collection[str] | None = None,
+    ) -> SignalFrame:
+        frames = [
+            read_signal_frame(partition.path, fmt=self.partition_format, symbols=symbols)
+            for partition in self.partitions(start, end)
+        ]
+        if not frames:
+            return SignalFrame.empty()
+        return SignalFrame(
+            days=np.concatenate([frame.days for frame in frames]),
+            codes=np.concatenate([frame.symbol_ids() for frame in frames]),
+            scores=np.concatenate([frame.scores for frame in frames]),
+            symbols=SYMBOLS,
+        )
+
+    def iter_days(
+        self,
+        start: date | None = None,
+        end: date | None = None,
+        symbols: Collection[str] | None = None,
+    ) -> Iterator[SignalDay]:
+        for partition in self.partitions(start, end):
+            frame = read_signal_frame(partition.path, fmt=self.partition_format, symbols=symbols)
+            yield SignalDay(signal_date=partition.signal_date, ids=frame.symbol_ids(), scores=frame.scores)
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+import threading
+
+import numpy as np
+import pandas as pd
+
+
+class SymbolTable:
+    """
+    티커 문자열을 dense int id(0, 1, 2, ...)로 한 번만 매핑하는 intern 테이블.
+    id는 추가만 되고 바뀌지 않으므로 신호/가격/보유 종목을 모두 같은 id 공간에서 배열 인덱싱으로 다룬다.
+    """
+
+    def __init__(self, symbols: Iterable[str] = ()) -> None:
+        self._ids: dict[str, int] = {}
+        self._names: list[str] = []
+        self._names_array: np.ndarray = np.empty(0, dtype=object)
+        self._lock = threading.Lock()
+        for symbol in symbols:
+            self.intern(symbol)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, symbol: object) -> bool:
+        return symbol in self._ids
+
+    def __getitem__(self, symbol_id: int) -> str:
+        return self._names[symbol_id]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._names))
+
+    def intern(self, symbol: str) -> int:
+        symbol_id = self._ids.get(symbol)
+        if symbol_id is not None:
+            return symbol_id
+        with self._lock:
+            symbol_id = self._ids.get(symbol)
+            if symbol_id is None:
+                symbol_id = len(self._names)
+                self._names.append(symbol)
+                self._ids[symbol] = symbol_id
+            return symbol_id
+
+    def intern_many(self, symbols: Iterable[str]) -> np.ndarray:
+        """
+        심볼 배열을 int32 id 배열로 바꾼다. 해시는 고유값에만 한다.
+        """
+        codes, uniques = pd.factorize(pd.Series(symbols, dtype=object), use_na_sentinel=False)
+        unique_ids = np.fromiter((self.intern(symbol) for symbol in uniques), dtype=np.int32, count=len(uniques))
+        return unique_ids[codes] if len(codes) else np.empty(0, dtype=np.int32)
+
+    def id_of(self, symbol: str) -> int:
+        return self._ids.get(symbol, -1)
+
+    def ids_of(self, symbols: Iterable[str]) -> np.ndarray:
+        """
+        intern 하지 않고 조회만 한다. 모르는 심볼은 -1.
+        """
+        return np.fromiter((self._ids.get(symbol, -1) for symbol in symbols), dtype=np.int32)
+
+    def names(self, symbol_ids: np.ndarray) -> np.ndarray:
+        if len(self._names_array) != len(self._names):
+            with self._lock:
+                self._names_array = np.asarray(self._names, dtype=object)
+        return self._names_array[np.asarray(symbol_ids, dtype=np.intp)]
+
+
+SYMBOLS: SymbolTable = SymbolTable()
+
+
+def get_symbol_table() -> SymbolTable:
+    return SYMBOLS
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import date, datetime
+
+import numpy as np
+import pandas as pd
+
+
+DATE_FORMAT: str = "%Y-%m-%d"
+EPOCH_ORDINAL: int = date(1970, 1, 1).toordinal()
+
+
+def parse_day_ordinals(values: Iterable[str]) -> np.ndarray:
+    """
+    "YYYY-MM-DD" 문자열 배열을 date.toordinal()과 같은 int32 ordinal 배열로 일괄 변환한다.
+    고유값(거래일 수)만 strptime으로 엄격하게 파싱한다. date 객체는 그대로 ordinal로 바꾼다.
+    """
+    codes, uniques = pd.factorize(pd.Series(values, dtype=object), use_na_sentinel=False)
+    ordinals = np.empty(len(uniques), dtype=np.int32)
+    for position, value in enumerate(uniques):
+        if isinstance(value, date):
+            ordinals[position] = value.toordinal()
+            continue
+        try:
+            ordinals[position] = datetime.strptime(value, DATE_FORMAT).toordinal()
+        except (TypeError, ValueError) as error:
+            raise ValueError(f"Signal dates must use {DATE_FORMAT}: {value!r}") from error
+    return ordinals[codes]
+
+
+def format_day_ordinals(days: np.ndarray) -> np.ndarray:
+    unique_days, inverse = np.unique(days, return_inverse=True)
+    as_dates = (unique_days.astype(np.int64) - EPOCH_ORDINAL).astype("datetime64[D]")
+    return np.datetime_as_string(as_dates, unit="D").astype(object)[inverse]
+
+
+def to_day_ordinals(values: Iterable) -> np.ndarray:
+    """
+    날짜 문자열, date, datetime64, 이미 ordinal인 정수 값을 int64 ordinal 배열로 바꾼다.
+    문자열/date는 고유값만 변환한다.
+    """
+    array = values.to_numpy() if isinstance(values, (pd.Series, pd.Index)) else np.asarray(values)
+    if np.issubdtype(array.dtype, np.datetime64):
+        return array.astype("datetime64[D]").astype(np.int64) + EPOCH_ORDINAL
+    if np.issubdtype(array.dtype, np.integer):
+        return array.astype(np.int64)
+    return parse_day_ordinals(array).astype(np.int64)
+
+
+@dataclass(frozen=True, eq=False)
+class TradingCalendar:
+    """
+    거래일을 오름차순 int64 ordinal 배열로 들고, 날짜를 0부터 시작하는 조밀한 거래일 번호로 바꾼다.
+    가격 행렬의 행 번호와 같아서 신호/가격 정렬을 문자열 키 대신 정수 인덱싱으로 한다. 조회는 이진 탐색.
+    """
+
+    ordinals: np.ndarray
+
+    @classmethod
+    def from_dates(cls, values: Iterable) -> TradingCalendar:
+        return cls(ordinals=np.unique(to_day_ordinals(values)))
+
+    def __len__(self) -> int:
+        return int(self.ordinals.shape[0])
+
+    def labels(self) -> list[str]:
+        return format_day_ordinals(self.ordinals).tolist() if len(self) else []
+
+    def date_range(self) -> tuple[date | None, date | None]:
+        if not len(self):
+            return None, None
+        return date.fromordinal(int(self.ordinals[0])), date.fromordinal(int(self.ordinals[-1]))
+
+    def index_of(self, ordinals: np.ndarray) -> np.ndarray:
+        """
+        ordinal 배열의 거래일 번호. 거래일이 아니면 -1.
+        """
+        ordinals = np.asarray(ordinals, dtype=np.int64)
+        positions = np.searchsorted(self.ordinals, ordinals)
+        clipped = np.minimum(positions, max(len(self) - 1, 0))
+        found = (positions < len(self)) & (self.ordinals[clipped] == ordinals) if len(self) else positions < 0
+        return np.where(found, positions, -1)
+
+    def next_index(self, ordinals: np.ndarray, inclusive: bool = True) -> np.ndarray:
+        """
+        ordinal 이후(inclusive면 같은 날 포함) 첫 거래일 번호. 없으면 len(calendar).
+        """
+        side = "left" if inclusive else "right"
+        return np.searchsorted(self.ordinals, np.asarray(ordinals, dtype=np.int64), side=side)
+
+    def previous_index(self, ordinals: np.ndarray, inclusive: bool = True) -> np.ndarray:
+        """
+        ordinal 이전(inclusive면 같은 날 포함) 마지막 거래일 번호. 없으면 -1.
+        """
+        side = "right" if inclusive else "left"
+        return np.searchsorted(self.ordinals, np.asarray(ordinals, dtype=np.int64), side=side) - 1
+
+    def next_day(self, day: date, inclusive: bool = False) -> date | None:
+        position = int(self.next_index(np.asarray([day.toordinal()]), inclusive)[0])
+        return date.fromordinal(int(self.ordinals[position])) if position < len(self) else None
+
+    def previous_day(self, day: date, inclusive: bool = False) -> date | None:
+        position = int(self.previous_index(np.asarray([day.toordinal()]), inclusive)[0])
+        return date.fromordinal(int(self.ordinals[position])) if position >= 0 else None
@@ -0,0 +1,316 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+import io
+import math
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from .compression import compression_of
+from .signal_io import (
+    DEFAULT_CHUNK_ROWS,
+    SignalFrame,
+    _csv_reader_options,
+    detect_signal_format,
+    iter_signal_chunks,
+)
+from .symbols import SYMBOLS
+
+
+@dataclass
+class ValidationReport:
+    rows: int
+    dates: int
+    symbols: int
+    duplicates: int
+    non_finite: int
+    out_of_order: int
+    min_coverage: int
+    max_coverage: int
+    mean_coverage: float
+    score_mean: float
+    score_std: float
+    score_min: float
+    score_max: float
+
+    def errors(self) -> list[str]:
+        messages: list[str] = []
+        if self.rows == 0:
+            messages.append("Signal CSV is empty.")
+        if self.duplicates > 0:
+            messages.append("Duplicate (date,symbol) rows detected.")
+        if self.non_finite > 0:
+            messages.append("Non-finite (NaN/inf) scores detected.")
+        if self.out_of_order > 0:
+            messages.append("Signal dates are not sorted (non-monotonic dates detected).")
+        return messages
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors()
+
+
+@dataclass
+class _DayRun:
+    day: int
+    ids: list[np.ndarray]
+
+
+@dataclass
+class _ValidationState:
+    """
+    한 번의 패스로 쌓는 검증 상태. 날짜가 이어지는 구간(run) 중 처음(head)과 마지막(tail)만 열어 두고
+    나머지는 닫으면서 집계하므로, 메모리는 하루치 심볼 수(+ 전체 심볼 비트맵)에 비례한다.
+    head/tail을 열어 두는 이유는 병렬 분할 결과를 이어 붙일 때 경계에 걸친 날짜를 합치기 위해서다.
+    """
+
+    rows: int = 0
+    non_finite: int = 0
+    out_of_order: int = 0
+    dates: int = 0
+    duplicates: int = 0
+    coverage_min: int = 0
+    coverage_max: int = 0
+    coverage_sum: int = 0
+    score_count: int = 0
+    score_mean: float = 0.0
+    score_m2: float = 0.0
+    score_min: float = math.inf
+    score_max: float = -math.inf
+    seen: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=bool))
+    head: _DayRun | None = None
+    tail: _DayRun | None = None
+
+    def _close(self, run: _DayRun) -> None:
+        ids = np.concatenate(run.ids)
+        _, counts = np.unique(ids, return_counts=True)
+        coverage = len(counts)
+        self.duplicates += int(np.count_nonzero(counts > 1))
+        self.coverage_min = coverage if self.dates == 0 else min(self.coverage_min, coverage)
+        self.coverage_max = max(self.coverage_max, coverage)
+        self.coverage_sum += coverage
+        self.dates += 1
+
+    def _add_run(self, run: _DayRun) -> None:
+        if self.head is None:
+            self.head = run
+            return
+        current = self.tail if self.tail is not None else self.head
+        if run.day == current.day:
+            current.ids.extend(run.ids)
+            return
+        if run.day < current.day:
+            self.out_of_order += 1
+        if self.tail is not None:
+            self._close(self.tail)
+        self.tail = run
+
+    def _mark_seen(self, ids: np.ndarray) -> None:
+        if not len(ids):
+            return
+        top = int(ids.max()) + 1
+        if top > len(self.seen):
+            grown = np.zeros(max(top, 2 * len(self.seen)), dtype=bool)
+            grown[: len(self.seen)] = self.seen
+            self.seen = grown
+        self.seen[ids] = True
+
+    def _merge_scores(self, count: int, mean: float, m2: float, low: float, high: float) -> None:
+        if count == 0:
+            return
+        total = self.score_count + count
+        delta = mean - self.score_mean
+        self.score_mean += delta * count / total
+        self.score_m2 += m2 + delta * delta * self.score_count * count / total
+        self.score_count = total
+        self.score_min = min(self.score_min, low)
+        self.score_max = max(self.score_max, high)
+
+    def update(self, frame: SignalFrame) -> None:
+        if not len(frame):
+            return
+        ids = frame.symbol_ids()
+        scores = frame.scores
+        finite = np.isfinite(scores)
+        self.rows += len(frame)
+        self.non_finite += int(len(frame) - np.count_nonzero(finite))
+        if finite.any():
+            values = scores[finite]
+            mean = float(values.mean())
+            self._merge_scores(
+                len(values),
+                mean,
+                float(((values - mean) ** 2).sum()),
+                float(values.min()),
+                float(values.max()),
+            )
+        self._mark_seen(ids)
+
+        # 파일 순서를 유지한 채 같은 날짜가 이어지는 구간(run) 단위로 넘긴다.
+        starts = np.flatnonzero(np.r_[True, frame.days[1:] != frame.days[:-1]])
+        ends = np.r_[starts[1:], len(frame)]
+        for begin, finish in zip(starts.tolist(), ends.tolist()):
+            self._add_run(_DayRun(day=int(frame.days[begin]), ids=[ids[begin:finish]]))
+
+    def relabel(self, names: list[str]) -> None:
+        """
+        다른 프로세스에서 만든 상태의 심볼 id를 현재 프로세스의 SYMBOLS id로 옮긴다.
+        """
+        remap = SYMBOLS.intern_many(names) if names else np.empty(0, dtype=np.int32)
+        for run in (self.head, self.tail):
+            if run is not None:
+                run.ids = [remap[ids] for ids in run.ids]
+        seen_ids = remap[np.flatnonzero(self.seen)] if len(self.seen) else np.empty(0, dtype=np.int32)
+        self.seen = np.zeros(0, dtype=bool)
+        self._mark_seen(seen_ids)
+
+    def merge(self, other: _ValidationState) -> None:
+        """
+        other가 파일상 self 바로 뒤 구간이라고 보고 이어 붙인다.
+        """
+        self.rows += other.rows
+        self.non_finite += other.non_finite
+        self.out_of_order += other.out_of_order
+        self._merge_scores(other.score_count, other.score_mean, other.score_m2, other.score_min, other.score_max)
+        if other.dates:
+            self.coverage_min = other.coverage_min if self.dates == 0 else min(self.coverage_min, other.coverage_min)
+            self.coverage_max = max(self.coverage_max, other.coverage_max)
+            self.coverage_sum += other.coverage_sum
+            self.dates += other.dates
+            self.duplicates += other.duplicates
+        self._mark_seen(np.flatnonzero(other.seen))
+
+        if other.head is not None:
+            self._add_run(other.head)
+        if other.tail is not None:
+            if self.tail is not None:
+                self._close(self.tail)
+            self.tail = other.tail
+
+    def finish(self) -> ValidationReport:
+        for run in (self.head, self.tail):
+            if run is not None:
+                self._close(run)
+        self.head = self.tail = None
+        variance = self.score_m2 / self.score_count if self.score_count else math.nan
+        return ValidationReport(
+            rows=self.rows,
+            dates=self.dates,
+            symbols=int(np.count_nonzero(self.seen)),
+            duplicates=self.duplicates,
+            non_finite=self.non_finite,
+            out_of_order=self.out_of_order,
+            min_coverage=self.coverage_min,
+            max_coverage=self.coverage_max,
+            mean_coverage=self.coverage_sum / self.dates if self.dates else 0.0,
+            score_mean=self.score_mean if self.score_count else math.nan,
+            score_std=math.sqrt(variance) if self.score_count else math.nan,
+            score_min=self.score_min if self.score_count else math.nan,
+            score_max=self.score_max if self.score_count else math.nan,
+        )
+
+
+def validate_signal_frames(frames: Iterable[SignalFrame]) -> ValidationReport:
+    state = _ValidationState()
+    for frame in frames:
+        state.update(frame)
+    return state.finish()
+
+
+def _csv_byte_ranges(path: Path, parts: int) -> tuple[list[str], list[tuple[int, int]]]:
+    """
+    헤더 뒤 본문을 parts개의 바이트 구간으로 나눈다. 각 경계는 다음 줄 시작으로 맞춘다.
+    """
+    size = path.stat().st_size
+    with path.open("rb") as file:
+        header_line = file.readline()
+        body_start = len(header_line)
+        boundaries = [body_start]
+        for part in range(1, parts):
+            target = body_start + (size - body_start) * part // parts
+            if target <= boundaries[-1]:
+                continue
+            file.seek(target - 1)
+            file.readline()
+            position = file.tell()
+            if boundaries[-1] < position < size:
+                boundaries.append(position)
+        boundaries.append(size)
+    header = [column.strip() for column in header_line.decode("utf-8").strip().split(",")]
+    return header, list(zip(boundaries[:-1], boundaries[1:]))
+
+
+class _RangeReader(io.RawIOBase):
+    """
+    열린 파일에서 현재 위치부터 end 바이트 직전까지만 읽히는 스트림. 구간 전체를 메모리에 올리지 않는다.
+    """
+
+    def __init__(self, file, end: int) -> None:
+        self._file = file
+        self._remaining = max(end - file.tell(), 0)
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        if not self._remaining:
+            return 0
+        view = memoryview(buffer)[: self._remaining]
+        count = self._file.readinto(view)
+        self._remaining -= count
+        return count
+
+
+def _validate_csv_range(
+    path: Path,
+    header: list[str],
+    begin: int,
+    end: int,
+    chunk_rows: int,
+) -> tuple[_ValidationState, list[str]]:
+    state = _ValidationState()
+    options = {**_csv_reader_options(), "header": None, "names": header, "chunksize": chunk_rows}
+    with path.open("rb") as file:
+        file.seek(begin)
+        with pd.read_csv(io.BufferedReader(_RangeReader(file, end)), **options) as reader:
+            for chunk in reader:
+                state.update(SignalFrame.from_columns(chunk["date"], chunk["symbol"], chunk["score"]))
+    names = SYMBOLS.names(np.arange(len(SYMBOLS))).tolist()
+    return state, names
+
+
+def validate_signal_file(
+    path: str | Path,
+    fmt: str | None = None,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+    workers: int = 1,
+) -> ValidationReport:
+    """
+    스키마를 확인한 뒤 한 번의 스트리밍 패스로 중복, NaN/inf 점수, 날짜 역행, 일자별 커버리지,
+    점수 분포를 검사한다. CSV는 workers > 1이면 줄 경계로 나눈 구간을 프로세스 풀에서 병렬 검증한다.
+    """
+    signal_path = Path(path)
+    signal_format = detect_signal_format(signal_path, fmt)
+    chunks = iter_signal_chunks(signal_path, fmt=signal_format, chunk_rows=chunk_rows)
+    # 압축 CSV는 바이트 구간으로 나눌 수 없으므로 순차로 검증한다.
+    if workers <= 1 or signal_format != "csv" or compression_of(signal_path):
+        return validate_signal_frames(chunks)
+
+    # 스키마 검사는 첫 chunk를 읽는 시점에 수행된다.
+    next(iter_signal_chunks(signal_path, fmt=signal_format, chunk_rows=1), None)
+    header, ranges = _csv_byte_ranges(signal_path, workers)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(_validate_csv_range, signal_path, header, begin, end, chunk_rows)
+            for begin, end in ranges
+        ]
+        state = _ValidationState()
+        for future in futures:
+            part, names = future.result()
+            part.relabel(names)
+            state.merge(part)
+    return state.finish()
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from pathlib import Path
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+PACKAGE_ROOT = PROJECT_ROOT / "src"
+if str(PACKAGE_ROOT) not in sys.path:
+    sys.path.insert(0, str(PACKAGE_ROOT))
+
+from neon_alpha.signal_io import SignalFrame  # noqa: E402
+
+
+def random_market(
+    seed: int,
+    days: int = 60,
+    symbols: int | Sequence[str] = 10,
+    start: str = "2024-01-01",
+    volatility: float = 0.02,
+    volume: bool = False,
+) -> tuple[SignalFrame, pd.DataFrame]:
+    """
+    종목별 기하 랜덤워크 종가(date,symbol,close[,volume]) 테이블과 같은 날짜/종목의 정규분포 점수 신호.
+    symbols가 정수면 S00, S01, ... 이름을 쓴다.
+    """
+    rng = np.random.default_rng(seed)
+    names = [f"S{index:02d}" for index in range(symbols)] if isinstance(symbols, int) else list(symbols)
+    dates = pd.bdate_range(start, periods=days).strftime("%Y-%m-%d")
+    shape = (days, len(names))
+    prices = pd.DataFrame(
+        {
+            "date": np.repeat(dates, len(names)),
+            "symbol": np.tile(names, days),
+            "close": 100.0 * np.exp(rng.normal(0.0, volatility, shape).cumsum(axis=0)).ravel(),
+        }
+    )
+    if volume:
+        prices["volume"] = rng.lognormal(8.0, 1.0, days * len(names))
+    signals = SignalFrame.from_columns(
+        np.repeat(dates, len(names)),
+        np.tile(names, days),
+        rng.normal(size=days * len(names)),
+    )
+    return signals, prices
+
+
+@pytest.fixture(name="random_market")
+def random_market_fixture() -> Callable[..., tuple[SignalFrame, pd.DataFrame]]:
+    return random_market
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+import sys
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+PACKAGE_ROOT = PROJECT_ROOT / "src"
+if str(PACKAGE_ROOT) not in sys.path:
+    sys.path.insert(0, str(PACKAGE_ROOT))
+
+from neon_alpha.incremental import PAPER_STATE_SNAPSHOTS_NAME, run_paper_simulation_incremental  # noqa: E402
+from neon_alpha.paper import run_paper_simulation  # noqa: E402
+from neon_alpha.risk import RiskLimits  # noqa: E402
+from neon_alpha.signal_io import SignalFrame  # noqa: E402
+
+
+def test_incremental_resimulates_only_changed_suffix(tmp_path: Path, random_market) -> None:
+    limits = RiskLimits(max_positions=2, max_weight_per_symbol=0.5, max_daily_turnover=1.0)
+    signals, prices = random_market(seed=1, days=30, symbols=5, start="2025-01-02")
+
+    first = run_paper_simulation_incremental(signals, prices, limits, tmp_path)
+    unchanged = run_paper_simulation_incremental(signals, prices, limits, tmp_path)
+
+    assert first.simulated_days == 30
+    assert unchanged.simulated_days == 0
+    assert unchanged.result == first.result == run_paper_simulation(signals, prices, limits)
+
+    scores = signals.scores.copy()
+    scores[-10:] = -scores[-10:]
+    changed_signals = SignalFrame(days=signals.days, codes=signals.codes, scores=scores, symbols=signals.symbols)
+    changed = run_paper_simulation_incremental(changed_signals, prices, limits, tmp_path)
+
+    assert changed.simulated_days == 2
+    assert changed.resumed_from == prices["date"].iloc[-11]
+    assert changed.result == run_paper_simulation(changed_signals, prices, limits)
+
+    other_limits = RiskLimits(max_positions=3)
+    assert run_paper_simulation_incremental(changed_signals, prices, other_limits, tmp_path).simulated_days == 30
+
+
+def test_incremental_appends_without_rewriting_unchanged_snapshots(tmp_path: Path, random_market) -> None:
+    limits = RiskLimits(max_positions=2, max_weight_per_symbol=0.5, max_daily_turnover=1.0)
+    signals, prices = random_market(seed=2, days=30, symbols=5, start="2025-01-02")
+    snapshots_path = tmp_path / PAPER_STATE_SNAPSHOTS_NAME
+
+    run_paper_simulation_incremental(signals, prices, limits, tmp_path)
+    before = snapshots_path.read_bytes().splitlines(keepends=True)
+    inode = os.stat(snapshots_path).st_ino
+
+    scores = signals.scores.copy()
+    scores[-5:] += 10.0
+    changed_signals = SignalFrame(days=signals.days, codes=signals.codes, scores=scores, symbols=signals.symbols)
+    changed = run_paper_simulation_incremental(changed_signals, prices, limits, tmp_path)
+    after = snapshots_path.read_bytes().splitlines(keepends=True)
+
+    assert changed.simulated_days == 1
+    assert os.stat(snapshots_path).st_ino == inode
+    assert len(after) == len(before) == 30
+    assert after[:29] == before[:29]
+    assert after[29] != before[29]
+    assert changed.result == run_paper_simulation(changed_signals, prices, limits)
+
+    resumed = run_paper_simulation_incremental(changed_signals, prices, limits, tmp_path)
+    assert resumed.simulated_days == 0
+    assert snapshots_path.read_bytes().splitlines(keepends=True) == after
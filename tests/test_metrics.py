@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+
+import numpy as np
+import pytest
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+PACKAGE_ROOT = PROJECT_ROOT / "src"
+if str(PACKAGE_ROOT) not in sys.path:
+    sys.path.insert(0, str(PACKAGE_ROOT))
+
+from neon_alpha.metrics import (  # noqa: E402
+    cagr,
+    max_drawdown,
+    period_metrics,
+    period_returns,
+    rolling_metrics,
+    sharpe_ratio,
+    summarize,
+    total_return,
+    volatility,
+    window_metrics,
+)
+from neon_alpha.paper import PaperArtifacts, build_paper_artifacts, run_paper_simulation  # noqa: E402
+from neon_alpha.risk import RiskLimits  # noqa: E402
+
+
+SYMBOLS = ["AAPL", "MSFT", "NVDA", "AMZN"]
+
+
+def test_artifacts_round_trip_and_reproduce_result(tmp_path: Path, random_market) -> None:
+    signals, prices = random_market(seed=11, days=45, symbols=SYMBOLS, start="2024-12-02", volatility=0.01)
+    limits = RiskLimits(max_positions=2, max_weight_per_symbol=0.5, max_daily_turnover=1.0)
+
+    artifacts = build_paper_artifacts(signals, prices, limits)
+    artifacts.save(tmp_path / "run.npz")
+    loaded = PaperArtifacts.load(tmp_path / "run.npz")
+    expected = run_paper_simulation(signals, prices, limits)
+
+    assert len(loaded) == 44
+    assert loaded.symbols == ["AAPL", "AMZN", "MSFT", "NVDA"]
+    assert loaded.weights.shape == (44, 4)
+    assert loaded.result().trades == expected.trades
+    assert loaded.result().end_equity == pytest.approx(expected.end_equity, rel=1e-12)
+    assert total_return(loaded.daily_returns) == pytest.approx(expected.total_return, abs=1e-12)
+    assert cagr(loaded.daily_returns) == pytest.approx(expected.cagr, rel=1e-9)
+    assert max_drawdown(loaded.daily_returns) == pytest.approx(expected.max_drawdown, rel=1e-9)
+    assert loaded.turnover[0] == pytest.approx(1.0)
+
+
+def test_period_returns_compound_to_total(tmp_path: Path, random_market) -> None:
+    signals, prices = random_market(seed=11, days=45, symbols=SYMBOLS, start="2024-12-02", volatility=0.01)
+    artifacts = build_paper_artifacts(signals, prices, RiskLimits(max_positions=2))
+
+    monthly = period_returns(artifacts, freq="M")
+
+    assert monthly["period"].tolist() == ["2024-12", "2025-01"]
+    assert np.prod(1.0 + monthly["return"].to_numpy()) - 1.0 == pytest.approx(total_return(artifacts.daily_returns))
+    assert summarize(artifacts)["days"] == 44
+    yearly = period_metrics(artifacts, freq="Y")
+    assert yearly["period"].tolist() == ["2024", "2025"]
+    assert yearly["total_return"].to_numpy() == pytest.approx(
+        period_returns(artifacts, freq="Y")["return"].to_numpy()
+    )
+
+
+def test_window_metrics_match_direct_computation() -> None:
+    rng = np.random.default_rng(5)
+    returns = rng.normal(0.0005, 0.02, 300)
+    windows = [(0, 300), (10, 40), (0, 5), (35, 90), (20, 21), (100, 300), (50, 60)]
+
+    table = window_metrics(returns, windows)
+    rolling = rolling_metrics(returns, window=60)
+
+    for (start, end), row in zip(windows, table.itertuples()):
+        window = returns[start:end]
+        assert row.total_return == pytest.approx(total_return(window), rel=1e-9, abs=1e-12)
+        assert row.cagr == pytest.approx(cagr(window), rel=1e-9, abs=1e-12)
+        assert row.max_drawdown == pytest.approx(max_drawdown(window), rel=1e-9, abs=1e-12)
+        if end - start > 1:
+            assert row.sharpe == pytest.approx(sharpe_ratio(window), rel=1e-6)
+    assert len(rolling) == 241
+    for start in (0, 77, 240):
+        window = returns[start : start + 60]
+        assert rolling["max_drawdown"].iloc[start] == pytest.approx(max_drawdown(window), rel=1e-9)
+        assert rolling["volatility"].iloc[start] == pytest.approx(volatility(window), rel=1e-6)
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+import sys
+
+import numpy as np
+import pandas as pd
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+PACKAGE_ROOT = PROJECT_ROOT / "src"
+if str(PACKAGE_ROOT) not in sys.path:
+    sys.path.insert(0, str(PACKAGE_ROOT))
+
+from neon_alpha.paper import PriceMatrix, load_price_csv  # noqa: E402
+from neon_alpha.price_cache import PriceCache  # noqa: E402
+
+
+def _write_prices(path: Path, closes: list[float]) -> Path:
+    pd.DataFrame(
+        {
+            "date": ["2025-01-02", "2025-01-02", "2025-01-03", "2025-01-03"],
+            "symbol": ["aapl", "MSFT", "AAPL", "MSFT"],
+            "close": closes,
+        }
+    ).to_csv(path, index=False)
+    return path
+
+
+def test_price_cache_reuses_and_invalidates(tmp_path: Path) -> None:
+    price_path = _write_prices(tmp_path / "prices.csv", [100.0, 200.0, 101.0, 202.0])
+    cache = PriceCache(tmp_path / "cache")
+
+    first = cache.load(price_path)
+    second = cache.load(price_path)
+    expected = PriceMatrix.from_frame(load_price_csv(price_path))
+
+    assert isinstance(second.close, np.memmap)
+    assert second.days == expected.days == ["2025-01-02", "2025-01-03"]
+    assert second.symbols == expected.symbols == ["AAPL", "MSFT"]
+    np.testing.assert_array_equal(second.close, first.close)
+    assert len(cache.entries()) == 1
+
+    _write_prices(price_path, [100.0, 200.0, 99.0, 210.0])
+    os.utime(price_path, ns=(1, 1))
+    changed = cache.load(price_path)
+
+    assert changed.close[1, 0] == 99.0
+    assert len(cache.entries()) == 1
+
+
+def test_price_cache_evicts_least_recently_used(tmp_path: Path) -> None:
+    paths = [_write_prices(tmp_path / f"prices_{index}.csv", [100.0 + index, 200.0, 101.0, 202.0]) for index in range(3)]
+    cache = PriceCache(tmp_path / "cache", max_bytes=1)
+
+    for path in paths:
+        cache.load(path)
+
+    entries = cache.entries()
+    assert [entry.source for entry in entries] == [str(paths[-1].resolve())]
+    assert cache.clear() == 1
+    assert cache.entries() == []
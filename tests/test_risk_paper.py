@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+from dataclasses import replace
 from datetime import date
+import json
 from pathlib import Path
 import sys
 
+import numpy as np
 import pandas as pd
+import pytest
 
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
@@ -12,9 +16,26 @@ PACKAGE_ROOT = PROJECT_ROOT / "src"
 if str(PACKAGE_ROOT) not in sys.path:
     sys.path.insert(0, str(PACKAGE_ROOT))
 
-from neon_alpha.paper import run_paper_simulation  # noqa: E402
-from neon_alpha.risk import RiskLimits, select_targets  # noqa: E402
-from neon_alpha.signal_io import SignalRow  # noqa: E402
+from neon_alpha.paper import (  # noqa: E402
+    PaperSimulator,
+    PriceMatrix,
+    build_constraint_data,
+    build_target_schedule,
+    checkpoint_arrays_path,
+    run_paper_simulation,
+    run_paper_simulation_grid,
+    save_target_schedule,
+)
+from neon_alpha.risk import (  # noqa: E402
+    ConstraintData,
+    EwmaCovariance,
+    RiskLimits,
+    portfolio_weights,
+    select_targets,
+    select_targets_batch,
+)
+from neon_alpha.signal_io import SignalFrame, SignalRow, iter_signal_days, write_signals  # noqa: E402
+from neon_alpha.symbols import SYMBOLS  # noqa: E402
 
 
 def test_select_targets_respects_max_positions_and_weight_cap() -> None:
@@ -36,6 +57,68 @@ def test_select_targets_respects_turnover_limit() -> None:
     assert set(targets.keys()) == {"AAPL"}
 
 
+def test_select_targets_top_k_keeps_sort_tie_breaking() -> None:
+    rng = np.random.default_rng(8)
+    for size in (6, 600):
+        scores = {f"S{index:03d}": float(score) for index, score in enumerate(np.round(rng.normal(size=size), 1))}
+        limits = RiskLimits(max_positions=5, min_score=-0.5, max_weight_per_symbol=1.0, max_daily_turnover=float("inf"))
+        passing = [(symbol, score) for symbol, score in scores.items() if score >= -0.5]
+        expected = {symbol for symbol, _ in sorted(passing, key=lambda item: item[1], reverse=True)[:5]}
+
+        assert set(select_targets(scores, set(), limits)) == expected
+        pre_ranked = dict(sorted(scores.items(), key=lambda item: item[1], reverse=True))
+        assert set(select_targets(pre_ranked, set(), limits, pre_ranked=True)) == expected
+
+
+def test_select_targets_batch_matches_daily_selection() -> None:
+    rng = np.random.default_rng(3)
+    scores = np.round(rng.normal(size=(60, 8)), 1)
+    scores[rng.random(scores.shape) < 0.2] = np.nan
+
+    for turnover in (0.0, 0.5, 1.0, float("inf")):
+        limits = RiskLimits(max_positions=3, min_score=-0.5, max_weight_per_symbol=0.3, max_daily_turnover=turnover)
+        weights = select_targets_batch(scores, limits)
+
+        holdings: set[int] = set()
+        for day, row in enumerate(scores):
+            day_scores = {column: float(score) for column, score in enumerate(row) if not np.isnan(score)}
+            targets = select_targets(day_scores, holdings, limits)
+            expected = np.zeros(scores.shape[1])
+            expected[list(targets)] = list(targets.values())
+            np.testing.assert_array_equal(weights[day], expected)
+            holdings = set(targets)
+
+
+def test_ewma_covariance_and_portfolio_weights() -> None:
+    rng = np.random.default_rng(5)
+    returns = rng.normal(0.0, [0.01, 0.02, 0.04], size=(300, 3))
+    estimator = EwmaCovariance(3, halflife=30.0)
+    for row in returns:
+        estimator.update(row)
+
+    decay = 0.5 ** (1.0 / 30.0)
+    factors = (1.0 - decay) * decay ** np.arange(len(returns))[::-1]
+    expected = (returns * factors[:, None]).T @ returns / factors.sum()
+    covariance = estimator.covariance()
+    assert covariance == pytest.approx(expected, rel=1e-10)
+
+    inverse_vol = portfolio_weights(covariance, RiskLimits(weighting="inverse_vol", max_weight_per_symbol=1.0))
+    assert inverse_vol.sum() == pytest.approx(1.0)
+    scaled = inverse_vol * np.sqrt(np.diag(covariance))
+    assert scaled == pytest.approx(np.full(3, scaled[0]))
+
+    limits = RiskLimits(weighting="risk_parity", max_weight_per_symbol=1.0, shrinkage=0.0)
+    parity = portfolio_weights(covariance, limits)
+    contributions = parity * (covariance @ parity)
+    assert contributions == pytest.approx(np.full(3, contributions.mean()), rel=1e-8)
+
+    capped = portfolio_weights(covariance, RiskLimits(weighting="mean_variance", max_weight_per_symbol=0.4), np.ones(3))
+    assert capped.max() <= 0.4 and (capped >= 0).all()
+    assert portfolio_weights(np.zeros((2, 2)), limits) is None
+    with pytest.raises(ValueError):
+        RiskLimits(weighting="kelly")
+
+
 def test_paper_simulation_runs_and_returns_metrics() -> None:
     signal_rows = [
         SignalRow(signal_date=date(2025, 1, 2), symbol="AAPL", score=0.9),
@@ -59,3 +142,243 @@ def test_paper_simulation_runs_and_returns_metrics() -> None:
 
     assert result.end_equity > 1.0
     assert result.max_drawdown >= 0.0
+    assert run_paper_simulation(SignalFrame.from_rows(signal_rows), prices, limits) == result
+
+
+def test_paper_simulation_consumes_streamed_days(tmp_path: Path) -> None:
+    signal_rows = [
+        SignalRow(signal_date=date(2025, 1, 2), symbol="AAPL", score=0.9),
+        SignalRow(signal_date=date(2025, 1, 2), symbol="MSFT", score=0.7),
+        SignalRow(signal_date=date(2025, 1, 3), symbol="AAPL", score=0.2),
+        SignalRow(signal_date=date(2025, 1, 3), symbol="MSFT", score=0.8),
+    ]
+    prices = pd.DataFrame(
+        [
+            {"date": "2025-01-02", "symbol": "AAPL", "close": 100.0},
+            {"date": "2025-01-02", "symbol": "MSFT", "close": 200.0},
+            {"date": "2025-01-03", "symbol": "AAPL", "close": 99.0},
+            {"date": "2025-01-03", "symbol": "MSFT", "close": 202.0},
+            {"date": "2025-01-06", "symbol": "AAPL", "close": 98.0},
+            {"date": "2025-01-06", "symbol": "MSFT", "close": 210.0},
+        ]
+    )
+    path = tmp_path / "signals.csv"
+    write_signals(path, signal_rows)
+    limits = RiskLimits(max_positions=1, min_score=-1.0, max_weight_per_symbol=1.0, max_daily_turnover=2.0)
+
+    streamed = run_paper_simulation(iter_signal_days(path, chunk_rows=1), prices, limits)
+
+    assert streamed == run_paper_simulation(signal_rows, prices, limits)
+    assert streamed.trades == 2
+
+
+def test_vector_engine_matches_loop_engine(random_market) -> None:
+    signals, prices = random_market(seed=7, days=80, symbols=12)
+    prices = prices.drop(index=[5, 40, 41]).reset_index(drop=True)
+
+    for turnover in (0.5, 1.0, 10.0):
+        limits = RiskLimits(max_positions=4, min_score=-0.5, max_weight_per_symbol=0.3, max_daily_turnover=turnover)
+        loop = run_paper_simulation(signals, prices, limits)
+        vector = run_paper_simulation(signals, prices, limits, engine="vector")
+
+        assert vector.trades == loop.trades
+        assert vector.end_equity == pytest.approx(loop.end_equity, rel=1e-12)
+        assert vector.max_drawdown == pytest.approx(loop.max_drawdown, rel=1e-12, abs=1e-15)
+        assert vector.cagr == pytest.approx(loop.cagr, rel=1e-12)
+
+
+def test_paper_grid_matches_single_runs() -> None:
+    signal_rows = [
+        SignalRow(signal_date=date(2025, 1, 2), symbol="AAPL", score=0.9),
+        SignalRow(signal_date=date(2025, 1, 2), symbol="MSFT", score=0.7),
+        SignalRow(signal_date=date(2025, 1, 3), symbol="AAPL", score=0.2),
+        SignalRow(signal_date=date(2025, 1, 3), symbol="MSFT", score=0.8),
+    ]
+    prices = pd.DataFrame(
+        [
+            {"date": "2025-01-02", "symbol": "AAPL", "close": 100.0},
+            {"date": "2025-01-02", "symbol": "MSFT", "close": 200.0},
+            {"date": "2025-01-03", "symbol": "AAPL", "close": 99.0},
+            {"date": "2025-01-03", "symbol": "MSFT", "close": 202.0},
+            {"date": "2025-01-06", "symbol": "AAPL", "close": 98.0},
+            {"date": "2025-01-06", "symbol": "MSFT", "close": 210.0},
+        ]
+    )
+    limits_list = [
+        RiskLimits(max_positions=positions, min_score=-1.0, max_weight_per_symbol=1.0, max_daily_turnover=turnover)
+        for positions in (1, 2)
+        for turnover in (0.0, 2.0)
+    ]
+
+    serial = run_paper_simulation_grid(signal_rows, prices, limits_list, max_workers=1)
+    pooled = run_paper_simulation_grid(signal_rows, prices, limits_list, max_workers=2)
+
+    assert len(serial) == len(limits_list)
+    pd.testing.assert_frame_equal(serial, pooled)
+    for limits, row in zip(limits_list, serial.itertuples()):
+        single = run_paper_simulation(signal_rows, prices, limits)
+        assert row.trades == single.trades
+        assert row.end_equity == pytest.approx(single.end_equity)
+
+
+def test_paper_simulator_resumes_from_checkpoint(tmp_path: Path) -> None:
+    signal_rows = [
+        SignalRow(signal_date=date(2025, 1, day), symbol=symbol, score=score)
+        for day, scores in ((2, (0.9, 0.7)), (3, (0.2, 0.8)), (6, (0.6, 0.1)), (7, (0.5, 0.4)))
+        for symbol, score in zip(("AAPL", "MSFT"), scores)
+    ]
+    prices = pd.DataFrame(
+        [
+            {"date": f"2025-01-{day:02d}", "symbol": symbol, "close": close}
+            for day, closes in ((2, (100.0, 200.0)), (3, (99.0, 202.0)), (6, (98.0, 210.0)), (7, (103.0, 205.0)))
+            for symbol, close in zip(("AAPL", "MSFT"), closes)
+        ]
+    )
+    limits = RiskLimits(max_positions=1, min_score=-1.0, max_weight_per_symbol=1.0, max_daily_turnover=2.0)
+    checkpoint = tmp_path / "paper_state.json"
+
+    first = PaperSimulator(limits).replay(signal_rows, PriceMatrix.from_frame(prices[prices["date"] <= "2025-01-03"]))
+    first.save_checkpoint(checkpoint)
+    resumed = PaperSimulator.load_checkpoint(checkpoint, limits).replay(signal_rows, PriceMatrix.from_frame(prices))
+
+    assert resumed.last_day == "2025-01-07"
+    assert resumed.result() == run_paper_simulation(signal_rows, prices, limits)
+    with pytest.raises(ValueError):
+        PaperSimulator.load_checkpoint(checkpoint, RiskLimits(max_positions=2))
+
+
+def test_paper_simulation_evaluates_signal_sets_together(random_market) -> None:
+    _, prices = random_market(seed=11, days=40, start="2024-03-01")
+    signal_sets = {
+        f"model_{model}": random_market(seed=12 + model, days=40, start="2024-03-01")[0] for model in range(3)
+    }
+    limits = RiskLimits(max_positions=3, min_score=0.0, max_weight_per_symbol=0.3, max_daily_turnover=1.0)
+
+    results = run_paper_simulation(signal_sets, PriceMatrix.from_frame(prices), limits)
+
+    assert list(results) == list(signal_sets)
+    for name, signals in signal_sets.items():
+        single = run_paper_simulation(signals, prices, limits)
+        assert results[name].trades == single.trades
+        assert results[name].end_equity == pytest.approx(single.end_equity, rel=1e-12)
+        assert results[name].max_drawdown == pytest.approx(single.max_drawdown, rel=1e-12, abs=1e-15)
+
+
+def test_risk_weighting_matches_across_engines_and_checkpoints(tmp_path: Path, random_market) -> None:
+    signals, prices = random_market(seed=13)
+    prices = prices.drop(index=[7, 30])
+    days = prices["date"].unique()
+
+    for weighting in ("inverse_vol", "risk_parity", "mean_variance"):
+        limits = RiskLimits(max_positions=4, max_weight_per_symbol=0.4, max_daily_turnover=1.5, weighting=weighting)
+        loop = run_paper_simulation(signals, prices, limits)
+        vector = run_paper_simulation(signals, prices, limits, engine="vector")
+        equal = run_paper_simulation(signals, prices, RiskLimits(max_positions=4, max_weight_per_symbol=0.4))
+
+        assert vector.trades == loop.trades
+        assert vector.end_equity == pytest.approx(loop.end_equity, rel=1e-12)
+        assert loop.end_equity != pytest.approx(equal.end_equity, rel=1e-9)
+
+    checkpoint = tmp_path / "paper_state.json"
+    first = PaperSimulator(limits).replay(signals, PriceMatrix.from_frame(prices[prices["date"] <= days[30]]))
+    first.save_checkpoint(checkpoint)
+    resumed = PaperSimulator.load_checkpoint(checkpoint, limits).replay(signals, PriceMatrix.from_frame(prices))
+
+    assert resumed.result().end_equity == pytest.approx(loop.end_equity, rel=1e-12)
+    saved = json.loads(checkpoint.read_text(encoding="utf-8"))["covariance"]
+    assert "matrix" not in saved and checkpoint_arrays_path(checkpoint).exists()
+    PaperSimulator(limits).replay(signals, PriceMatrix.from_frame(prices)).save_checkpoint(tmp_path / "other.json")
+    checkpoint_arrays_path(tmp_path / "other.json").replace(checkpoint_arrays_path(checkpoint))
+    with pytest.raises(ValueError, match="does not match"):
+        PaperSimulator.load_checkpoint(checkpoint, limits)
+
+
+def test_target_schedule_matches_paper_holdings(tmp_path: Path, random_market) -> None:
+    signals, prices = random_market(seed=21, days=40, symbols=12)
+    days = prices["date"].unique()
+    limits = RiskLimits(max_positions=4, min_score=1.0, max_daily_turnover=1.5, weighting="inverse_vol")
+
+    schedule = build_target_schedule(signals, prices, limits)
+    path = tmp_path / "target_schedule.csv"
+    save_target_schedule(path, schedule)
+    loaded = pd.read_csv(path, keep_default_na=False)
+
+    assert loaded["date"].drop_duplicates().tolist() == list(days)
+    assert (loaded["symbol"] == "").any()
+    for cut in (5, 17, 40):
+        history = PriceMatrix.from_frame(prices[prices["date"] <= days[cut - 1]])
+        simulator = PaperSimulator(limits).replay(signals, history)
+        expected = {SYMBOLS[symbol_id]: weight for symbol_id, weight in simulator.holdings.items()}
+        day = loaded[(loaded["date"] == days[cut - 1]) & (loaded["symbol"] != "")]
+        assert dict(zip(day["symbol"], day["weight"])) == pytest.approx(expected, rel=1e-12)
+
+
+def test_constraint_data_masks_and_clips_weights() -> None:
+    data = ConstraintData(
+        sector=np.array([0, 0, 1, -1]),
+        sectors=["TECH", "UTIL"],
+        beta=np.array([1.2, 0.4, np.nan, 1.0]),
+    )
+    columns = np.array([0, 1, 2, 3, -1])
+    limits = RiskLimits(
+        min_symbol_beta=0.5, max_symbol_beta=1.5, max_sector_weight=0.3, max_adv_fraction=0.1, capital=1000.0
+    )
+
+    assert data.eligible(columns, limits).tolist() == [True, False, False, True, False]
+    weights = np.array([[0.25, 0.25, 0.2, 0.2, 0.1]])
+    adv = np.array([[np.nan, np.nan, 1000.0, np.nan]])
+    clipped = data.clip(weights, columns, adv, limits)
+    assert clipped[0] == pytest.approx([0.15, 0.15, 0.1, 0.2, 0.1])
+
+    capped = replace(data, sector_caps=np.array([np.nan, 0.05]))
+    assert capped.applies(RiskLimits())
+    clipped = capped.clip(weights, columns, None, RiskLimits(max_sector_weight=0.3))
+    assert clipped[0] == pytest.approx([0.15, 0.15, 0.05, 0.2, 0.1])
+
+    beta_limits = RiskLimits(max_portfolio_beta=0.5)
+    assert data.eligible(columns, beta_limits).tolist() == [True, True, False, True, False]
+    rows = np.array([[0.25, 0.25, 0.2, 0.2, 0.1], [0.1, 0.1, 0.0, 0.1, 0.0]])
+    clipped = data.clip(rows, columns, None, beta_limits)
+    assert clipped[0] == pytest.approx(rows[0] * 0.5 / 0.6)
+    assert clipped[1] == pytest.approx(rows[1])
+
+
+def test_constraints_match_across_engines(random_market) -> None:
+    signals, prices = random_market(seed=17, days=50, symbols=16, volume=True)
+    symbols = prices["symbol"].unique().tolist()
+    days = prices["date"].unique()
+    matrix = PriceMatrix.from_frame(prices)
+    constraints = build_constraint_data(
+        matrix,
+        pd.DataFrame({"symbol": symbols, "sector": list("ABCD") * 4, "beta": np.linspace(0.5, 1.5, len(symbols))}),
+        sector_caps={"A": 0.1, "C": 0.2},
+    )
+    assert constraints.sector_caps.tolist()[::2] == [0.1, 0.2]
+    assert np.isnan(constraints.sector_caps[1::2]).all()
+    dollars = prices["close"] * prices["volume"]
+    last_days = prices["date"].isin(days[-20:])
+    expected_adv = dollars[last_days & (prices["symbol"] == "S03")].mean()
+    assert constraints.adv[-1, matrix.column_of[matrix.ids[3]]] == pytest.approx(expected_adv)
+
+    limits = RiskLimits(
+        max_positions=6,
+        max_weight_per_symbol=0.3,
+        max_daily_turnover=1.5,
+        max_sector_weight=0.3,
+        max_adv_fraction=0.05,
+        capital=1e5,
+        min_symbol_beta=0.7,
+        max_portfolio_beta=0.6,
+    )
+    loop = run_paper_simulation(signals, matrix, limits, constraints=constraints)
+    vector = run_paper_simulation(signals, matrix, limits, engine="vector", constraints=constraints)
+
+    assert vector.trades == loop.trades
+    assert vector.end_equity == pytest.approx(loop.end_equity, rel=1e-12)
+    unbounded_limits = replace(limits, max_portfolio_beta=float("inf"))
+    unbounded = run_paper_simulation(signals, matrix, unbounded_limits, constraints=constraints)
+    uncapped = run_paper_simulation(signals, matrix, limits, constraints=replace(constraints, sector_caps=None))
+    assert unbounded.end_equity != pytest.approx(loop.end_equity, rel=1e-6)
+    assert uncapped.end_equity != pytest.approx(loop.end_equity, rel=1e-6)
+    with pytest.raises(ValueError):
+        run_paper_simulation(signals, matrix, limits)
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+PACKAGE_ROOT = PROJECT_ROOT / "src"
+if str(PACKAGE_ROOT) not in sys.path:
+    sys.path.insert(0, str(PACKAGE_ROOT))
+
+from neon_alpha.paper import run_paper_simulation  # noqa: E402
+from neon_alpha.risk import RiskLimits  # noqa: E402
+from neon_alpha.robust import block_bootstrap_returns, path_metrics, robust_quantiles, run_robustness  # noqa: E402
+
+
+def test_path_metrics_match_paper_result_definitions(random_market) -> None:
+    signals, prices = random_market(seed=3, symbols=8)
+    limits = RiskLimits(max_positions=3, min_score=-1.0, max_weight_per_symbol=0.3, max_daily_turnover=1.0)
+    base = run_paper_simulation(signals, prices, limits)
+
+    # 블록이 전체 길이면 경로는 원래 수익률의 회전이라 총수익률은 같고 낙폭만 달라진다.
+    table = run_robustness(signals, prices, limits, n_paths=50, block_size=1000, max_workers=1)
+    assert np.allclose(table["total_return"], base.total_return)
+    assert np.allclose(table["cagr"], base.cagr)
+
+    daily = np.array([0.01, -0.02, 0.03])
+    metrics = path_metrics(daily[None, :])
+    equity = float(np.prod(1.0 + daily))
+    assert metrics["total_return"][0] == pytest.approx(equity - 1.0)
+    assert metrics["cagr"][0] == pytest.approx(equity ** (252 / 3) - 1.0)
+    assert metrics["max_drawdown"][0] == pytest.approx(0.02)
+
+    paths = block_bootstrap_returns(daily, 4, 2, np.random.default_rng(0))
+    assert paths.shape == (4, 3)
+    assert np.isin(paths, daily).all()
+
+
+@pytest.mark.parametrize("method", ["bootstrap", "shuffle"])
+def test_robustness_is_deterministic_across_workers(method: str, random_market) -> None:
+    signals, prices = random_market(seed=5, symbols=8)
+    limits = RiskLimits(max_positions=2, min_score=-1.0, max_weight_per_symbol=0.5, max_daily_turnover=1.0)
+
+    serial = run_robustness(signals, prices, limits, method=method, n_paths=24, batch_size=5, seed=11, max_workers=1)
+    pooled = run_robustness(signals, prices, limits, method=method, n_paths=24, batch_size=5, seed=11, max_workers=2)
+
+    pd.testing.assert_frame_equal(serial, pooled)
+    assert len(serial) == 24
+    assert serial["total_return"].nunique() > 1
+    summary = robust_quantiles(serial)
+    assert list(summary.index) == ["total_return", "cagr", "max_drawdown"]
+    assert (summary["p5"] <= summary["p95"]).all()
+    with pytest.raises(ValueError):
+        run_robustness(signals, prices, limits, method="unknown")
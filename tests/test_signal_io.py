@@ -4,13 +4,31 @@ from datetime import date
 from pathlib import Path
 import sys
 
+import numpy as np
+import pandas as pd
+import pytest
+
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 PACKAGE_ROOT = PROJECT_ROOT / "src"
 if str(PACKAGE_ROOT) not in sys.path:
     sys.path.insert(0, str(PACKAGE_ROOT))
 
-from neon_alpha.signal_io import SignalRow, index_signals_by_day, read_signals, write_signals  # noqa: E402
+from neon_alpha.signal_io import (  # noqa: E402
+    BinarySignalFile,
+    SignalFrame,
+    SignalRow,
+    build_signal_index,
+    index_signals_by_day,
+    iter_signal_days,
+    latest_signal_date,
+    load_signal_index,
+    read_signal_frame,
+    read_signal_sources,
+    read_indexed_csv,
+    read_signals,
+    write_signals,
+)
 
 
 def test_write_and_read_signals_round_trip(tmp_path: Path) -> None:
@@ -38,3 +56,224 @@ def test_index_signals_by_day() -> None:
     assert set(indexed.keys()) == {"2025-01-02", "2025-01-03"}
     assert indexed["2025-01-02"]["AAPL"] == 0.92
     assert indexed["2025-01-03"]["AAPL"] == 0.50
+
+
+def test_read_signals_applies_date_and_symbol_filters(tmp_path: Path) -> None:
+    rows = [
+        SignalRow(signal_date=date(2025, 1, 2), symbol="AAPL", score=0.92),
+        SignalRow(signal_date=date(2025, 1, 2), symbol="MSFT", score=0.77),
+        SignalRow(signal_date=date(2025, 1, 3), symbol="AAPL", score=0.50),
+        SignalRow(signal_date=date(2025, 1, 6), symbol="AAPL", score=0.40),
+    ]
+    path = tmp_path / "signals.csv"
+    write_signals(path, rows)
+
+    loaded = read_signals(path, start=date(2025, 1, 3), end=date(2025, 1, 6), symbols=["aapl"])
+
+    assert loaded == rows[2:]
+
+
+def test_parquet_round_trip_with_pushdown(tmp_path: Path) -> None:
+    pytest.importorskip("pyarrow")
+    rows = [
+        SignalRow(signal_date=date(2025, 1, 2), symbol="AAPL", score=0.92),
+        SignalRow(signal_date=date(2025, 1, 2), symbol="MSFT", score=0.77),
+        SignalRow(signal_date=date(2025, 1, 3), symbol="AAPL", score=0.50),
+    ]
+    path = tmp_path / "signals.parquet"
+
+    write_signals(path, rows)
+
+    assert read_signals(path) == rows
+    assert read_signals(path, start=date(2025, 1, 3)) == rows[2:]
+    assert read_signals(path, symbols={"MSFT"}) == [rows[1]]
+
+
+@pytest.mark.parametrize("date_kind", ["string", "timestamp", "timestamp_tz"])
+def test_parquet_written_by_pandas_reads_with_filters(tmp_path: Path, date_kind: str) -> None:
+    pytest.importorskip("pyarrow")
+    dates = pd.Series(["2025-01-02", "2025-01-02", "2025-01-03", "2025-01-06"])
+    if date_kind != "string":
+        dates = pd.to_datetime(dates)
+    if date_kind == "timestamp_tz":
+        dates = dates.dt.tz_localize("US/Eastern")
+    path = tmp_path / "signals.parquet"
+    pd.DataFrame({"date": dates, "symbol": ["AAPL", "MSFT", "AAPL", "MSFT"], "score": [0.9, 0.7, 0.5, 0.3]}).to_parquet(
+        path, row_group_size=2
+    )
+
+    assert len(read_signals(path)) == 4
+    assert read_signals(path, start=date(2025, 1, 3), end=date(2025, 1, 3)) == [
+        SignalRow(signal_date=date(2025, 1, 3), symbol="AAPL", score=0.5)
+    ]
+    assert [day.day_key for day in iter_signal_days(path, start=date(2025, 1, 3), chunk_rows=1)] == [
+        "2025-01-03",
+        "2025-01-06",
+    ]
+    assert latest_signal_date(path) == date(2025, 1, 6)
+
+
+def test_signal_frame_round_trips_rows_and_shares_slices() -> None:
+    rows = [
+        SignalRow(signal_date=date(2025, 1, 3), symbol="AAPL", score=0.50),
+        SignalRow(signal_date=date(2025, 1, 2), symbol="AAPL", score=0.92),
+        SignalRow(signal_date=date(2025, 1, 2), symbol="MSFT", score=0.77),
+    ]
+
+    frame = SignalFrame.from_rows(rows)
+    head = frame[:2]
+
+    assert frame.to_rows() == rows
+    assert frame.days.dtype.name == "int32" and frame.codes.dtype.name == "int32"
+    assert frame.symbol_values().tolist() == ["AAPL", "AAPL", "MSFT"]
+    assert head.days.base is frame.days
+    assert list(frame.date_strings()) == ["2025-01-03", "2025-01-02", "2025-01-02"]
+    assert index_signals_by_day(frame) == index_signals_by_day(rows)
+
+
+def test_read_signal_frame_normalizes_symbols(tmp_path: Path) -> None:
+    path = tmp_path / "signals.csv"
+    path.write_text("date,symbol,score\n2025-01-02, aapl ,0.5\n2025-01-02,AAPL,0.6\n2025-01-03,msft,0.1\n")
+
+    frame = read_signal_frame(path)
+
+    assert frame.symbol_values().tolist() == ["AAPL", "AAPL", "MSFT"]
+    assert frame.codes[0] == frame.codes[1] != frame.codes[2]
+    assert frame.days.tolist() == [date(2025, 1, 2).toordinal()] * 2 + [date(2025, 1, 3).toordinal()]
+
+
+@pytest.mark.parametrize("value", ["today", "2025-01", "2025-01-02T10:00", ""])
+def test_signal_frame_rejects_malformed_dates(value: str) -> None:
+    with pytest.raises(ValueError, match="must use"):
+        SignalFrame.from_columns(["2025-01-02", value], ["AAPL", "MSFT"], [0.1, 0.2])
+
+
+def test_signal_frame_accepts_unpadded_dates() -> None:
+    frame = SignalFrame.from_columns(["2025-1-2"], ["AAPL"], [0.1])
+
+    assert frame.days.tolist() == [date(2025, 1, 2).toordinal()]
+
+
+def test_iter_signal_days_streams_across_chunks(tmp_path: Path) -> None:
+    rows = [
+        SignalRow(signal_date=date(2025, 1, 2), symbol="AAPL", score=0.9),
+        SignalRow(signal_date=date(2025, 1, 2), symbol="MSFT", score=0.7),
+        SignalRow(signal_date=date(2025, 1, 2), symbol="NVDA", score=0.5),
+        SignalRow(signal_date=date(2025, 1, 3), symbol="AAPL", score=0.2),
+        SignalRow(signal_date=date(2025, 1, 6), symbol="MSFT", score=0.4),
+    ]
+    path = tmp_path / "signals.csv"
+    write_signals(path, rows)
+
+    days = list(iter_signal_days(path, chunk_rows=2))
+
+    assert [day.day_key for day in days] == ["2025-01-02", "2025-01-03", "2025-01-06"]
+    assert days[0].to_dict() == {"AAPL": 0.9, "MSFT": 0.7, "NVDA": 0.5}
+    assert [day.day_key for day in iter_signal_days(path, chunk_rows=2, start=date(2025, 1, 3))] == [
+        "2025-01-03",
+        "2025-01-06",
+    ]
+
+
+def test_iter_signal_days_rejects_unsorted_files(tmp_path: Path) -> None:
+    path = tmp_path / "signals.csv"
+    path.write_text("date,symbol,score\n2025-01-03,AAPL,0.5\n2025-01-02,AAPL,0.6\n")
+
+    with pytest.raises(ValueError):
+        list(iter_signal_days(path, chunk_rows=1))
+
+
+def test_binary_signal_file_memmaps_day_slices(tmp_path: Path) -> None:
+    rows = [
+        SignalRow(signal_date=date(2025, 1, 3), symbol="AAPL", score=0.50),
+        SignalRow(signal_date=date(2025, 1, 2), symbol="AAPL", score=0.92),
+        SignalRow(signal_date=date(2025, 1, 2), symbol="MSFT", score=0.77),
+    ]
+    path = tmp_path / "signals.nsig"
+
+    write_signals(path, rows)
+    binary = BinarySignalFile(path)
+    day = binary.day(date(2025, 1, 2))
+
+    assert binary.day_ordinals.tolist() == [date(2025, 1, 2).toordinal(), date(2025, 1, 3).toordinal()]
+    assert isinstance(day.scores.base, np.memmap) or isinstance(day.scores, np.memmap)
+    assert day.to_rows() == rows[1:]
+    assert len(binary.day(date(2025, 1, 6))) == 0
+    assert read_signals(path, start=date(2025, 1, 3)) == rows[:1]
+    assert [item.day_key for item in iter_signal_days(path)] == ["2025-01-02", "2025-01-03"]
+
+
+def test_sidecar_index_seeks_to_date_range(tmp_path: Path) -> None:
+    rows = [
+        SignalRow(signal_date=date(2025, 1, 3), symbol="AAPL", score=0.50),
+        SignalRow(signal_date=date(2025, 1, 2), symbol="AAPL", score=0.92),
+        SignalRow(signal_date=date(2025, 1, 2), symbol="MSFT", score=0.77),
+        SignalRow(signal_date=date(2025, 1, 6), symbol="MSFT", score=0.10),
+    ]
+    path = tmp_path / "signals.csv"
+
+    write_signals(path, rows, index=True)
+    index = load_signal_index(path)
+
+    assert index is not None
+    assert index.days == ["2025-01-02", "2025-01-03", "2025-01-06"]
+    assert index.rows == [2, 1, 1]
+    assert latest_signal_date(path) == date(2025, 1, 6)
+    assert read_signals(path, start=date(2025, 1, 3), end=date(2025, 1, 3)) == rows[:1]
+    assert [day.day_key for day in iter_signal_days(path, start=date(2025, 1, 6))] == ["2025-01-06"]
+
+    path.write_text(path.read_text() + "2025-01-07,AAPL,0.3\n")
+    assert load_signal_index(path) is None
+
+
+def test_sidecar_index_parses_quoted_fields_and_rejects_bad_dates(tmp_path: Path) -> None:
+    path = tmp_path / "signals.csv"
+    path.write_text('name,date,score\n"Apple, Inc.",2025-01-02,0.5\nMSFT,2025-01-02,0.4\n"A,B",2025-01-03,0.1\n')
+
+    index = build_signal_index(path)
+
+    assert index.days == ["2025-01-02", "2025-01-03"]
+    assert index.rows == [2, 1]
+    assert read_indexed_csv(path, start=date(2025, 1, 3), index=index)["name"].tolist() == ["A,B"]
+
+    path.write_text("date,symbol,score\n2024-01-02 00:00:00,AAPL,0.5\n")
+    with pytest.raises(ValueError, match="must use"):
+        build_signal_index(path)
+    assert load_signal_index(path) is None
+
+
+def test_read_signal_sources_merges_and_reports_duplicates(tmp_path: Path) -> None:
+    (tmp_path / "momentum_signals.csv").write_text(
+        "date,symbol,score\n2025-01-02,AAPL,0.9\n2025-01-02,AAPL,0.8\n2025-01-02,MSFT,0.5\n"
+    )
+    (tmp_path / "alpha158_signals.csv").write_text(
+        "date,symbol,score\n2025-01-02,MSFT,0.1\n2025-01-02,MSFT,0.1\n2025-01-03,NVDA,0.3\n"
+    )
+
+    merged = read_signal_sources(str(tmp_path / "*_signals.csv"), max_workers=2)
+    table = merged.to_dataframe().set_index(["date", "symbol"])
+
+    assert merged.sources == ("alpha158", "momentum")
+    assert merged.duplicates == {"alpha158": 1, "momentum": 1}
+    assert merged.conflicts == {"alpha158": 0, "momentum": 1}
+    assert len(merged) == 3
+    assert table.loc[("2025-01-02", "AAPL"), "momentum"] == 0.8
+    assert table.loc[("2025-01-02", "MSFT"), "score"] == pytest.approx(0.3)
+    assert np.isnan(table.loc[("2025-01-03", "NVDA"), "momentum"])
+
+
+@pytest.mark.parametrize("suffix", [".gz", ".bz2", ".xz"])
+def test_compressed_csv_round_trip(tmp_path: Path, suffix: str) -> None:
+    path = tmp_path / f"signals.csv{suffix}"
+    rows = [
+        SignalRow(signal_date=date(2025, 1, 2), symbol="AAPL", score=0.5),
+        SignalRow(signal_date=date(2025, 1, 3), symbol="MSFT", score=0.25),
+    ]
+    write_signals(path, SignalFrame.from_rows(rows))
+
+    assert path.read_bytes()[:4] != b"date"
+    assert read_signals(path) == rows
+    assert [day.day_key for day in iter_signal_days(path, chunk_rows=1)] == ["2025-01-02", "2025-01-03"]
+    assert latest_signal_date(path) == date(2025, 1, 3)
+    with pytest.raises(ValueError):
+        write_signals(path, rows, index=True)
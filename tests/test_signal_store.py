@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from datetime import date
+from pathlib import Path
+import sys
+
+import pytest
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+PACKAGE_ROOT = PROJECT_ROOT / "src"
+if str(PACKAGE_ROOT) not in sys.path:
+    sys.path.insert(0, str(PACKAGE_ROOT))
+
+from neon_alpha.signal_io import SignalRow, iter_signal_days, latest_signal_date, read_signals  # noqa: E402
+from neon_alpha.signal_store import MANIFEST_NAME, SignalStore  # noqa: E402
+
+
+def test_store_appends_partitions_and_reads_ranges(tmp_path: Path) -> None:
+    root = tmp_path / "signals" / "momentum"
+    history = [
+        SignalRow(signal_date=date(2025, 1, 2), symbol="AAPL", score=0.9),
+        SignalRow(signal_date=date(2025, 1, 2), symbol="MSFT", score=0.7),
+        SignalRow(signal_date=date(2025, 1, 3), symbol="AAPL", score=0.2),
+    ]
+    new_day = [SignalRow(signal_date=date(2025, 1, 6), symbol="MSFT", score=0.4)]
+
+    store = SignalStore(root)
+    store.append(history)
+    written = SignalStore(root).append(new_day)
+
+    assert written == ["2025-01-06"]
+    assert (root / MANIFEST_NAME).exists()
+    assert [partition.day_key for partition in SignalStore(root).partitions()] == [
+        "2025-01-02",
+        "2025-01-03",
+        "2025-01-06",
+    ]
+    assert read_signals(root) == history + new_day
+    assert read_signals(root, start=date(2025, 1, 3)) == history[2:] + new_day
+    assert [day.day_key for day in iter_signal_days(root, end=date(2025, 1, 3))] == ["2025-01-02", "2025-01-03"]
+    assert latest_signal_date(root) == date(2025, 1, 6)
+
+
+def test_store_requires_overwrite_to_replace_a_date(tmp_path: Path) -> None:
+    store = SignalStore(tmp_path / "store")
+    store.append([SignalRow(signal_date=date(2025, 1, 2), symbol="AAPL", score=0.9)])
+    replacement = [SignalRow(signal_date=date(2025, 1, 2), symbol="AAPL", score=0.1)]
+
+    with pytest.raises(ValueError):
+        store.append(replacement)
+    store.append(replacement, overwrite=True)
+
+    assert read_signals(tmp_path / "store") == replacement
+    assert len(list((tmp_path / "store" / "date=2025-01-02").iterdir())) == 1
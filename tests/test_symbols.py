@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+PACKAGE_ROOT = PROJECT_ROOT / "src"
+if str(PACKAGE_ROOT) not in sys.path:
+    sys.path.insert(0, str(PACKAGE_ROOT))
+
+from neon_alpha.signal_io import SignalFrame  # noqa: E402
+from neon_alpha.symbols import SYMBOLS, SymbolTable  # noqa: E402
+
+
+def test_symbol_table_assigns_stable_dense_ids() -> None:
+    table = SymbolTable(["AAPL", "MSFT"])
+
+    ids = table.intern_many(["NVDA", "AAPL", "NVDA", "MSFT"])
+
+    assert ids.tolist() == [2, 0, 2, 1]
+    assert table.intern("AAPL") == 0
+    assert table.id_of("TSLA") == -1
+    assert table.names(ids).tolist() == ["NVDA", "AAPL", "NVDA", "MSFT"]
+
+
+def test_signal_frames_share_the_process_wide_table() -> None:
+    left = SignalFrame.from_columns(["2025-01-02"], ["aapl"], [0.1])
+    right = SignalFrame.from_columns(["2025-01-03", "2025-01-03"], ["MSFT", "AAPL"], [0.2, 0.3])
+
+    assert left.symbols is SYMBOLS and right.symbols is SYMBOLS
+    assert left.codes[0] == right.codes[1] == SYMBOLS.id_of("AAPL")
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from datetime import date
+from pathlib import Path
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+PACKAGE_ROOT = PROJECT_ROOT / "src"
+if str(PACKAGE_ROOT) not in sys.path:
+    sys.path.insert(0, str(PACKAGE_ROOT))
+
+from neon_alpha.paper import DayScores, PriceMatrix  # noqa: E402
+from neon_alpha.signal_io import SignalFrame  # noqa: E402
+from neon_alpha.trading_calendar import TradingCalendar  # noqa: E402
+
+
+def test_trading_calendar_lookups() -> None:
+    calendar = TradingCalendar.from_dates(["2025-01-06", "2025-01-02", "2025-01-03", "2025-01-02"])
+    ordinals = np.asarray([date(2025, 1, day).toordinal() for day in (1, 2, 4, 6, 7)])
+
+    assert calendar.labels() == ["2025-01-02", "2025-01-03", "2025-01-06"]
+    assert calendar.index_of(ordinals).tolist() == [-1, 0, -1, 2, -1]
+    assert calendar.next_index(ordinals).tolist() == [0, 0, 2, 2, 3]
+    assert calendar.previous_index(ordinals).tolist() == [-1, 0, 1, 2, 2]
+    assert calendar.next_day(date(2025, 1, 3)) == date(2025, 1, 6)
+    assert calendar.previous_day(date(2025, 1, 3)) == date(2025, 1, 2)
+    assert calendar.previous_day(date(2025, 1, 2)) is None
+    assert calendar.next_day(date(2025, 1, 6), inclusive=True) == date(2025, 1, 6)
+
+
+def test_price_matrix_and_day_scores_align_on_calendar() -> None:
+    prices = pd.DataFrame(
+        {
+            "date": pd.to_datetime(["2025-01-03", "2025-01-02", "2025-01-02", "2025-01-03"]),
+            "symbol": ["MSFT", "MSFT", "AAPL", "AAPL"],
+            "close": [202.0, 200.0, 100.0, 101.0],
+        }
+    )
+    matrix = PriceMatrix.from_frame(prices)
+
+    assert matrix.days == ["2025-01-02", "2025-01-03"]
+    assert matrix.symbols == ["AAPL", "MSFT"]
+    np.testing.assert_array_equal(matrix.close, [[100.0, 200.0], [101.0, 202.0]])
+    with pytest.raises(ValueError):
+        PriceMatrix.from_frame(pd.concat([prices, prices.iloc[:1]]))
+
+    signals = SignalFrame.from_columns(
+        ["2025-01-03", "2025-01-02", "2025-01-04", "2025-01-02", "2025-01-02"],
+        ["AAPL", "MSFT", "AAPL", "AAPL", "MSFT"],
+        [0.3, 0.1, 0.9, 0.2, 0.4],
+    )
+    day_scores = DayScores.build(signals, matrix.calendar)
+
+    # 거래일이 아닌 날(1/4)은 버리고, 중복 종목은 처음 나온 순서에 마지막 점수.
+    assert list(day_scores.scores_for(0).values()) == [0.4, 0.2]
+    assert list(day_scores.scores_for(1).values()) == [0.3]
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+from datetime import date, timedelta
+from pathlib import Path
+import sys
+
+import pytest
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+PACKAGE_ROOT = PROJECT_ROOT / "src"
+if str(PACKAGE_ROOT) not in sys.path:
+    sys.path.insert(0, str(PACKAGE_ROOT))
+
+from neon_alpha import validation  # noqa: E402
+from neon_alpha.signal_io import SignalRow, write_signals  # noqa: E402
+from neon_alpha.validation import validate_signal_file  # noqa: E402
+
+
+def _write_csv(path: Path, lines: list[str]) -> Path:
+    path.write_text("date,symbol,score\n" + "\n".join(lines) + "\n", encoding="utf-8")
+    return path
+
+
+def test_validate_reports_duplicates_non_finite_and_order(tmp_path: Path) -> None:
+    path = _write_csv(
+        tmp_path / "signals.csv",
+        [
+            "2025-01-02,AAPL,0.5",
+            "2025-01-02,aapl,0.6",
+            "2025-01-03,MSFT,nan",
+            "2025-01-02,NVDA,0.1",
+        ],
+    )
+
+    report = validate_signal_file(path, chunk_rows=1)
+
+    assert report.rows == 4
+    assert report.dates == 3
+    assert report.symbols == 3
+    assert report.duplicates == 1
+    assert report.non_finite == 1
+    assert report.out_of_order == 1
+    assert not report.ok
+
+
+def test_validate_parallel_matches_sequential(tmp_path: Path) -> None:
+    symbols = ["AAPL", "MSFT", "NVDA", "AMZN"]
+    rows = [
+        SignalRow(signal_date=date(2025, 1, 1) + timedelta(days=day), symbol=symbol, score=day * 0.1 + index)
+        for day in range(40)
+        for index, symbol in enumerate(symbols)
+    ]
+    path = tmp_path / "signals.csv"
+    write_signals(path, rows)
+
+    sequential = validate_signal_file(path, chunk_rows=7)
+    parallel = validate_signal_file(path, chunk_rows=7, workers=3)
+
+    assert sequential.ok
+    assert sequential.rows == 160
+    assert sequential.dates == 40
+    assert sequential.min_coverage == sequential.max_coverage == 4
+    assert parallel.rows == sequential.rows
+    assert parallel.dates == sequential.dates
+    assert parallel.symbols == sequential.symbols
+    assert parallel.duplicates == 0
+    assert parallel.out_of_order == 0
+    assert parallel.score_mean == pytest.approx(sequential.score_mean)
+    assert parallel.score_std == pytest.approx(sequential.score_std)
+
+
+def test_validate_csv_range_streams_past_chunk_size(tmp_path: Path) -> None:
+    lines = [f"2025-01-{day:02d},S{index:02d},{day + index * 0.01}" for day in range(1, 29) for index in range(30)]
+    path = _write_csv(tmp_path / "signals.csv", lines)
+    header, ranges = validation._csv_byte_ranges(path, 3)
+    begin, end = ranges[1]
+    expected = path.read_bytes()[begin:end].decode("utf-8").splitlines()
+
+    with path.open("rb") as file:
+        file.seek(begin)
+        reader = validation._RangeReader(file, end)
+        pieces = iter(lambda: reader.read(7), b"")
+        assert b"".join(pieces).decode("utf-8").splitlines() == expected
+
+    state, names = validation._validate_csv_range(path, header, begin, end, chunk_rows=16)
+    state.relabel(names)
+    report = state.finish()
+
+    assert len(expected) > 16
+    assert report.rows == len(expected)
+    assert report.dates == len({line.split(",")[0] for line in expected})
+    assert report.duplicates == 0
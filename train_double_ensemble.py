@@ -12,6 +12,11 @@ warnings.filterwarnings('ignore')
 import lightgbm as lgb
 from scipy.stats import spearmanr
 
+import os
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "src"))
+from neon_alpha.signal_io import build_signal_index  # noqa: E402
+
 print("=" * 60)
 print("DoubleEnsemble Strategy (Qlib's Top Model)")
 print("=" * 60)
@@ -283,7 +288,11 @@ print(f"   Long-Short spread:      {long_short*100:.4f}%")
 
 # Save
 output_path = "/Volumes/SSD/DEV_SSD/MY/neon_alpha/data/double_ensemble_signals.csv"
-test_df[['date', 'symbol', 'pred_score', 'rank', 'signal', 'target']].to_csv(output_path, index=False)
+saved = test_df[['date', 'symbol', 'pred_score', 'rank', 'signal', 'target']].sort_values(['date', 'symbol'], kind='stable')
+saved['date'] = saved['date'].dt.strftime('%Y-%m-%d')
+saved.to_csv(output_path, index=False)
+# 날짜순 CSV 옆에 sidecar 인덱스(<csv>.idx)를 만들어 alpaca_paper_trading.py가 최신 날짜만 seek 해서 읽게 한다
+build_signal_index(output_path)
 print(f"\n💾 Signals saved to: {output_path}")
 
 print("\n" + "=" * 60)